@@ -3,6 +3,8 @@ import math
 from math import cos, pi, radians, sin
 from typing import Any, List
 
+import numpy as np
+
 
 def get_distant_point(x0: float, y0: float, d: float, theta: float) -> List[float]:
     """
@@ -50,6 +52,56 @@ def get_angle_between_points(point1: List[Any], point2: List[Any]) -> float:
     return r
 
 
+def get_distant_points(
+    x0: float, y0: float, d: np.ndarray, theta: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized version of get_distant_point
+    :param x0: start x
+    :param y0: start y
+    :param d: (N,) array of distances to the new points
+    :param theta: (N,) array of angles to the new points
+    :return: (N, 2) array of new points
+    """
+    theta_rad = pi / 2 - np.radians(theta)
+    res = np.empty((len(theta_rad), 2), dtype=np.float64)
+    res[:, 0] = x0 + d * np.cos(theta_rad)
+    res[:, 1] = y0 + d * np.sin(theta_rad)
+    return res
+
+
+def get_point_distances(points: np.ndarray, point: List[Any]) -> np.ndarray:
+    """
+    Vectorized version of get_point_distance
+    :param points: (N, dim) array of points
+    :param point: second point of all distances
+    :return: (N,) array of distances between the given points and the second point
+    """
+    point_array = np.asarray(point, dtype=np.float64)
+    dimension = min(points.shape[1], len(point_array))
+    res: np.ndarray = np.sqrt(
+        np.sum((points[:, :dimension] - point_array[:dimension]) ** 2.0, axis=1)
+    )
+    return res
+
+
+def get_angles_between_points(points: np.ndarray, point: List[Any]) -> np.ndarray:
+    """
+    Vectorized version of get_angle_between_points
+    :param points: (N, dim) array of first points
+    :param point: second point of all angles
+    :return: (N,) array of angles between the given points and the second point
+    """
+    res: np.ndarray = (
+        180.0
+        / math.pi
+        * np.arctan2(float(point[0]) - points[:, 0], float(point[1]) - points[:, 1])
+    )
+    negative = res < 0
+    res[negative] %= 360
+    return res
+
+
 def get_center(vertices: List[Any]) -> List[Any]:
     """
     Calculates the center point for the given vertices
@@ -59,6 +111,11 @@ def get_center(vertices: List[Any]) -> List[Any]:
     if len(vertices) == 0:
         raise Exception("Given vertices are empty")
 
+    if not isinstance(vertices, list):
+        # columnar representation, so use a vectorized reduction
+        mean: List[Any] = np.asarray(vertices, dtype=np.float64).mean(axis=0).tolist()
+        return mean
+
     center: List[float] = []
     cnt = 0
     for vertex in vertices:
@@ -123,6 +180,100 @@ def rotate_point(
     return [xr, yr, zr]
 
 
+def get_translation_matrix(translation: List[float]) -> np.ndarray:
+    """
+    :param translation: x, y and z offsets
+    :return: 4x4 matrix representing the translation
+    """
+    res = np.eye(4)
+    res[:3, 3] = [float(a) for a in translation[:3]]
+    return res
+
+
+def get_scaling_matrix(scaling: List[float]) -> np.ndarray:
+    """
+    :param scaling: x, y and z scale factors
+    :return: 4x4 matrix representing the scaling
+    """
+    return np.diag([float(a) for a in scaling[:3]] + [1.0])
+
+
+def get_rotation_matrix(roll: float, pitch: float, yaw: float) -> np.ndarray:
+    """
+    Creates the rotation used by rotate_point
+    :param roll: x-rotation (degrees)
+    :param pitch: y-rotation (degrees)
+    :param yaw: z-rotation (degrees)
+    :return: 4x4 matrix representing the rotation around (0, 0, 0)
+    """
+    r_roll = math.radians(roll)
+    r_pitch = math.radians(pitch)
+    r_yaw = math.radians(yaw)
+
+    cosa = math.cos(r_yaw)
+    sina = math.sin(r_yaw)
+    cosb = math.cos(r_pitch)
+    sinb = math.sin(r_pitch)
+    cosc = math.cos(r_roll)
+    sinc = math.sin(r_roll)
+
+    res = np.eye(4)
+    res[:3, :3] = [
+        [
+            cosa * cosb,
+            cosa * sinb * sinc - sina * cosc,
+            cosa * sinb * cosc + sina * sinc,
+        ],
+        [
+            sina * cosb,
+            sina * sinb * sinc + cosa * cosc,
+            sina * sinb * cosc - cosa * sinc,
+        ],
+        [-sinb, cosb * sinc, cosb * cosc],
+    ]
+    return res
+
+
+def get_affine_matrix(
+    center: List[float],
+    scaling: List[float],
+    rotation: List[float],
+    translation: List[float],
+) -> np.ndarray:
+    """
+    Composes the scaling and rotation around the given center followed by the translation to a single matrix
+    :param center: center of the scaling and rotation
+    :param scaling: x, y and z scale factors
+    :param rotation: roll, pitch and yaw (degrees)
+    :param translation: x, y and z offsets
+    :return: 4x4 matrix representing all transformations
+    """
+    center_array = np.asarray(center[:3], dtype=np.float64)
+    res: np.ndarray = (
+        get_translation_matrix(
+            (center_array + [float(a) for a in translation[:3]]).tolist()
+        )
+        @ get_rotation_matrix(
+            float(rotation[0]), float(rotation[1]), float(rotation[2])
+        )
+        @ get_scaling_matrix(scaling)
+        @ get_translation_matrix((-center_array).tolist())
+    )
+    return res
+
+
+def apply_affine_matrix(points: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """
+    Applies the given 4x4 matrix to all points
+    :param points: (N, 3) array of points
+    :param matrix: 4x4 matrix of an affine transformation
+    :return: (N, 3) array of transformed points
+    """
+    points = np.asarray(points, dtype=np.float64)
+    res: np.ndarray = points @ matrix[:3, :3].T + matrix[:3, 3]
+    return res
+
+
 def convert_obj_index(idx: int, list_input: Any) -> int:
     """
     Method for converting an obj based index to a python like index
@@ -136,7 +287,7 @@ def convert_obj_index(idx: int, list_input: Any) -> int:
     list_len: int
     if isinstance(list_input, int):
         list_len = list_input
-    elif isinstance(list_input, list):
+    elif isinstance(list_input, list) or hasattr(list_input, "__array__"):
         list_len = len(list_input)
     else:
         raise Exception(f"Not supported type {type(list_input)} of parameter l")
@@ -1,9 +1,12 @@
-import copy
-from typing import Any, List
+from typing import Any, Optional, Tuple
 
-import pyproj
+import numpy as np
 
-from geofiles.conversion.static import get_epsg_4326, get_wgs_84, update_min_max
+from geofiles.conversion.static import get_epsg_4326, get_wgs_84
+from geofiles.conversion.transformer_cache import (
+    CrsTransformerCache,
+    get_default_transformer_cache,
+)
 from geofiles.domain.geo_object_file import GeoObjectFile
 
 
@@ -12,12 +15,23 @@ class CrsConverter:
     Converter for projecting a given geo referenced object to another coordinate system
     """
 
+    def __init__(self, transformer_cache: Optional[CrsTransformerCache] = None) -> None:
+        """
+        :param transformer_cache: cache providing the pyproj transformers, if None the process-wide cache is used
+        """
+        self.transformer_cache = (
+            transformer_cache
+            if transformer_cache is not None
+            else get_default_transformer_cache()
+        )
+
     def convert(
         self,
         data: GeoObjectFile,
         target_crs: str,
         alwaysxy: bool = True,
         update_extent: bool = False,
+        inplace: bool = False,
     ) -> GeoObjectFile:
         """
         Converts the given data to another coordinate reference system
@@ -28,16 +42,50 @@ class CrsConverter:
             for geographic CRS and easting, northing for most projected CRS.
             Default is false.
         :param update_extent: If true, extent information of the converted data is determined
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
         :return:
         """
         if data.crs is None:
             raise Exception("Given file is not geo-referenced")
 
-        res = copy.deepcopy(data)
+        transformer, from_wgs84, to_wgs84 = self.get_transformer(
+            data.crs, target_crs, alwaysxy
+        )
+        res = data if inplace else data.shallow_copy()
         res.crs = target_crs
-        source = data.crs
+
+        if data.is_origin_based() and data.origin is not None:
+            res.origin = self.convert_array(
+                np.asarray([data.origin], dtype=np.float64),
+                transformer,
+                from_wgs84,
+                to_wgs84,
+            )[0].tolist()
+
+            if update_extent:
+                res.update_extent()
+        else:
+            converted = self.convert_array(
+                data.get_vertex_array(), transformer, from_wgs84, to_wgs84
+            )
+            res.set_vertex_array(converted)
+            if update_extent:
+                res.update_extent()
+        return res
+
+    def get_transformer(
+        self, source_crs: str, target_crs: str, alwaysxy: bool = True
+    ) -> Tuple[Any, bool, bool]:
+        """
+        Provides the transformer between the given coordinate systems, WGS84 is handled by EPSG:4326 with swapped axes
+        :param source_crs: source coordinate system
+        :param target_crs: target coordinate system
+        :param alwaysxy: If true, the transformer uses the traditional GIS axis order
+        :return: transformer, flag if input is wgs84 based, flag if output is wgs84 based
+        """
+        source = source_crs
         from_wgs84 = False
-        if source == get_wgs_84():
+        if source_crs == get_wgs_84():
             source = get_epsg_4326()
             from_wgs84 = True
 
@@ -46,65 +94,44 @@ class CrsConverter:
         if target_crs == get_wgs_84():
             target = get_epsg_4326()
             to_wgs84 = True
-        transformer = pyproj.Transformer.from_crs(source, target, always_xy=alwaysxy)
-
-        if data.is_origin_based() and data.origin is not None:
-            res.origin = self._convert_coordinate(
-                data.origin, transformer, from_wgs84, to_wgs84
-            )
-
-            if update_extent:
-                res.update_extent()
-        else:
-            converted = []
-            min_extent: List[float] = []
-            max_extent: List[float] = []
-            is_first = True
-            for vertex in data.vertices:
-                converted_vertex = self._convert_coordinate(
-                    vertex, transformer, from_wgs84, to_wgs84
-                )
-                if is_first:
-                    min_extent = list(converted_vertex).copy()
-                    max_extent = list(converted_vertex).copy()
-                    is_first = False
-                else:
-                    update_min_max(vertex, min_extent, max_extent)
-                converted.append(converted_vertex)
-            res.vertices = converted
-        return res
+        transformer = self.transformer_cache.get_transformer(
+            source, target, always_xy=alwaysxy
+        )
+        return transformer, from_wgs84, to_wgs84
 
     @staticmethod
-    def _convert_coordinate(
-        vertex: List[float], transformer: Any, from_wgs84: bool, to_wgs84: bool
-    ) -> List[float]:
+    def convert_array(
+        vertices: np.ndarray,
+        transformer: Any,
+        from_wgs84: bool,
+        to_wgs84: bool,
+        chunk_size: int = 1 << 20,
+    ) -> np.ndarray:
         """
-        Converts the given vertex based on the given transformer with reference if input or output system is WGS84
-        :param vertex: to be converted
+        Converts the given vertices based on the given transformer with reference if input or output system is WGS84
+        :param vertices: (N, 2) or (N, 3) array of vertices to be converted
         :param transformer: used to transform
         :param from_wgs84: is input wgs84 based?
         :param to_wgs84: is output wgs84 based?
-        :return: converted coordinate
+        :param chunk_size: number of vertices transformed with one call of the transformer
+        :return: (N, 2) or (N, 3) array of converted vertices
         """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        dimension = 3 if vertices.shape[1] > 2 else 2
         # if source is wgs we have to swap x and y to match EPSG:4326
-        if not from_wgs84:
-            x = vertex[0]
-            y = vertex[1]
-        else:
-            x = vertex[1]
-            y = vertex[0]
+        columns = [1, 0, 2] if from_wgs84 else [0, 1, 2]
+        source = vertices[:, columns[:dimension]]
 
-        transformed: List[float]
-        if len(vertex) > 2:
-            z = vertex[2]
-            transformed = transformer.transform(x, y, z)
-        else:
-            transformed = transformer.transform(x, y)
+        res = np.empty((len(vertices), dimension), dtype=np.float64)
+        for start in range(0, len(vertices), chunk_size):
+            chunk = source[start : start + chunk_size]
+            transformed = transformer.transform(
+                *[chunk[:, i] for i in range(dimension)]
+            )
+            for i in range(dimension):
+                res[start : start + chunk_size, i] = transformed[i]
 
         # if target is wgs we have to swap x and y to convert from EPSG:4326
         if to_wgs84:
-            x = transformed[0]
-            y = transformed[1]
-            z = transformed[2]
-            transformed = [y, x, z]
-        return transformed
+            res[:, [0, 1]] = res[:, [1, 0]]
+        return res
@@ -1,21 +1,51 @@
-import copy
+import itertools
+from typing import List, Optional, Tuple
 
+import numpy as np
+
+from geofiles.conversion.calculation import (
+    apply_affine_matrix,
+    get_angles_between_points,
+    get_center,
+    get_distant_points,
+    get_point_distances,
+)
 from geofiles.conversion.origin_converter import OriginConverter
 from geofiles.conversion.transformer import Transformer
+from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 
+# directions used for sampling the convex hull (one of every pair of opposite directions of a 3x3x3 grid)
+HULL_DIRECTIONS = np.asarray(
+    [
+        direction
+        for direction in itertools.product([-1, 0, 1], repeat=3)
+        if direction > (0, 0, 0)
+    ],
+    dtype=np.float64,
+)
+
 
 class ExtentCalculator:
     """
-    Class which allows to calculate the geographical extents of a GeoObjectFile
+    Class which allows to calculate the geographical extents of a GeoObjectFile.
+    Extents are determined from a small sample of hull vertices by default: affine transformations and geodesic
+    conversions are only applied to the vertices, which are extreme along the directions of a 3x3x3 grid. The
+    conversion of all vertices is only used if an exact extent is requested (or for small files, where sampling does
+    not pay off).
     """
 
+    # files with up to this number of vertices are always converted completely
+    MIN_SAMPLED_VERTICES = 4096
+
     @staticmethod
     def update_extent(
         data: GeoObjectFile,
         include_transformation: bool = False,
         geospatial_extent: bool = False,
         bearing_offset: float = 0.0,
+        inplace: bool = False,
+        exact: bool = False,
     ) -> GeoObjectFile:
         """
         Updates the min and max extent values of this geo-referenced object file, also considering transformation information and origin-based representation
@@ -23,40 +53,197 @@ class ExtentCalculator:
         :param include_transformation: If true transformation information is considered for the extent information
         :param geospatial_extent: Flag if extent should be georeferenced or contain local coordinates
         :param bearing_offset: Used for conversion (required when geospatial_extent == True or include_transformation == True)
+        :param inplace: If true, the given data is updated, else a structural copy sharing all untouched parts is returned
+        :param exact: If true, all vertices are converted, else hull samples are used. Note that local extents of the
+        hull sample are exact, while a geodesic conversion of a hull sample might be slightly smaller than the exact
+        extent.
         :returns: Updated data
         """
-        origin_converter = OriginConverter()
         origin_based = data.is_origin_based()
-        copied_data = copy.deepcopy(data)
+        res = data if inplace else data.shallow_copy()
+
+        if not include_transformation and not (origin_based and geospatial_extent):
+            # global coordinates + global extents
+            res.update_extent()
+            return res
+
+        vertices = data.get_vertex_array()
+        if exact or len(vertices) <= ExtentCalculator.MIN_SAMPLED_VERTICES:
+            return ExtentCalculator._update_exact_extent(
+                data, res, include_transformation, geospatial_extent, bearing_offset
+            )
+
+        if origin_based:
+            matrix = np.eye(4)
+            if include_transformation:
+                matrix = Transformer.get_transformation_matrix(data)
+            if not geospatial_extent:
+                # transformation + local extents, the sample contains the extreme vertices along the axes
+                sample = ExtentCalculator.get_hull_sample(vertices, matrix)
+                transformed = apply_affine_matrix(vertices[sample], matrix)
+                res.min_extent = transformed.min(axis=0).tolist()
+                res.max_extent = transformed.max(axis=0).tolist()
+                return res
+            local = apply_affine_matrix(vertices, matrix)
+            sample = ExtentCalculator._get_geodesic_sample(local, bearing_offset)
+            local = local[sample]
+            origin = data.origin
+        else:
+            # the vertices are converted with the (linear) tangent plane approximation for sampling,
+            # afterwards only the sampled vertices are converted with geodesic calculations
+            origin = get_center(vertices)
+            # the center of the origin based vertices is (approximately) the origin itself
+            matrix = Transformer.get_transformation_matrix(data, center=[0, 0, 0])
+            approximated = apply_affine_matrix(
+                OriginConverter.to_origin_array(
+                    vertices, origin, data.crs, bearing_offset, "enu"
+                ),
+                matrix,
+            )
+            sample = ExtentCalculator._get_geodesic_sample(approximated, bearing_offset)
+            local = apply_affine_matrix(
+                OriginConverter.to_origin_array(
+                    vertices[sample], origin, data.crs, bearing_offset
+                ),
+                matrix,
+            )
 
+        converted = OriginConverter.from_origin_array(
+            local, origin, data.crs, bearing_offset
+        )
+        res.min_extent = converted.min(axis=0).tolist()
+        res.max_extent = converted.max(axis=0).tolist()
+        return res
+
+    @staticmethod
+    def _update_exact_extent(
+        data: GeoObjectFile,
+        res: GeoObjectFile,
+        include_transformation: bool,
+        geospatial_extent: bool,
+        bearing_offset: float,
+    ) -> GeoObjectFile:
+        """
+        Updates the extent by converting all vertices
+        :param data: Data to be updated
+        :param res: file receiving the extent
+        :param include_transformation: If true transformation information is considered for the extent information
+        :param geospatial_extent: Flag if extent should be georeferenced or contain local coordinates
+        :param bearing_offset: Used for conversion
+        :returns: Updated data
+        """
+        origin_converter = OriginConverter()
+        origin_based = data.is_origin_based()
         if include_transformation:
             # transformation requires origin based data, so convert the data to origin based
             if not origin_based:
-                temp = origin_converter.to_origin(
-                    copied_data, bearing_offset=bearing_offset
-                )
+                temp = origin_converter.to_origin(data, bearing_offset=bearing_offset)
             else:
-                temp = copied_data
+                temp = data
 
             transformer = Transformer()
             transformed = transformer.transform(temp, True, True, True, True)
             if origin_based and not geospatial_extent:
-                copied_data.min_extent = transformed.min_extent
-                copied_data.max_extent = transformed.max_extent
-                return copied_data
+                res.min_extent = transformed.min_extent
+                res.max_extent = transformed.max_extent
+                return res
 
             origin = origin_converter.from_origin(
-                transformed, bearing_offset=bearing_offset, update_extent=True
+                transformed,
+                bearing_offset=bearing_offset,
+                update_extent=True,
+                inplace=True,
+            )
+            res.min_extent = origin.min_extent
+            res.max_extent = origin.max_extent
+            return res
+
+        # global origin + global extents
+        converted = origin_converter.from_origin(data, bearing_offset, True)
+        res.min_extent = converted.min_extent
+        res.max_extent = converted.max_extent
+        return res
+
+    @staticmethod
+    def get_affine_extent(
+        min_extent: np.ndarray, max_extent: np.ndarray, matrix: np.ndarray
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Determines the extent of a bounding box after an affine transformation based on its corners.
+        The result is exact for transformations mapping the axes to axes (e.g. scaling, translation),
+        else the bounding box of the transformed box is returned.
+        :param min_extent: minimal corner of the bounding box
+        :param max_extent: maximal corner of the bounding box
+        :param matrix: 4x4 matrix of the affine transformation
+        :return: min and max extent of the transformed bounding box
+        """
+        corners = np.asarray(
+            list(itertools.product(*zip(min_extent[:3], max_extent[:3]))),
+            dtype=np.float64,
+        )
+        transformed = apply_affine_matrix(corners, matrix)
+        return transformed.min(axis=0).tolist(), transformed.max(axis=0).tolist()
+
+    @staticmethod
+    def get_hull_sample(
+        vertices: np.ndarray, matrix: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Selects the vertices on the convex hull, which are extreme along the directions of a 3x3x3 grid
+        (after applying the given affine transformation)
+        :param vertices: (N, 3) array of vertices
+        :param matrix: optional 4x4 matrix of an affine transformation applied to the vertices
+        :return: ids of the sampled vertices (at most 26)
+        """
+        directions = HULL_DIRECTIONS
+        if matrix is not None:
+            # (M v) . d == v . (M^T d), so the directions are transformed instead of the vertices
+            directions = directions @ matrix[:3, :3]
+        # one contiguous row per direction, so the reductions run along memory
+        projections = directions @ vertices[:, :3].T
+        res: np.ndarray = np.unique(
+            np.concatenate(
+                [np.argmin(projections, axis=1), np.argmax(projections, axis=1)]
             )
-            data.min_extent = origin.min_extent
-            data.max_extent = origin.max_extent
-            return data
-
-        if origin_based and geospatial_extent:  # global origin + global extents
-            converted = origin_converter.from_origin(data, bearing_offset, True)
-            data.min_extent = converted.min_extent
-            data.max_extent = converted.max_extent
-        else:  # global coordinates + global extents
-            data.update_extent()
-
-        return data
+        )
+        return res
+
+    @staticmethod
+    def _get_geodesic_sample(local: np.ndarray, bearing_offset: float) -> np.ndarray:
+        """
+        Samples the vertices, which are converted for determining a geospatial extent. The geodesic conversion is
+        approximately linear in the planar east and north offsets of the vertices, so the hull is sampled there.
+        :param local: (N, 3) array of origin based vertices
+        :param bearing_offset: angle offset between the origin's coordinate system and the local vertices' coordinate system
+        :return: ids of the sampled vertices
+        """
+        planar = np.empty((len(local), 3), dtype=np.float64)
+        planar[:, :2] = get_distant_points(
+            0,
+            0,
+            get_point_distances(local, [0, 0, 0]),
+            get_angles_between_points(local, [0, 1]) + bearing_offset,
+        )
+        planar[:, 2] = local[:, 2]
+        return ExtentCalculator.get_hull_sample(planar)
+
+    @staticmethod
+    def get_object_extent(
+        data: GeoObjectFile, geoobj: GeoObject, include_transformation: bool = False
+    ) -> Tuple[List[float], List[float]]:
+        """
+        Determines the extent of the vertices referenced by the given object (see GeoObjectFile.get_object_extent).
+        :param data: file containing the referenced vertices
+        :param geoobj: object whose extent is determined
+        :param include_transformation: If true, the local transformation of the object is applied to the extent
+        :return: min and max extent (empty lists if the object has no faces)
+        """
+        min_extent, max_extent = data.get_object_extent(geoobj)
+        if not include_transformation or len(min_extent) == 0:
+            return min_extent, max_extent
+        matrix = Transformer.get_object_transformation_matrix(
+            geoobj, get_center(data.get_vertex_array())
+        )
+        return ExtentCalculator.get_affine_extent(
+            np.asarray(min_extent), np.asarray(max_extent), matrix
+        )
@@ -0,0 +1,154 @@
+from typing import List, Optional
+
+import numpy as np
+
+from geofiles.domain.face_table import FaceTable
+
+
+class FaceDeduplicator:
+    """
+    Removes faces with duplicated geometry from packed face tables.
+    Faces are compared by their vertex indices in a canonical form, which is independent of the start vertex
+    (rotation-invariant) and optionally independent of the winding order (orientation-invariant).
+    """
+
+    @staticmethod
+    def get_unique_face_ids(
+        table: FaceTable,
+        orientation_invariant: bool = False,
+        num_vertices: Optional[int] = None,
+    ) -> np.ndarray:
+        """
+        Determines the ids of the first occurrence of every distinct face
+        :param table: faces to be checked
+        :param orientation_invariant: If true, faces with reversed winding order are considered as duplicates
+        :param num_vertices: number of vertices of the referenced file (required if indices < 0 are used)
+        :return: sorted ids of the faces to be kept
+        """
+        indices = table.indices.astype(np.int64)
+        if len(indices) != 0 and np.any(indices < 0):
+            if num_vertices is None:
+                raise Exception(
+                    "Number of vertices is required for faces with negative indices"
+                )
+            indices = np.where(indices < 0, indices + num_vertices + 1, indices)
+
+        counts = table.get_counts()
+        starts = table.offsets[:-1]
+        kept: List[np.ndarray] = []
+        for size in np.unique(counts):
+            face_ids = np.flatnonzero(counts == size)
+            if size == 0:
+                kept.append(face_ids[:1])
+                continue
+            rows = indices[starts[face_ids, None] + np.arange(size)]
+            canonical = FaceDeduplicator.canonicalize(rows, orientation_invariant)
+            kept.append(face_ids[FaceDeduplicator._first_occurrences(canonical)])
+
+        if len(kept) == 0:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(kept))
+
+    @staticmethod
+    def canonicalize(
+        rows: np.ndarray, orientation_invariant: bool = False
+    ) -> np.ndarray:
+        """
+        Converts faces of the same size to a canonical form, by rotating every face so that it starts with its
+        lexicographically smallest rotation
+        :param rows: (N, k) array containing the vertex indices of N faces
+        :param orientation_invariant: If true, the smaller of the canonical forms of both winding orders is used
+        :return: (N, k) array of canonical faces
+        """
+        size = rows.shape[1]
+        start = np.argmin(rows, axis=1)
+        steps = np.arange(size)
+        canonical = np.take_along_axis(rows, (start[:, None] + steps) % size, axis=1)
+        if orientation_invariant:
+            reverse = np.take_along_axis(rows, (start[:, None] - steps) % size, axis=1)
+            canonical = FaceDeduplicator._lexicographic_min(canonical, reverse)
+
+        # faces using their minimal index multiple times can have more than one candidate rotation
+        minimum = np.take_along_axis(rows, start[:, None], axis=1)
+        ambiguous = np.flatnonzero(np.sum(rows == minimum, axis=1) > 1)
+        for face_id in ambiguous:
+            canonical[face_id] = FaceDeduplicator._canonicalize_row(
+                rows[face_id].tolist(), orientation_invariant
+            )
+        return canonical
+
+    @staticmethod
+    def _first_occurrences(rows: np.ndarray) -> np.ndarray:
+        """
+        Determines the first occurrence of every distinct row by sorting.
+        If possible, rows are packed into a single int64 key, else a lexicographic sort over all columns is used.
+        :param rows: (N, k) array of non-negative integers
+        :return: ids of the rows representing the first occurrence of a distinct row (unsorted)
+        """
+        if len(rows) == 0:
+            return np.zeros(0, dtype=np.int64)
+        size = rows.shape[1]
+        base = int(rows.max()) + 1
+        if base**size < 2**63:
+            key = rows[:, 0].copy()
+            for column in range(1, size):
+                key *= base
+                key += rows[:, column]
+            order = np.argsort(key, kind="stable")
+            sorted_key = key[order]
+            first = np.ones(len(rows), dtype=bool)
+            first[1:] = sorted_key[1:] != sorted_key[:-1]
+        else:
+            order = np.lexsort(rows.T[::-1])
+            sorted_rows = rows[order]
+            first = np.ones(len(rows), dtype=bool)
+            first[1:] = np.any(sorted_rows[1:] != sorted_rows[:-1], axis=1)
+        res: np.ndarray = order[first]
+        return res
+
+    @staticmethod
+    def _lexicographic_min(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """
+        :return: row wise lexicographic minimum of the given (N, k) arrays
+        """
+        different = first != second
+        column = np.argmax(different, axis=1)
+        rows = np.arange(len(first))
+        use_second = different[rows, column] & (
+            second[rows, column] < first[rows, column]
+        )
+        return np.where(use_second[:, None], second, first)
+
+    @staticmethod
+    def _canonicalize_row(row: List[int], orientation_invariant: bool) -> List[int]:
+        """
+        Canonicalizes a single face by checking all rotations
+        :param row: vertex indices of the face
+        :param orientation_invariant: If true, also the rotations of the reversed face are checked
+        :return: canonical face
+        """
+        candidates = [row[i:] + row[:i] for i in range(len(row))]
+        if orientation_invariant:
+            reverse = row[::-1]
+            candidates += [reverse[i:] + reverse[:i] for i in range(len(reverse))]
+        return min(candidates)
+
+    @staticmethod
+    def deduplicate(
+        table: FaceTable,
+        orientation_invariant: bool = False,
+        num_vertices: Optional[int] = None,
+    ) -> FaceTable:
+        """
+        Removes duplicated faces, the first occurrence of every face (including its normals and texture coordinates)
+        is kept and the original order of the faces is maintained
+        :param table: faces to be deduplicated
+        :param orientation_invariant: If true, faces with reversed winding order are considered as duplicates
+        :param num_vertices: number of vertices of the referenced file (required if indices < 0 are used)
+        :return: new face table without duplicates
+        """
+        return table.take(
+            FaceDeduplicator.get_unique_face_ids(
+                table, orientation_invariant, num_vertices
+            )
+        )
@@ -1,5 +1,4 @@
-import copy
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 
 from geofiles.conversion.origin_converter import OriginConverter
 from geofiles.domain.geo_object_file import GeoObjectFile
@@ -17,6 +16,10 @@ class LocalConverter:
         origin: List[Any],
         origin_based: bool = True,
         update_extent: bool = False,
+        inplace: bool = False,
+        approximation: Optional[str] = None,
+        max_approximation_extent: float = 5000.0,
+        report: Optional[Dict[str, Any]] = None,
     ) -> GeoObjectFile:
         """
         Converts the given object file with a local coordinate system to a geo-referenced representation
@@ -25,27 +28,53 @@ class LocalConverter:
         :param origin: origin point used for conversion
         :param origin_based: flag that signals if the final file should be origin based or should use geo-referenced vertices
         :param update_extent: If true, extent information of the converted data is determined
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        (only used if the resulting file is not origin based)
+        :param max_approximation_extent: maximum distance (in meters) between a vertex and the origin up to which the
+        approximation is used
+        :param report: optional dictionary, which is filled with information about the used approximation
         :return: geo-referenced file based on the given origin
         """
         if data.crs is not None:
             raise Exception("Given data is already geo-referenced")
-        res = copy.deepcopy(data)
+        res = data if inplace else data.shallow_copy()
         res.crs = crs
         res.origin = origin
         if not origin_based:
             converter = OriginConverter()
-            res = converter.from_origin(res, update_extent=update_extent)
+            res = converter.from_origin(
+                res,
+                update_extent=update_extent,
+                inplace=True,
+                approximation=approximation,
+                max_approximation_extent=max_approximation_extent,
+                report=report,
+            )
         elif update_extent:
             res.update_extent()
 
         return res
 
     @staticmethod
-    def to_local(data: GeoObjectFile, update_extent: bool = False) -> GeoObjectFile:
+    def to_local(
+        data: GeoObjectFile,
+        update_extent: bool = False,
+        inplace: bool = False,
+        approximation: Optional[str] = None,
+        max_approximation_extent: float = 5000.0,
+        report: Optional[Dict[str, Any]] = None,
+    ) -> GeoObjectFile:
         """
         Converts the given geo-referenced file to a local representation
         :param data: to be converted
         :param update_extent: If true, extent information of the converted data is determined
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        (only used if the given file is not origin based)
+        :param max_approximation_extent: maximum horizontal distance (in meters) between a vertex and the origin up to
+        which the approximation is used
+        :param report: optional dictionary, which is filled with information about the used approximation
         :return:
         """
         if not data.is_geo_referenced():
@@ -54,9 +83,16 @@ class LocalConverter:
         res: GeoObjectFile
         if not data.is_origin_based():
             converter = OriginConverter()
-            res = converter.to_origin(data, update_extent=update_extent)
+            res = converter.to_origin(
+                data,
+                update_extent=update_extent,
+                inplace=inplace,
+                approximation=approximation,
+                max_approximation_extent=max_approximation_extent,
+                report=report,
+            )
         else:
-            res = copy.deepcopy(data)
+            res = data if inplace else data.shallow_copy()
             if update_extent:
                 res.update_extent()
 
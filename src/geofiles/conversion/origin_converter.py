@@ -1,26 +1,28 @@
-import copy
-from typing import Any, List, Optional
+import math
+from typing import Any, Dict, List, Optional, Tuple
 
-from pyproj import Geod
+import numpy as np
 
 from geofiles.conversion.calculation import (
-    get_angle_between_points,
+    get_angles_between_points,
     get_center,
-    get_distant_point,
-    get_point_distance,
-)
-from geofiles.conversion.static import (
-    get_epsg_4326,
-    get_lon_lat,
-    get_wgs_84,
-    update_min_max,
+    get_distant_points,
+    get_point_distances,
 )
+from geofiles.conversion.static import get_epsg_4326, get_lon_lat, get_wgs_84
+from geofiles.conversion.transformer_cache import get_default_transformer_cache
 from geofiles.domain.geo_object_file import GeoObjectFile
 
+WGS84_SEMI_MAJOR_AXIS = 6378137.0
+WGS84_FLATTENING = 1 / 298.257223563
+
 
 class OriginConverter:
     """
-    Converter used to convert a geo referenced file to a origin based representation or vice versa
+    Converter used to convert a geo referenced file to a origin based representation or vice versa.
+    All vertices are converted at once with vectorized geodesic calculations. For small models the geodesic
+    calculations can be replaced by a linearization in the local tangent plane (east, north, up) of the origin,
+    which is applied as a single matrix multiplication.
     """
 
     @staticmethod
@@ -29,6 +31,10 @@ class OriginConverter:
         origin: Optional[List[Any]] = None,
         bearing_offset: float = 0.0,
         update_extent: bool = False,
+        inplace: bool = False,
+        approximation: Optional[str] = None,
+        max_approximation_extent: float = 5000.0,
+        report: Optional[Dict[str, Any]] = None,
     ) -> GeoObjectFile:
         """
         Converts the given file to an origin based representation
@@ -36,6 +42,12 @@ class OriginConverter:
         :param origin: coordinate used as file origin
         :param bearing_offset: angle offset between the origin's coordinate system and the local vertices' coordinate system
         :param update_extent: If true, extent information of the converted data is determined
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        :param max_approximation_extent: maximum horizontal distance (in meters) between a vertex and the origin up to
+        which the approximation is used, for larger models the geodesic calculations are used
+        :param report: optional dictionary, which is filled with the used method, the horizontal extent of the model
+        and the maximum error (in meters) of the approximation determined on a sample of the vertices
         :return: origin based representation
         """
         if data.is_origin_based():
@@ -45,8 +57,9 @@ class OriginConverter:
             raise Exception(
                 f'Function only supported for "{get_wgs_84()}" and "{get_epsg_4326()}"'
             )
+        OriginConverter._check_approximation(approximation)
 
-        res = copy.deepcopy(data)
+        res = data if inplace else data.shallow_copy()
         if origin is None:
             localorigin = get_center(data.vertices)
         else:
@@ -54,41 +67,110 @@ class OriginConverter:
 
         res.origin = localorigin
 
-        new_vertices = []
-        geod = Geod(ellps="WGS84")
-        min_extent: Optional[List[float]] = data.min_extent
-        max_extent: Optional[List[float]] = data.max_extent
-        is_first = True
-        for vertex in data.vertices:
-            lon0, lat0 = get_lon_lat(vertex, data.crs)
-            lon1, lat1 = get_lon_lat(localorigin, data.crs)
-            bearing, _, distance = geod.inv(lon0, lat0, lon1, lat1)
-            new_vertex = get_distant_point(0, 0, distance, bearing + bearing_offset)
-            new_vertex.append(localorigin[2] - vertex[2])
-            if update_extent:
-                if is_first:
-                    min_extent = new_vertex.copy()
-                    max_extent = new_vertex.copy()
-                    is_first = False
-                else:
-                    update_min_max(new_vertex, min_extent, max_extent)
-            new_vertices.append(new_vertex)
-
-        res.vertices = new_vertices
-        res.min_extent = min_extent
-        res.max_extent = max_extent
+        vertices = data.get_vertex_array()
+        new_vertices: Optional[np.ndarray] = None
+        method = "exact"
+        if approximation == "enu" and len(vertices) > 0:
+            approximated = OriginConverter.to_origin_array(
+                vertices, localorigin, data.crs, bearing_offset, "enu"
+            )
+            extent = float(np.max(np.hypot(approximated[:, 0], approximated[:, 1])))
+            if extent <= max_approximation_extent:
+                method = "enu"
+                new_vertices = approximated
+                if report is not None:
+                    sample = OriginConverter._get_error_sample(approximated)
+                    exact = OriginConverter.to_origin_array(
+                        vertices[sample], localorigin, data.crs, bearing_offset
+                    )
+                    errors = np.hypot(*(exact - approximated[sample])[:, :2].T)
+                    OriginConverter._fill_report(
+                        report, method, extent, float(errors.max()), len(sample)
+                    )
+            elif report is not None:
+                OriginConverter._fill_report(report, method, extent, 0.0, 0)
+        elif report is not None:
+            OriginConverter._fill_report(report, method, None, 0.0, 0)
+
+        if new_vertices is None:
+            new_vertices = OriginConverter.to_origin_array(
+                vertices, localorigin, data.crs, bearing_offset
+            )
+
+        res.set_vertex_array(new_vertices)
+        if update_extent and len(new_vertices) > 0:
+            res.update_extent()
+        else:
+            res.min_extent = data.min_extent
+            res.max_extent = data.max_extent
 
         return res
 
+    @staticmethod
+    def to_origin_array(
+        vertices: np.ndarray,
+        origin: List[Any],
+        crs: str,
+        bearing_offset: float = 0.0,
+        approximation: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Converts the given geo-referenced vertices to vertices relative to the origin (without any fallback of the
+        approximation)
+        :param vertices: (N, 3) array of geo-referenced vertices
+        :param origin: geo-referenced origin
+        :param crs: coordinate system of the origin and the vertices (WGS84 or EPSG4326)
+        :param bearing_offset: angle offset between the origin's coordinate system and the local vertices' coordinate system
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        :return: (N, 3) array of vertices relative to the origin
+        """
+        OriginConverter._check_approximation(approximation)
+        lon_lat = OriginConverter._get_lon_lat_columns(crs)
+        origin_lon, origin_lat = [float(a) for a in get_lon_lat(origin, crs)]
+        lon = vertices[:, lon_lat[0]]
+        lat = vertices[:, lon_lat[1]]
+
+        res = np.empty((len(vertices), 3), dtype=np.float64)
+        if approximation == "enu":
+            matrix = OriginConverter._get_tangent_plane_matrix(origin_lat)
+            offsets = np.column_stack([lon - origin_lon, lat - origin_lat])
+            # the converted vertices point from the vertex to the origin, rotated by the bearing offset
+            offset_rad = math.radians(bearing_offset)
+            rotation = np.asarray(
+                [
+                    [math.cos(offset_rad), math.sin(offset_rad)],
+                    [-math.sin(offset_rad), math.cos(offset_rad)],
+                ]
+            )
+            res[:, :2] = offsets @ (rotation @ -matrix).T
+        else:
+            res[:, :2] = OriginConverter._get_geodesic_local(
+                lon, lat, origin_lon, origin_lat, bearing_offset
+            )
+        res[:, 2] = float(origin[2]) - vertices[:, 2]
+        return res
+
     @staticmethod
     def from_origin(
-        data: GeoObjectFile, bearing_offset: float = 0.0, update_extent: bool = False
+        data: GeoObjectFile,
+        bearing_offset: float = 0.0,
+        update_extent: bool = False,
+        inplace: bool = False,
+        approximation: Optional[str] = None,
+        max_approximation_extent: float = 5000.0,
+        report: Optional[Dict[str, Any]] = None,
     ) -> GeoObjectFile:
         """
         Converts the given file from an origin based representation
         :param data: to be converted
         :param bearing_offset: angle offset between the origin's coordinate system and the local vertices' coordinate system
         :param update_extent: If true, extent information of the converted data is determined
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        :param max_approximation_extent: maximum distance (in meters) between a vertex and the origin up to which the
+        approximation is used, for larger models the geodesic calculations are used
+        :param report: optional dictionary, which is filled with the used method, the extent of the model
+        and the maximum error (in meters) of the approximation determined on a sample of the vertices
         :return: non-origin based representation
         """
         if not data.is_origin_based() or data.origin is None:
@@ -98,41 +180,206 @@ class OriginConverter:
             raise Exception(
                 f'Function only supported for "{get_wgs_84()}" and "{get_epsg_4326()}"'
             )
+        OriginConverter._check_approximation(approximation)
+
+        res = data if inplace else data.shallow_copy()
+        vertices = data.get_vertex_array()
+        new_vertices = np.empty((len(vertices), 3), dtype=np.float64)
+        method = "exact"
+        extent: Optional[float] = None
+        if len(vertices) > 0:
+            extent = float(get_point_distances(vertices, [0, 0, 0]).max())
+            if approximation == "enu" and extent <= max_approximation_extent:
+                method = "enu"
+            new_vertices = OriginConverter.from_origin_array(
+                vertices, data.origin, data.crs, bearing_offset, method
+            )
+            if report is not None and method == "enu":
+                sample = OriginConverter._get_error_sample(vertices[:, :2])
+                exact = OriginConverter.from_origin_array(
+                    vertices[sample], data.origin, data.crs, bearing_offset
+                )
+                lon_lat = OriginConverter._get_lon_lat_columns(data.crs)
+                geod = get_default_transformer_cache().get_geod("WGS84")
+                _, _, errors = geod.inv(
+                    exact[:, lon_lat[0]],
+                    exact[:, lon_lat[1]],
+                    new_vertices[sample, lon_lat[0]],
+                    new_vertices[sample, lon_lat[1]],
+                )
+                OriginConverter._fill_report(
+                    report, method, extent, float(np.max(errors)), len(sample)
+                )
+
+        if report is not None and method == "exact":
+            OriginConverter._fill_report(report, method, extent, 0.0, 0)
 
-        res = copy.deepcopy(data)
+        res.set_vertex_array(new_vertices)
         res.origin = None
-        origin_lon, origin_lat = get_lon_lat(data.origin, data.crs)
-
-        new_vertices = []
-        geod = Geod(ellps="WGS84")
-        origin = [0, 0, 0]
-        north_vector = [0, 1]
-        if data.vertices:
-            min_extent: Optional[List[float]] = data.min_extent
-            max_extent: Optional[List[float]] = data.max_extent
-            is_first = True
-            for vertex in data.vertices:
-                distance = get_point_distance(origin, vertex)
-                r = get_angle_between_points(vertex, north_vector) + bearing_offset
-                new_vertex = geod.fwd(origin_lon, origin_lat, r, distance)
-                alt = float(data.origin[2]) - float(vertex[2])
-                converted: List[float]
-                if data.crs == get_wgs_84():
-                    converted = [new_vertex[0], new_vertex[1], alt]
-                else:
-                    converted = [new_vertex[1], new_vertex[0], alt]
-                new_vertices.append(converted)
-
-                if update_extent:
-                    if is_first:
-                        min_extent = converted.copy()
-                        max_extent = converted.copy()
-                        is_first = False
-                    else:
-                        update_min_max(converted, min_extent, max_extent)
-            res.min_extent = min_extent
-            res.max_extent = max_extent
-
-        res.vertices = new_vertices
+        if len(vertices) > 0:
+            if update_extent:
+                res.update_extent()
+            else:
+                res.min_extent = data.min_extent
+                res.max_extent = data.max_extent
 
         return res
+
+    @staticmethod
+    def from_origin_array(
+        vertices: np.ndarray,
+        origin: List[Any],
+        crs: str,
+        bearing_offset: float = 0.0,
+        approximation: Optional[str] = None,
+    ) -> np.ndarray:
+        """
+        Converts the given origin based vertices to geo-referenced vertices (without any fallback of the approximation)
+        :param vertices: (N, 3) array of vertices relative to the origin
+        :param origin: geo-referenced origin
+        :param crs: coordinate system of the origin and the resulting vertices (WGS84 or EPSG4326)
+        :param bearing_offset: angle offset between the origin's coordinate system and the local vertices' coordinate system
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        :return: (N, 3) array of geo-referenced vertices
+        """
+        OriginConverter._check_approximation(approximation)
+        origin_lon, origin_lat = [float(a) for a in get_lon_lat(origin, crs)]
+        lon_lat = OriginConverter._get_lon_lat_columns(crs)
+        distance = get_point_distances(vertices, [0, 0, 0])
+        bearing = get_angles_between_points(vertices, [0, 1]) + bearing_offset
+
+        res = np.empty((len(vertices), 3), dtype=np.float64)
+        if approximation == "enu":
+            east_north = get_distant_points(0, 0, distance, bearing)
+            matrix = OriginConverter._get_tangent_plane_matrix(origin_lat)
+            degrees = east_north @ np.linalg.inv(matrix).T
+            res[:, lon_lat[0]] = degrees[:, 0] + origin_lon
+            res[:, lon_lat[1]] = degrees[:, 1] + origin_lat
+        else:
+            lon, lat = OriginConverter._get_geodesic_lon_lat(
+                origin_lon, origin_lat, bearing, distance
+            )
+            res[:, lon_lat[0]] = lon
+            res[:, lon_lat[1]] = lat
+        res[:, 2] = float(origin[2]) - vertices[:, 2]
+        return res
+
+    @staticmethod
+    def _get_geodesic_local(
+        lon: np.ndarray,
+        lat: np.ndarray,
+        origin_lon: float,
+        origin_lat: float,
+        bearing_offset: float,
+    ) -> np.ndarray:
+        """
+        Calculates the local horizontal coordinates of the given positions based on geodesics to the origin
+        :param lon: (N,) array of longitudes
+        :param lat: (N,) array of latitudes
+        :param origin_lon: longitude of the origin
+        :param origin_lat: latitude of the origin
+        :param bearing_offset: angle offset between the origin's coordinate system and the local coordinate system
+        :return: (N, 2) array of local coordinates
+        """
+        geod = get_default_transformer_cache().get_geod("WGS84")
+        bearing, _, distance = geod.inv(
+            lon, lat, np.full(len(lon), origin_lon), np.full(len(lat), origin_lat)
+        )
+        return get_distant_points(0, 0, distance, bearing + bearing_offset)
+
+    @staticmethod
+    def _get_geodesic_lon_lat(
+        origin_lon: float, origin_lat: float, bearing: np.ndarray, distance: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Calculates the end points of the geodesics starting at the origin
+        :param origin_lon: longitude of the origin
+        :param origin_lat: latitude of the origin
+        :param bearing: (N,) array of azimuths
+        :param distance: (N,) array of distances
+        :return: longitudes and latitudes of the end points
+        """
+        geod = get_default_transformer_cache().get_geod("WGS84")
+        lon, lat, _ = geod.fwd(
+            np.full(len(bearing), origin_lon),
+            np.full(len(bearing), origin_lat),
+            bearing,
+            distance,
+        )
+        return lon, lat
+
+    @staticmethod
+    def _get_tangent_plane_matrix(origin_lat: float) -> np.ndarray:
+        """
+        Linearization of the WGS84 ellipsoid at the given latitude
+        :param origin_lat: latitude of the point of tangency
+        :return: 2x2 matrix converting longitude and latitude differences (degrees) to east and north offsets (meters)
+        """
+        e2 = WGS84_FLATTENING * (2 - WGS84_FLATTENING)
+        phi = math.radians(origin_lat)
+        w = math.sqrt(1 - e2 * math.sin(phi) ** 2)
+        prime_vertical_radius = WGS84_SEMI_MAJOR_AXIS / w
+        meridian_radius = WGS84_SEMI_MAJOR_AXIS * (1 - e2) / w**3
+        return np.asarray(
+            [
+                [math.radians(prime_vertical_radius * math.cos(phi)), 0.0],
+                [0.0, math.radians(meridian_radius)],
+            ]
+        )
+
+    @staticmethod
+    def _get_error_sample(offsets: np.ndarray, size: int = 64) -> np.ndarray:
+        """
+        Selects the vertices used for estimating the error of the approximation, the error grows with the distance
+        to the origin, so the most distant vertices are always part of the sample
+        :param offsets: (N, 2) array of horizontal offsets to the origin
+        :param size: maximum number of sampled vertices
+        :return: ids of the sampled vertices
+        """
+        distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        num_distant = min(size // 2, len(distances))
+        distant = np.argpartition(-distances, num_distant - 1)[:num_distant]
+        spread = np.linspace(0, len(distances) - 1, size - num_distant).astype(np.int64)
+        res: np.ndarray = np.unique(np.concatenate([distant, spread]))
+        return res
+
+    @staticmethod
+    def _fill_report(
+        report: Dict[str, Any],
+        method: str,
+        extent: Optional[float],
+        max_error: float,
+        sampled_vertices: int,
+    ) -> None:
+        """
+        Fills the report of a conversion
+        :param report: to be filled
+        :param method: method used for converting ("exact" or "enu")
+        :param extent: maximum distance between a vertex and the origin
+        :param max_error: maximum error of the sampled vertices in meters
+        :param sampled_vertices: number of vertices used for determining the error
+        :return: None
+        """
+        report["method"] = method
+        report["extent"] = extent
+        report["max_error"] = max_error
+        report["sampled_vertices"] = sampled_vertices
+
+    @staticmethod
+    def _check_approximation(approximation: Optional[str]) -> None:
+        """
+        :param approximation: approximation mode to be checked
+        :return: None
+        """
+        if approximation not in [None, "exact", "enu"]:
+            raise Exception(f"Unknown approximation {approximation}")
+
+    @staticmethod
+    def _get_lon_lat_columns(coordinate_system: str) -> List[int]:
+        """
+        :param coordinate_system: WGS84 or EPSG4326
+        :return: column indices of longitude and latitude within a vertex
+        """
+        if coordinate_system == get_wgs_84():
+            return [0, 1]
+        return [1, 0]
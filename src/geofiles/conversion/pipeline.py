@@ -0,0 +1,311 @@
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from geofiles.conversion.calculation import (
+    apply_affine_matrix,
+    get_affine_matrix,
+    get_center,
+)
+from geofiles.conversion.crs_converter import CrsConverter
+from geofiles.conversion.origin_converter import OriginConverter
+from geofiles.conversion.static import get_epsg_4326, get_wgs_84
+from geofiles.domain.geo_object_file import GeoObjectFile
+
+
+class ConversionPipeline:
+    """
+    Lazy pipeline of conversions applied to the vertices of a GeoObjectFile.
+    Operations are only recorded (and validated against the resulting meta data) until execute is called.
+    Consecutive affine operations are fused to a single matrix and the whole plan is applied to one chunk of
+    vertices after another, so the vertices are read and written only once and extents are determined in the
+    same pass.
+
+    Example:
+        pipeline = ConversionPipeline(local_file)
+        result = (
+            pipeline.from_local(crs, origin)
+            .transform()
+            .from_origin()
+            .convert("EPSG:31256")
+            .execute(update_extent=True)
+        )
+    """
+
+    def __init__(
+        self,
+        data: GeoObjectFile,
+        chunk_size: int = 1 << 20,
+        crs_converter: Optional[CrsConverter] = None,
+    ) -> None:
+        """
+        :param data: file whose vertices are converted (it is not modified until execute is called with inplace=True)
+        :param chunk_size: number of vertices processed at once
+        :param crs_converter: converter providing the pyproj transformers, if None a converter using the
+        process-wide transformer cache is used
+        """
+        self.data = data
+        self.chunk_size = chunk_size
+        self.crs_converter = (
+            crs_converter if crs_converter is not None else CrsConverter()
+        )
+        # meta data of the resulting file, the vertices are shared with the input until the pipeline is executed
+        self._result = data.shallow_copy()
+        self._steps: List[Tuple[str, Any]] = []
+
+    def from_local(
+        self, crs: str, origin: List[Any], origin_based: bool = True
+    ) -> "ConversionPipeline":
+        """
+        Records the conversion of a local file to a geo-referenced representation (see LocalConverter.from_local)
+        :param crs: target crs
+        :param origin: origin point used for conversion
+        :param origin_based: flag that signals if the final file should be origin based or should use geo-referenced vertices
+        :return: this pipeline
+        """
+        if self._result.crs is not None:
+            raise Exception("Given data is already geo-referenced")
+        self._result.crs = crs
+        self._result.origin = origin
+        if not origin_based:
+            self.from_origin()
+        return self
+
+    def transform(
+        self, scale: bool = True, rotate: bool = True, translate: bool = True
+    ) -> "ConversionPipeline":
+        """
+        Records the global scaling, rotation and translation of the file (see Transformer.transform)
+        :param scale: Flag if scaling should be applied
+        :param rotate: Flag if rotation should be applied
+        :param translate: Flag if translation should be applied
+        :return: this pipeline
+        """
+        if not self._result.is_origin_based():
+            raise Exception("Function only supported for origin based representations")
+
+        if not self._result.is_default_rotation_unit():
+            raise Exception(
+                "Function only supported for rotation information using degrees (deg)"
+            )
+
+        if not self._result.is_default_translation_unit():
+            raise Exception(
+                "Function only supported for translation information using metres (m)"
+            )
+
+        scaling = self._result.scaling if scale else None
+        rotation = self._result.rotation if rotate else None
+        translation = self._result.translation if translate else None
+        self._steps.append(
+            (
+                "transform",
+                (
+                    scaling if scaling is not None else [1, 1, 1],
+                    rotation if rotation is not None else [0, 0, 0],
+                    translation if translation is not None else [0, 0, 0],
+                ),
+            )
+        )
+        if scale:
+            self._result.scaling = None
+        if rotate:
+            self._result.rotation = None
+        if translate:
+            self._result.translation = None
+        self._result.min_extent = []
+        self._result.max_extent = []
+        return self
+
+    def apply_matrix(self, matrix: np.ndarray) -> "ConversionPipeline":
+        """
+        Records the application of an affine transformation (see Transformer.apply_matrix)
+        :param matrix: 4x4 matrix
+        :return: this pipeline
+        """
+        self._steps.append(("affine", np.asarray(matrix, dtype=np.float64)))
+        self._result.min_extent = []
+        self._result.max_extent = []
+        return self
+
+    def from_origin(
+        self, bearing_offset: float = 0.0, approximation: Optional[str] = None
+    ) -> "ConversionPipeline":
+        """
+        Records the conversion from an origin based representation (see OriginConverter.from_origin)
+        :param bearing_offset: angle offset between the origin's coordinate system and the local vertices' coordinate system
+        :param approximation: None (or "exact") for geodesic calculations, "enu" for a local tangent plane approximation
+        :return: this pipeline
+        """
+        if not self._result.is_origin_based() or self._result.origin is None:
+            raise Exception("Given geo-referenced object file is not origin based")
+
+        if self._result.crs != get_wgs_84() and self._result.crs != get_epsg_4326():
+            raise Exception(
+                f'Function only supported for "{get_wgs_84()}" and "{get_epsg_4326()}"'
+            )
+        OriginConverter._check_approximation(approximation)
+
+        self._steps.append(
+            (
+                "from_origin",
+                (self._result.origin, self._result.crs, bearing_offset, approximation),
+            )
+        )
+        self._result.origin = None
+        return self
+
+    def convert(self, target_crs: str, alwaysxy: bool = True) -> "ConversionPipeline":
+        """
+        Records the projection to another coordinate reference system (see CrsConverter.convert)
+        :param target_crs: target coordinate system (string to create a pyproj.crs.CRS)
+        :param alwaysxy: If true, the transformer uses the traditional GIS axis order
+        :return: this pipeline
+        """
+        if self._result.crs is None:
+            raise Exception("Given file is not geo-referenced")
+
+        transformer, from_wgs84, to_wgs84 = self.crs_converter.get_transformer(
+            self._result.crs, target_crs, alwaysxy
+        )
+        if self._result.is_origin_based() and self._result.origin is not None:
+            # only the origin is converted, which does not require a pass over the vertices
+            self._result.origin = CrsConverter.convert_array(
+                np.asarray([self._result.origin], dtype=np.float64),
+                transformer,
+                from_wgs84,
+                to_wgs84,
+            )[0].tolist()
+        else:
+            self._steps.append(("crs", (transformer, from_wgs84, to_wgs84)))
+        self._result.crs = target_crs
+        return self
+
+    def get_plan(self) -> List[str]:
+        """
+        :return: names of the operations applied to every chunk of vertices after fusing the recorded steps
+        """
+        plan: List[str] = []
+        for name, _ in self._steps:
+            stage = "affine" if name in ["transform", "affine"] else name
+            if stage != "affine" or len(plan) == 0 or plan[-1] != "affine":
+                plan.append(stage)
+        return plan
+
+    def execute(
+        self, update_extent: bool = False, inplace: bool = False
+    ) -> GeoObjectFile:
+        """
+        Executes the recorded steps in a single pass over the vertices
+        :param update_extent: If true, extent information of the converted data is determined during the pass
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
+        :return: converted file
+        """
+        vertices = self.data.get_vertex_array()
+        stages = self._get_stages(vertices)
+
+        converted: Optional[np.ndarray] = None
+        min_extent: Optional[np.ndarray] = None
+        max_extent: Optional[np.ndarray] = None
+        for start in range(0, len(vertices), self.chunk_size):
+            chunk = vertices[start : start + self.chunk_size]
+            for stage in stages:
+                chunk = stage(chunk)
+            if converted is None:
+                converted = np.empty((len(vertices), chunk.shape[1]), dtype=np.float64)
+            converted[start : start + len(chunk)] = chunk
+            if update_extent:
+                chunk_min = chunk.min(axis=0)
+                chunk_max = chunk.max(axis=0)
+                if min_extent is None or max_extent is None:
+                    min_extent = chunk_min
+                    max_extent = chunk_max
+                else:
+                    np.minimum(min_extent, chunk_min, out=min_extent)
+                    np.maximum(max_extent, chunk_max, out=max_extent)
+
+        res = self.data if inplace else self.data.shallow_copy()
+        res.crs = self._result.crs
+        res.origin = self._result.origin
+        res.scaling = self._result.scaling
+        res.rotation = self._result.rotation
+        res.translation = self._result.translation
+        res.min_extent = self._result.min_extent
+        res.max_extent = self._result.max_extent
+        if converted is not None:
+            res.set_vertex_array(converted)
+        if min_extent is not None and max_extent is not None:
+            res.min_extent = min_extent.tolist()
+            res.max_extent = max_extent.tolist()
+        return res
+
+    def _get_stages(
+        self, vertices: np.ndarray
+    ) -> List[Callable[[np.ndarray], np.ndarray]]:
+        """
+        Fuses the recorded steps to the functions applied to every chunk
+        :param vertices: all input vertices (used for determining the center of transformations)
+        :return: functions converting a chunk of vertices
+        """
+        stages: List[Callable[[np.ndarray], np.ndarray]] = []
+        matrix: Optional[np.ndarray] = None
+        mean: Optional[List[float]] = None
+        for name, arguments in self._steps:
+            if name in ["transform", "affine"]:
+                if name == "transform":
+                    # the center of affinely transformed vertices is the transformed center of the input,
+                    # transformations are only possible before the first non-affine step (origin based data)
+                    if mean is None:
+                        mean = get_center(vertices) if len(vertices) > 0 else [0, 0, 0]
+                    center = np.asarray(mean, dtype=np.float64)
+                    if matrix is not None:
+                        center = apply_affine_matrix(center[None], matrix)[0]
+                    step_matrix = get_affine_matrix(center.tolist(), *arguments)
+                else:
+                    step_matrix = arguments
+                matrix = step_matrix if matrix is None else step_matrix @ matrix
+                continue
+
+            if matrix is not None:
+                stages.append(self._get_affine_stage(matrix))
+                matrix = None
+            if name == "from_origin":
+                stages.append(self._get_from_origin_stage(*arguments))
+            else:
+                stages.append(self._get_crs_stage(*arguments))
+        if matrix is not None:
+            stages.append(self._get_affine_stage(matrix))
+        return stages
+
+    @staticmethod
+    def _get_affine_stage(matrix: np.ndarray) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        :param matrix: 4x4 matrix to be applied
+        :return: function applying the matrix to a chunk
+        """
+        return lambda chunk: apply_affine_matrix(chunk, matrix)
+
+    @staticmethod
+    def _get_from_origin_stage(
+        origin: List[Any],
+        crs: str,
+        bearing_offset: float,
+        approximation: Optional[str],
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        :return: function converting a chunk from its origin based representation
+        """
+        return lambda chunk: OriginConverter.from_origin_array(
+            chunk, origin, crs, bearing_offset, approximation
+        )
+
+    @staticmethod
+    def _get_crs_stage(
+        transformer: Any, from_wgs84: bool, to_wgs84: bool
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        """
+        :return: function projecting a chunk to another coordinate system
+        """
+        return lambda chunk: CrsConverter.convert_array(
+            chunk, transformer, from_wgs84, to_wgs84
+        )
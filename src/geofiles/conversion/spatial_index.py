@@ -0,0 +1,369 @@
+import heapq
+import math
+from typing import Any, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from geofiles.domain.geo_object import GeoObject
+from geofiles.domain.geo_object_file import GeoObjectFile
+
+
+class SpatialIndex:
+    """
+    Static R-tree over the axis aligned bounding boxes of the objects or faces of a GeoObjectFile.
+    The tree is bulk-loaded with sort-tile-recursive (STR) packing: the boxes are sorted into slabs along every
+    axis and consecutive boxes are grouped into nodes, level by level up to a single root.
+    Every level is stored as arrays of boxes and child ranges, so box queries test all candidate nodes of a level
+    at once instead of visiting the nodes one by one.
+
+    Entries are identified by their index in the boxes used for building the index, object_ids and face_ids map them
+    to the objects (and faces) of the file. The index is not updated if the file is modified.
+    """
+
+    def __init__(
+        self,
+        min_boxes: Any,
+        max_boxes: Any,
+        object_ids: Any,
+        face_ids: Any = None,
+        node_capacity: int = 16,
+    ) -> None:
+        """
+        Builds the index for the given boxes
+        :param min_boxes: (N, dim) array of the minimal corners of the boxes
+        :param max_boxes: (N, dim) array of the maximal corners of the boxes
+        :param object_ids: index of the object every box belongs to
+        :param face_ids: index of the face (within its object) every box belongs to, None for object boxes
+        :param node_capacity: maximum number of children of a node
+        """
+        if node_capacity < 2:
+            raise Exception("Node capacity must be at least 2")
+        self.node_capacity = node_capacity
+        self.min_boxes = np.asarray(min_boxes, dtype=np.float64)
+        self.max_boxes = np.asarray(max_boxes, dtype=np.float64)
+        if self.min_boxes.ndim != 2 or self.min_boxes.shape != self.max_boxes.shape:
+            raise Exception("Boxes must be given as two (N, dim) arrays")
+        self.object_ids = np.asarray(object_ids, dtype=np.int64)
+        if face_ids is None:
+            self.face_ids = np.full(len(self.object_ids), -1, dtype=np.int64)
+        else:
+            self.face_ids = np.asarray(face_ids, dtype=np.int64)
+        # position of every entry in the leaf level -> entry id
+        self._order = np.zeros(0, dtype=np.int64)
+        # per level (leaves first): minimal corners, maximal corners, first child and number of children
+        self._levels: List[
+            Tuple[np.ndarray, np.ndarray, Optional[np.ndarray], Optional[np.ndarray]]
+        ] = []
+        self._build()
+
+    @staticmethod
+    def from_objects(data: GeoObjectFile, node_capacity: int = 16) -> "SpatialIndex":
+        """
+        Creates an index over the bounding boxes of the objects (objects without faces are not indexed)
+        :param data: indexed file
+        :param node_capacity: maximum number of children of a node
+        :return: index, whose entries are objects
+        """
+        min_boxes: List[List[float]] = []
+        max_boxes: List[List[float]] = []
+        object_ids: List[int] = []
+        for idx, geoobj in enumerate(data.objects):
+            min_extent, max_extent = data.get_object_extent(geoobj)
+            if len(min_extent) > 0:
+                min_boxes.append(min_extent)
+                max_boxes.append(max_extent)
+                object_ids.append(idx)
+        dimension = SpatialIndex._get_dimension(data)
+        return SpatialIndex(
+            np.asarray(min_boxes, dtype=np.float64).reshape(-1, dimension),
+            np.asarray(max_boxes, dtype=np.float64).reshape(-1, dimension),
+            object_ids,
+            node_capacity=node_capacity,
+        )
+
+    @staticmethod
+    def from_faces(data: GeoObjectFile, node_capacity: int = 16) -> "SpatialIndex":
+        """
+        Creates an index over the bounding boxes of all faces (empty faces are not indexed)
+        :param data: indexed file
+        :param node_capacity: maximum number of children of a node
+        :return: index, whose entries are faces
+        """
+        vertices = data.get_vertex_array()
+        dimension = SpatialIndex._get_dimension(data)
+        min_boxes = [np.zeros((0, dimension), dtype=np.float64)]
+        max_boxes = [np.zeros((0, dimension), dtype=np.float64)]
+        object_ids = [np.zeros(0, dtype=np.int64)]
+        face_ids = [np.zeros(0, dtype=np.int64)]
+        for idx, geoobj in enumerate(data.objects):
+            table = geoobj.get_face_table()
+            valid = np.flatnonzero(table.get_counts() > 0)
+            if len(valid) == 0:
+                continue
+            points = vertices[table.get_zero_based_indices(len(vertices))]
+            starts = table.offsets[:-1][valid]
+            min_boxes.append(np.minimum.reduceat(points, starts, axis=0))
+            max_boxes.append(np.maximum.reduceat(points, starts, axis=0))
+            object_ids.append(np.full(len(valid), idx, dtype=np.int64))
+            face_ids.append(valid.astype(np.int64))
+        return SpatialIndex(
+            np.concatenate(min_boxes),
+            np.concatenate(max_boxes),
+            np.concatenate(object_ids),
+            np.concatenate(face_ids),
+            node_capacity,
+        )
+
+    @staticmethod
+    def _get_dimension(data: GeoObjectFile) -> int:
+        """
+        :param data: indexed file
+        :return: dimension of the vertices (3 for files without vertices)
+        """
+        vertices = data.get_vertex_array()
+        return int(vertices.shape[1]) if len(vertices) > 0 else 3
+
+    @property
+    def dimension(self) -> int:
+        """
+        :return: dimension of the indexed boxes
+        """
+        return int(self.min_boxes.shape[1])
+
+    def _build(self) -> None:
+        """
+        Bulk-loads the tree levels with STR packing
+        :return: None
+        """
+        self._order = self._get_str_order(self.min_boxes, self.max_boxes)
+        level_min = self.min_boxes[self._order]
+        level_max = self.max_boxes[self._order]
+        self._levels = [(level_min, level_max, None, None)]
+        while len(level_min) > 1:
+            starts = np.arange(0, len(level_min), self.node_capacity, dtype=np.int64)
+            counts = np.minimum(self.node_capacity, len(level_min) - starts)
+            node_min = np.minimum.reduceat(level_min, starts, axis=0)
+            node_max = np.maximum.reduceat(level_max, starts, axis=0)
+            order = self._get_str_order(node_min, node_max)
+            level_min = node_min[order]
+            level_max = node_max[order]
+            self._levels.append((level_min, level_max, starts[order], counts[order]))
+
+    def _get_str_order(
+        self, min_boxes: np.ndarray, max_boxes: np.ndarray
+    ) -> np.ndarray:
+        """
+        Sorts boxes for STR packing, so consecutive groups of node_capacity boxes form the nodes of the next level
+        :param min_boxes: (N, dim) array of minimal corners
+        :param max_boxes: (N, dim) array of maximal corners
+        :return: order of the boxes
+        """
+        num_boxes, dimension = min_boxes.shape
+        if num_boxes <= self.node_capacity:
+            return np.arange(num_boxes, dtype=np.int64)
+        centers = (min_boxes + max_boxes) * 0.5
+        num_nodes = math.ceil(num_boxes / self.node_capacity)
+        slices = max(1, math.ceil(num_nodes ** (1.0 / dimension)))
+        group = np.zeros(num_boxes, dtype=np.int64)
+        positions = np.arange(num_boxes, dtype=np.int64)
+        for axis in range(dimension - 1):
+            # split every group into slabs along the axis
+            order = np.lexsort((centers[:, axis], group))
+            sorted_group = group[order]
+            rank = positions - np.searchsorted(sorted_group, sorted_group)
+            slab = rank // (self.node_capacity * slices ** (dimension - 1 - axis))
+            changed = np.ones(num_boxes, dtype=bool)
+            changed[1:] = (sorted_group[1:] != sorted_group[:-1]) | (
+                slab[1:] != slab[:-1]
+            )
+            group[order] = np.cumsum(changed) - 1
+        res: np.ndarray = np.lexsort((centers[:, dimension - 1], group))
+        return res
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def get_extent(self) -> Tuple[List[float], List[float]]:
+        """
+        :return: min and max extent of all indexed boxes (empty lists if the index is empty)
+        """
+        if len(self) == 0:
+            return [], []
+        return self._levels[-1][0][0].tolist(), self._levels[-1][1][0].tolist()
+
+    def query_box(self, min_corner: Any, max_corner: Any) -> np.ndarray:
+        """
+        Determines the entries whose bounding box intersects the given box (touching boxes intersect)
+        :param min_corner: minimal corner of the query box
+        :param max_corner: maximal corner of the query box
+        :return: sorted ids of the intersecting entries
+        """
+        low = np.asarray(min_corner, dtype=np.float64)[: self.dimension]
+        high = np.asarray(max_corner, dtype=np.float64)[: self.dimension]
+        positions = self._traverse(
+            lambda mins, maxs: np.all(mins <= high, axis=1)
+            & np.all(maxs >= low, axis=1)
+        )
+        res: np.ndarray = np.sort(self._order[positions])
+        return res
+
+    def query_point(self, point: Any) -> np.ndarray:
+        """
+        Determines the entries whose bounding box contains the given point
+        :param point: query point
+        :return: sorted ids of the entries containing the point
+        """
+        return self.query_box(point, point)
+
+    def nearest(self, point: Any, k: int = 1) -> np.ndarray:
+        """
+        Determines the k entries whose bounding boxes are closest to the given point (best-first search)
+        :param point: query point
+        :param k: number of entries
+        :return: ids of the (at most k) closest entries ordered by their distance
+        """
+        point = np.asarray(point, dtype=np.float64)[: self.dimension]
+        res: List[int] = []
+        if len(self) == 0 or k < 1:
+            return np.asarray(res, dtype=np.int64)
+        top = len(self._levels) - 1
+        root_min, root_max, _, _ = self._levels[top]
+        heap: List[Tuple[float, int, int]] = [
+            (float(self._get_distances(point, root_min, root_max)[0]), top, 0)
+        ]
+        while len(heap) > 0 and len(res) < k:
+            _, depth, position = heapq.heappop(heap)
+            if depth == 0:
+                res.append(int(self._order[position]))
+                continue
+            _, _, starts, counts = self._levels[depth]
+            assert starts is not None and counts is not None
+            children = np.arange(starts[position], starts[position] + counts[position])
+            child_min, child_max, _, _ = self._levels[depth - 1]
+            distances = self._get_distances(
+                point, child_min[children], child_max[children]
+            )
+            for child, distance in zip(children.tolist(), distances.tolist()):
+                heapq.heappush(heap, (distance, depth - 1, child))
+        return np.asarray(res, dtype=np.int64)
+
+    @staticmethod
+    def _get_distances(
+        point: np.ndarray, min_boxes: np.ndarray, max_boxes: np.ndarray
+    ) -> np.ndarray:
+        """
+        :param point: query point
+        :param min_boxes: (N, dim) array of minimal corners
+        :param max_boxes: (N, dim) array of maximal corners
+        :return: squared distances between the point and the boxes (0 for boxes containing the point)
+        """
+        # at most one of both differences is positive per axis
+        offsets = np.maximum(min_boxes - point, 0) + np.maximum(point - max_boxes, 0)
+        res: np.ndarray = np.einsum("ij,ij->i", offsets, offsets)
+        return res
+
+    def _traverse(
+        self, predicate: Callable[[np.ndarray, np.ndarray], np.ndarray]
+    ) -> np.ndarray:
+        """
+        Visits the tree level by level, only descending into the nodes fulfilling the predicate
+        :param predicate: function mapping (N, dim) minimal and maximal corners to a boolean mask
+        :return: leaf positions fulfilling the predicate
+        """
+        if len(self) == 0:
+            return np.zeros(0, dtype=np.int64)
+        candidates = np.zeros(1, dtype=np.int64)
+        for depth in range(len(self._levels) - 1, -1, -1):
+            level_min, level_max, starts, counts = self._levels[depth]
+            hits = candidates[predicate(level_min[candidates], level_max[candidates])]
+            if depth == 0 or len(hits) == 0:
+                return hits
+            assert starts is not None and counts is not None
+            candidates = self._get_children(starts[hits], counts[hits])
+        return candidates
+
+    @staticmethod
+    def _get_children(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+        """
+        :param starts: first child of every node
+        :param counts: number of children of every node
+        :return: positions of all children of the given nodes
+        """
+        total = int(counts.sum())
+        shifts = starts - (np.cumsum(counts) - counts)
+        res: np.ndarray = np.repeat(shifts, counts) + np.arange(total, dtype=np.int64)
+        return res
+
+    def get_objects(self, data: GeoObjectFile, entries: Any) -> List[GeoObject]:
+        """
+        :param data: indexed file
+        :param entries: entry ids (e.g. returned by a query)
+        :return: distinct objects of the given entries ordered by their index in the file
+        """
+        object_ids = np.unique(self.object_ids[np.asarray(entries, dtype=np.int64)])
+        return [data.objects[idx] for idx in object_ids.tolist()]
+
+    @staticmethod
+    def get_index_path(path: str) -> str:
+        """
+        :param path: path of the indexed file
+        :return: path of the index stored next to the file
+        """
+        return f"{path}.sidx"
+
+    def save(self, path: str) -> None:
+        """
+        Stores the index (including the tree, so loading does not require a rebuild) as numpy archive
+        :param path: target path (e.g. determined by get_index_path)
+        :return: None
+        """
+        arrays = {
+            "node_capacity": np.asarray(self.node_capacity),
+            "min_boxes": self.min_boxes,
+            "max_boxes": self.max_boxes,
+            "object_ids": self.object_ids,
+            "face_ids": self.face_ids,
+            "order": self._order,
+        }
+        for depth, (level_min, level_max, starts, counts) in enumerate(self._levels):
+            arrays[f"level_{depth}_min"] = level_min
+            arrays[f"level_{depth}_max"] = level_max
+            if starts is not None and counts is not None:
+                arrays[f"level_{depth}_starts"] = starts
+                arrays[f"level_{depth}_counts"] = counts
+        with open(path, "wb") as file:
+            np.savez(file, **arrays)
+
+    @staticmethod
+    def load(path: str) -> "SpatialIndex":
+        """
+        Loads an index stored with save
+        :param path: path of the stored index
+        :return: loaded index
+        """
+        with np.load(path) as archive:
+            res = SpatialIndex.__new__(SpatialIndex)
+            res.node_capacity = int(archive["node_capacity"])
+            res.min_boxes = archive["min_boxes"]
+            res.max_boxes = archive["max_boxes"]
+            res.object_ids = archive["object_ids"]
+            res.face_ids = archive["face_ids"]
+            res._order = archive["order"]
+            res._levels = []
+            depth = 0
+            while f"level_{depth}_min" in archive:
+                starts = None
+                counts = None
+                if depth > 0:
+                    starts = archive[f"level_{depth}_starts"]
+                    counts = archive[f"level_{depth}_counts"]
+                res._levels.append(
+                    (
+                        archive[f"level_{depth}_min"],
+                        archive[f"level_{depth}_max"],
+                        starts,
+                        counts,
+                    )
+                )
+                depth += 1
+        return res
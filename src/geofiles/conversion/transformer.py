@@ -1,14 +1,23 @@
 import copy
-from typing import Dict, List
+from typing import List, Optional
 
-from geofiles.conversion.calculation import convert_obj_index, get_center, rotate_point
-from geofiles.domain.face import Face
+import numpy as np
+
+from geofiles.conversion.calculation import (
+    apply_affine_matrix,
+    get_affine_matrix,
+    get_center,
+)
+from geofiles.conversion.vertex_welder import VertexWelder
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 
 
 class Transformer:
     """
-    class used to apply different transformations to given GeoObjectFile
+    class used to apply different transformations to given GeoObjectFile.
+    Scaling, rotation and translation are composed to a single 4x4 matrix, which is applied to all vertices at once.
     """
 
     def rotate(
@@ -16,12 +25,14 @@ class Transformer:
         data: GeoObjectFile,
         update_extents: bool = False,
         apply_only_global: bool = True,
+        inplace: bool = False,
     ) -> GeoObjectFile:
         """
         Applies the rotation defined in the given data
         :param data: to be rotated
         :param update_extents: Flag if extents of result should be re-calculated
         :param apply_only_global: Flag that decides if only global transformations should be applied or also local ones
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
         :return: rotated clone of the given data
         """
         return self.transform(
@@ -30,6 +41,7 @@ class Transformer:
             translate=False,
             update_extents=update_extents,
             apply_only_global=apply_only_global,
+            inplace=inplace,
         )
 
     def translate(
@@ -37,12 +49,14 @@ class Transformer:
         data: GeoObjectFile,
         update_extents: bool = False,
         apply_only_global: bool = True,
+        inplace: bool = False,
     ) -> GeoObjectFile:
         """
         Applies the translation defined in the given data
         :param data: to be translated
         :param update_extents: Flag if extents of result should be re-calculated
         :param apply_only_global: Flag that decides if only global transformations should be applied or also local ones
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
         :return: rotated clone of the given data
         """
         return self.transform(
@@ -51,6 +65,7 @@ class Transformer:
             scale=False,
             update_extents=update_extents,
             apply_only_global=apply_only_global,
+            inplace=inplace,
         )
 
     def scale(
@@ -58,12 +73,14 @@ class Transformer:
         data: GeoObjectFile,
         update_extents: bool = False,
         apply_only_global: bool = True,
+        inplace: bool = False,
     ) -> GeoObjectFile:
         """
         Applies the scaling defined in the given data
         :param data: to be rotated
         :param update_extents: Flag if extents of result should be re-calculated
         :param apply_only_global: Flag that decides if only global transformations should be applied or also local ones
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
         :return: scaled clone of the given data
         """
         return self.transform(
@@ -72,6 +89,7 @@ class Transformer:
             translate=False,
             update_extents=update_extents,
             apply_only_global=apply_only_global,
+            inplace=inplace,
         )
 
     @staticmethod
@@ -82,6 +100,7 @@ class Transformer:
         translate: bool = True,
         update_extents: bool = False,
         apply_only_global: bool = True,
+        inplace: bool = False,
     ) -> GeoObjectFile:
         """
         Applies the scaling, rotation and translation for the given data
@@ -91,6 +110,7 @@ class Transformer:
         :param translate: Flag if translation should be applied
         :param update_extents: Flag if extents of result should be re-calculated
         :param apply_only_global: Flag that decides if only global transformations should be applied or also local ones
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
         :return: transformed clone of the given data
         """
         if not data.is_origin_based():
@@ -106,109 +126,21 @@ class Transformer:
                 "Function only supported for translation information using metres (m)"
             )
 
-        res = copy.deepcopy(data)
-        scaling: List[float]
-        if scale and res.scaling is not None:
-            scaling = res.scaling
+        res = data if inplace else data.shallow_copy()
+        matrix = Transformer.get_transformation_matrix(res, scale, rotate, translate)
+        if scale:
             res.scaling = None
-        else:
-            scaling = [1, 1, 1]
-
-        rotation: List[float]
-        if rotate and res.rotation is not None:
-            rotation = res.rotation
+        if rotate:
             res.rotation = None
-        else:
-            rotation = [0, 0, 0]
-
-        translation: List[float]
-        if translate and res.translation is not None:
-            translation = res.translation
+        if translate:
             res.translation = None
-        else:
-            translation = [0, 0, 0]
-
-        center = get_center(res.vertices)
-
-        new_vertices = []
-
-        for vertex in res.vertices:
-            new_vertices.append(
-                Transformer._transform_vertex(
-                    vertex, center, scaling, rotation, translation
-                )
-            )
-        res.vertices = new_vertices
+        res.set_vertex_array(apply_affine_matrix(res.get_vertex_array(), matrix))
 
         if not apply_only_global:
-            center = get_center(res.vertices)
-            vertex_index_mapping: Dict[str, int] = dict()
-            transformed_vertices = []
-            counter = 1
-            for geoobj in res.objects:
-                if (
-                    geoobj.contains_translation()
-                    or geoobj.contains_rotation()
-                    or geoobj.contains_translation()
-                ):
-                    if geoobj.translation is not None and geoobj.contains_translation():
-                        local_translation = geoobj.translation
-                        geoobj.translation = None
-                    else:
-                        local_translation = [0, 0, 0]
-
-                    if geoobj.rotation is not None and geoobj.contains_rotation():
-                        local_rotation = geoobj.rotation
-                        geoobj.rotation = None
-                    else:
-                        local_rotation = [0, 0, 0]
-
-                    if geoobj.scaling is not None and geoobj.contains_scaling():
-                        local_scaling = geoobj.scaling
-                        geoobj.scaling = None
-                    else:
-                        local_scaling = [1, 1, 1]
-                    new_faces = []
-                    for face in geoobj.faces:
-                        new_face = Face()
-                        for idx in face.indices:
-                            vertex = res.vertices[convert_obj_index(idx, res.vertices)]
-                            transformed = Transformer._transform_vertex(
-                                vertex,
-                                center,
-                                local_scaling,
-                                local_rotation,
-                                local_translation,
-                            )
-                            string_representation = " ".join(
-                                [str(a) for a in transformed]
-                            )
-                            if vertex_index_mapping.get(string_representation) is None:
-                                vertex_index_mapping[string_representation] = counter
-                                transformed_vertices.append(transformed)
-                                counter += 1
-                            new_face.indices.append(
-                                vertex_index_mapping[string_representation]
-                            )
-                        new_faces.append(new_face)
-                    geoobj.faces = new_faces
-                else:
-                    new_faces = []
-                    for face in geoobj.faces:
-                        new_face = Face()
-                        for idx in face.indices:
-                            vertex = res.vertices[convert_obj_index(idx, res.vertices)]
-                            string_representation = " ".join([str(a) for a in vertex])
-                            if vertex_index_mapping.get(string_representation) is None:
-                                vertex_index_mapping[string_representation] = counter
-                                transformed_vertices.append(vertex)
-                                counter += 1
-                            new_face.indices.append(
-                                vertex_index_mapping[string_representation]
-                            )
-                        new_faces.append(new_face)
-                    geoobj.faces = new_faces
-            res.vertices = transformed_vertices
+            if not inplace:
+                # local transformations and new faces are set on the objects, so they must not be shared
+                res.objects = Transformer._copy_objects(res.objects)
+            Transformer._apply_local_transformations(res)
 
         res.min_extent = []
         res.max_extent = []
@@ -218,30 +150,142 @@ class Transformer:
         return res
 
     @staticmethod
-    def _transform_vertex(
-        vertex: List[float],
-        center: List[float],
-        scaling: List[float],
-        rotation: List[float],
-        translation: List[float],
-    ) -> List[float]:
-        """
-        Transforms the given vertex using the params
-        :param center: Center of all vertices
-        :param scaling: To be applied
-        :param rotation: To be applied
-        :param translation: To be applied
-        :returns: transformed vertex
-        """
-        # recenter around (0,0,0) and scale it
-        new_vertex = [
-            (v_i - c_i) * s_i for v_i, c_i, s_i in zip(vertex, center, scaling)
-        ]
-        rotated = rotate_point(
-            new_vertex, [0, 0, 0], rotation[0], rotation[1], rotation[2]
+    def _copy_objects(objects: List[GeoObject]) -> List[GeoObject]:
+        """
+        Creates shallow copies of the given objects while maintaining their hierarchy
+        :param objects: to be copied
+        :return: copied objects
+        """
+        copies = {id(geoobj): copy.copy(geoobj) for geoobj in objects}
+        for copied in copies.values():
+            if copied.parent is not None and id(copied.parent) in copies:
+                copied.parent = copies[id(copied.parent)]
+        return [copies[id(geoobj)] for geoobj in objects]
+
+    @staticmethod
+    def _apply_local_transformations(data: GeoObjectFile) -> None:
+        """
+        Applies the transformations of the individual objects (in place). Every object transforms the block of
+        vertices referenced by its faces, afterwards equal vertices of all blocks are merged and the face indices
+        are remapped. Vertices not referenced by any face are removed.
+        :param data: to be transformed
+        :return: None
+        """
+        vertices = data.get_vertex_array()
+        center = get_center(vertices)
+        blocks: List[np.ndarray] = []
+        tables: List[FaceTable] = []
+        for geoobj in data.objects:
+            table = geoobj.get_face_table()
+            block = vertices[table.get_zero_based_indices(len(vertices))]
+            if (
+                geoobj.contains_translation()
+                or geoobj.contains_rotation()
+                or geoobj.contains_scaling()
+            ):
+                local_matrix = Transformer.get_object_transformation_matrix(
+                    geoobj, center
+                )
+                geoobj.translation = None
+                geoobj.rotation = None
+                geoobj.scaling = None
+                block = apply_affine_matrix(block, local_matrix)
+            blocks.append(block)
+            tables.append(table)
+
+        points = (
+            np.concatenate(blocks)
+            if len(blocks) > 0
+            else np.zeros((0, vertices.shape[1]))
         )
-        # recenter around origin
-        rotated = [
-            c_i + r_i + t_i for c_i, r_i, t_i in zip(center, rotated, translation)
-        ]
-        return rotated
+        unique, inverse = VertexWelder.get_unique_vertices(points)
+        start = 0
+        for geoobj, table in zip(data.objects, tables):
+            end = start + len(table.indices)
+            faces = FaceTable.from_arrays(inverse[start:end] + 1, table.offsets)
+            geoobj.faces = faces if geoobj.is_packed() else faces.to_faces()
+            start = end
+        data.set_vertex_array(points[unique])
+
+    @staticmethod
+    def get_transformation_matrix(
+        data: GeoObjectFile,
+        scale: bool = True,
+        rotate: bool = True,
+        translate: bool = True,
+        center: Optional[List[float]] = None,
+    ) -> np.ndarray:
+        """
+        Composes the global transformations of the given data to a single matrix, without modifying the data.
+        The matrices of multiple transformations can be chained by multiplying them before applying them.
+        :param data: containing the transformation information
+        :param scale: Flag if scaling should be included
+        :param rotate: Flag if rotation should be included
+        :param translate: Flag if translation should be included
+        :param center: center of the scaling and rotation (if None, the center of all vertices is used)
+        :return: 4x4 matrix representing the transformations
+        """
+        if center is None:
+            center = get_center(data.get_vertex_array())
+        return get_affine_matrix(
+            center,
+            data.scaling if scale and data.scaling is not None else [1, 1, 1],
+            data.rotation if rotate and data.rotation is not None else [0, 0, 0],
+            (
+                data.translation
+                if translate and data.translation is not None
+                else [0, 0, 0]
+            ),
+        )
+
+    @staticmethod
+    def get_object_transformation_matrix(
+        geoobj: GeoObject, center: List[float]
+    ) -> np.ndarray:
+        """
+        Composes the local transformations of the given object to a single matrix, without modifying the object
+        :param geoobj: containing the transformation information
+        :param center: center of the scaling and rotation
+        :return: 4x4 matrix representing the transformations
+        """
+        return get_affine_matrix(
+            center,
+            (
+                geoobj.scaling
+                if geoobj.scaling is not None and geoobj.contains_scaling()
+                else [1, 1, 1]
+            ),
+            (
+                geoobj.rotation
+                if geoobj.rotation is not None and geoobj.contains_rotation()
+                else [0, 0, 0]
+            ),
+            (
+                geoobj.translation
+                if geoobj.translation is not None and geoobj.contains_translation()
+                else [0, 0, 0]
+            ),
+        )
+
+    @staticmethod
+    def apply_matrix(
+        data: GeoObjectFile,
+        matrix: np.ndarray,
+        update_extents: bool = False,
+        inplace: bool = False,
+    ) -> GeoObjectFile:
+        """
+        Applies the given transformation matrix to all vertices, the transformation information of the data is kept
+        :param data: to be transformed
+        :param matrix: 4x4 matrix e.g. composed by get_transformation_matrix
+        :param update_extents: Flag if extents of result should be re-calculated
+        :param inplace: If true, the given data is modified, else a structural copy sharing all untouched parts is returned
+        :return: transformed data
+        """
+        res = data if inplace else data.shallow_copy()
+        res.set_vertex_array(apply_affine_matrix(res.get_vertex_array(), matrix))
+        res.min_extent = []
+        res.max_extent = []
+        if update_extents:
+            res.update_extent()
+        return res
@@ -0,0 +1,168 @@
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+import pyproj
+from pyproj import Geod
+from pyproj.aoi import AreaOfInterest
+
+
+class CrsTransformerCache:
+    """
+    Bounded, thread-safe least recently used cache of pyproj transformation pipelines.
+    Creating a pyproj.Transformer queries the PROJ database, which is often more expensive than converting a small
+    file, so transformers are created once per (source, target, always_xy, area of interest) and reused afterwards.
+    pyproj transformers are thread-safe themselves, so cached instances may be shared between threads.
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        """
+        :param max_size: maximum number of cached transformers, the least recently used one is evicted first
+        """
+        if max_size < 1:
+            raise Exception("Cache size must be at least 1")
+        self.max_size = max_size
+        self._transformers: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._geods: Dict[str, Geod] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def get_key(
+        source: Any,
+        target: Any,
+        always_xy: bool = True,
+        area_of_interest: Optional[Any] = None,
+    ) -> Tuple[Any, ...]:
+        """
+        :param source: source coordinate system
+        :param target: target coordinate system
+        :param always_xy: If true, the transformer uses the traditional GIS axis order
+        :param area_of_interest: optional pyproj.aoi.AreaOfInterest or (west, south, east, north) tuple
+        :return: key identifying the transformer in the cache
+        """
+        if area_of_interest is not None and not isinstance(area_of_interest, tuple):
+            area_of_interest = (
+                area_of_interest.west_lon_degree,
+                area_of_interest.south_lat_degree,
+                area_of_interest.east_lon_degree,
+                area_of_interest.north_lat_degree,
+            )
+        return source, target, bool(always_xy), area_of_interest
+
+    def get_transformer(
+        self,
+        source: Any,
+        target: Any,
+        always_xy: bool = True,
+        area_of_interest: Optional[Any] = None,
+    ) -> Any:
+        """
+        Returns the cached transformer for the given coordinate systems or creates it
+        :param source: source coordinate system (anything accepted by pyproj.Transformer.from_crs)
+        :param target: target coordinate system (anything accepted by pyproj.Transformer.from_crs)
+        :param always_xy: If true, the transformer uses the traditional GIS axis order
+        :param area_of_interest: optional pyproj.aoi.AreaOfInterest or (west, south, east, north) tuple used to
+        select the transformation pipeline
+        :return: pyproj.Transformer
+        """
+        key = self.get_key(source, target, always_xy, area_of_interest)
+        with self._lock:
+            transformer = self._transformers.get(key)
+            if transformer is not None:
+                self._transformers.move_to_end(key)
+                self.hits += 1
+                return transformer
+            self.misses += 1
+
+        # the pipeline is created outside of the lock, so other lookups are not blocked by the PROJ database
+        aoi = None
+        if key[3] is not None:
+            aoi = AreaOfInterest(*key[3])
+        transformer = pyproj.Transformer.from_crs(
+            source, target, always_xy=always_xy, area_of_interest=aoi
+        )
+
+        with self._lock:
+            existing = self._transformers.get(key)
+            if existing is not None:
+                # another thread created the same transformer in the meantime
+                self._transformers.move_to_end(key)
+                return existing
+            self._transformers[key] = transformer
+            while len(self._transformers) > self.max_size:
+                self._transformers.popitem(last=False)
+                self.evictions += 1
+        return transformer
+
+    def get_geod(self, ellps: str = "WGS84") -> Geod:
+        """
+        :param ellps: name of the ellipsoid
+        :return: cached pyproj.Geod instance for the given ellipsoid
+        """
+        with self._lock:
+            geod = self._geods.get(ellps)
+            if geod is None:
+                geod = Geod(ellps=ellps)
+                self._geods[ellps] = geod
+            return geod
+
+    def invalidate(self, source: Any = None, target: Any = None) -> int:
+        """
+        Removes cached transformers, e.g. after the PROJ database or grids were updated
+        :param source: if given, only transformers from this coordinate system are removed
+        :param target: if given, only transformers to this coordinate system are removed
+        :return: number of removed transformers
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._transformers
+                if (source is None or key[0] == source)
+                and (target is None or key[1] == target)
+            ]
+            for key in keys:
+                del self._transformers[key]
+            if source is None and target is None:
+                self._geods.clear()
+            return len(keys)
+
+    def clear(self) -> None:
+        """
+        Removes all cached transformers and resets the statistics
+        :return: None
+        """
+        with self._lock:
+            self._transformers.clear()
+            self._geods.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        :return: number of cache hits, misses, evictions as well as the current and maximum size of the cache
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._transformers),
+                "max_size": self.max_size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._transformers)
+
+
+_default_cache = CrsTransformerCache()
+
+
+def get_default_transformer_cache() -> CrsTransformerCache:
+    """
+    :return: process-wide transformer cache used by the converters if no other cache is given
+    """
+    return _default_cache
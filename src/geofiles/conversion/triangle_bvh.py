@@ -0,0 +1,377 @@
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+
+from geofiles.domain.geo_object_file import GeoObjectFile
+
+
+class TriangleBvh:
+    """
+    Bounding volume hierarchy over the triangulated faces of a GeoObjectFile for ray casting (e.g. picking and
+    line-of-sight queries). The triangles are sorted along a Morton curve of their centroids, consecutive
+    triangles form the leaves and consecutive nodes are grouped level by level up to a single root, so the build
+    is dominated by a single O(N log N) sort.
+    Batches of rays are traversed breadth first: all (ray, node) pairs of a level are tested at once, the pairs
+    reaching the leaves are intersected with the triangles by the Moeller-Trumbore algorithm.
+
+    Rays are given by origins and directions, distances are measured in multiples of the direction vectors.
+    Triangles are reordered during the build, so triangle ids refer to the triangles attribute (and to object_ids
+    and face_ids), not to the order used for building.
+    """
+
+    def __init__(
+        self,
+        vertices: Any,
+        triangles: Any,
+        object_ids: Any = None,
+        face_ids: Any = None,
+        object_names: Optional[List[str]] = None,
+        leaf_size: int = 4,
+        branching: int = 4,
+    ) -> None:
+        """
+        Builds the hierarchy for the given triangles
+        :param vertices: (N, 3) array of vertices
+        :param triangles: (T, 3) array of zero based vertex indices
+        :param object_ids: index of the object every triangle belongs to
+        :param face_ids: index of the face (within its object) every triangle was created from
+        :param object_names: names of the objects (referenced by object_ids)
+        :param leaf_size: maximum number of triangles of a leaf
+        :param branching: maximum number of children of an inner node
+        """
+        if leaf_size < 1 or branching < 2:
+            raise Exception("Leaves require at least 1 triangle and nodes 2 children")
+        self.leaf_size = leaf_size
+        self.branching = branching
+        self.vertices = np.ascontiguousarray(
+            np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        )
+        triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        if object_ids is None:
+            object_ids = np.zeros(len(triangles), dtype=np.int64)
+        if face_ids is None:
+            face_ids = np.arange(len(triangles), dtype=np.int64)
+        self.object_names = object_names if object_names is not None else []
+
+        order = self._get_morton_order(triangles)
+        self.triangles = triangles[order]
+        self.object_ids = np.asarray(object_ids, dtype=np.int64)[order]
+        self.face_ids = np.asarray(face_ids, dtype=np.int64)[order]
+        # minimal and maximal corners per level, leaves first
+        self._levels: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._build()
+
+    @staticmethod
+    def from_file(
+        data: GeoObjectFile, leaf_size: int = 4, branching: int = 4
+    ) -> "TriangleBvh":
+        """
+        Creates the hierarchy over the (fan triangulated) faces of all objects. Local transformations of the file
+        and its objects are not applied.
+        :param data: local or origin based file
+        :param leaf_size: maximum number of triangles of a leaf
+        :param branching: maximum number of children of an inner node
+        :return: hierarchy, whose triangles reference the objects and faces of the file
+        """
+        if data.is_geo_referenced() and not data.is_origin_based():
+            raise Exception(
+                "Function only supported for local or origin based representations"
+            )
+        vertices = data.get_vertex_array()
+        triangles = [np.zeros((0, 3), dtype=np.int64)]
+        object_ids = [np.zeros(0, dtype=np.int64)]
+        face_ids = [np.zeros(0, dtype=np.int64)]
+        for idx, geoobj in enumerate(data.objects):
+            table, triangle_faces = geoobj.get_face_table().triangulate()
+            triangles.append(table.get_zero_based_indices(len(vertices)).reshape(-1, 3))
+            object_ids.append(np.full(len(triangle_faces), idx, dtype=np.int64))
+            face_ids.append(triangle_faces.astype(np.int64))
+        return TriangleBvh(
+            vertices[:, :3] if len(vertices) > 0 else np.zeros((0, 3)),
+            np.concatenate(triangles),
+            np.concatenate(object_ids),
+            np.concatenate(face_ids),
+            [geoobj.name for geoobj in data.objects],
+            leaf_size,
+            branching,
+        )
+
+    def _get_morton_order(self, triangles: np.ndarray) -> np.ndarray:
+        """
+        :param triangles: (T, 3) array of zero based vertex indices
+        :return: order of the triangles along a Morton curve (30 bit codes) of their centroids
+        """
+        if len(triangles) == 0:
+            return np.zeros(0, dtype=np.int64)
+        centroids = self.vertices[triangles].mean(axis=1)
+        low = centroids.min(axis=0)
+        size = np.maximum(centroids.max(axis=0) - low, 1e-12)
+        cells = np.minimum((centroids - low) / size * 1024, 1023).astype(np.uint64)
+        codes = np.zeros(len(triangles), dtype=np.uint64)
+        for axis in range(3):
+            # spread the 10 bits of the cell index, so 2 zero bits follow every bit
+            bits = cells[:, axis]
+            bits = (bits | (bits << np.uint64(16))) & np.uint64(0x030000FF)
+            bits = (bits | (bits << np.uint64(8))) & np.uint64(0x0300F00F)
+            bits = (bits | (bits << np.uint64(4))) & np.uint64(0x030C30C3)
+            bits = (bits | (bits << np.uint64(2))) & np.uint64(0x09249249)
+            codes |= bits << np.uint64(2 - axis)
+        res: np.ndarray = np.argsort(codes, kind="stable")
+        return res
+
+    def _build(self) -> None:
+        """
+        Determines the bounding boxes of all levels
+        :return: None
+        """
+        corners = self.vertices[self.triangles]
+        level_min = corners.min(axis=1)
+        level_max = corners.max(axis=1)
+        group_size = self.leaf_size
+        while True:
+            starts = np.arange(0, len(level_min), group_size, dtype=np.int64)
+            if len(starts) == 0:
+                break
+            level_min = np.minimum.reduceat(level_min, starts, axis=0)
+            level_max = np.maximum.reduceat(level_max, starts, axis=0)
+            self._levels.append((level_min, level_max))
+            if len(level_min) == 1:
+                break
+            group_size = self.branching
+
+    def __len__(self) -> int:
+        return len(self.triangles)
+
+    def intersect(
+        self,
+        origins: Any,
+        directions: Any,
+        max_distance: Any = np.inf,
+        min_distance: float = 0.0,
+        chunk_size: int = 4096,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Determines the closest hit of every ray
+        :param origins: (R, 3) array of ray origins
+        :param directions: (R, 3) array of ray directions
+        :param max_distance: maximal distance of hits (scalar or one value per ray)
+        :param min_distance: minimal distance of hits (e.g. to ignore the surface a ray starts on)
+        :param chunk_size: number of rays traversed at once
+        :return: distance of the closest hit (inf if the ray does not hit),
+        id of the hit triangle (-1 if the ray does not hit)
+        """
+        origins, directions, max_distances = self._get_rays(
+            origins, directions, max_distance
+        )
+        distances = np.full(len(origins), np.inf)
+        triangle_ids = np.full(len(origins), -1, dtype=np.int64)
+        for start in range(0, len(origins), chunk_size):
+            end = start + chunk_size
+            rays, triangles, hits = self._get_hits(
+                origins[start:end],
+                directions[start:end],
+                max_distances[start:end],
+                min_distance,
+            )
+            valid = np.isfinite(hits)
+            rays, triangles, hits = rays[valid], triangles[valid], hits[valid]
+            # the first hit per ray after sorting by ray and distance is the closest one
+            order = np.lexsort((hits, rays))
+            rays, triangles, hits = rays[order], triangles[order], hits[order]
+            first = np.ones(len(rays), dtype=bool)
+            first[1:] = rays[1:] != rays[:-1]
+            distances[start + rays[first]] = hits[first]
+            triangle_ids[start + rays[first]] = triangles[first]
+        return distances, triangle_ids
+
+    def intersects(
+        self,
+        origins: Any,
+        directions: Any,
+        max_distance: Any = np.inf,
+        min_distance: float = 0.0,
+        chunk_size: int = 4096,
+    ) -> np.ndarray:
+        """
+        Determines if the rays hit any triangle
+        :param origins: (R, 3) array of ray origins
+        :param directions: (R, 3) array of ray directions
+        :param max_distance: maximal distance of hits (scalar or one value per ray)
+        :param min_distance: minimal distance of hits (e.g. to ignore the surface a ray starts on)
+        :param chunk_size: number of rays traversed at once
+        :return: boolean array, true for rays hitting a triangle
+        """
+        origins, directions, max_distances = self._get_rays(
+            origins, directions, max_distance
+        )
+        res = np.zeros(len(origins), dtype=bool)
+        for start in range(0, len(origins), chunk_size):
+            end = start + chunk_size
+            rays, _, hits = self._get_hits(
+                origins[start:end],
+                directions[start:end],
+                max_distances[start:end],
+                min_distance,
+            )
+            res[start + rays[np.isfinite(hits)]] = True
+        return res
+
+    def is_visible(
+        self, start_points: Any, end_points: Any, tolerance: float = 1e-6
+    ) -> np.ndarray:
+        """
+        Line-of-sight test between pairs of points
+        :param start_points: (R, 3) array of observer positions
+        :param end_points: (R, 3) array of target positions
+        :param tolerance: relative part of the segment ignored at both ends (so surfaces the points lie on are ignored)
+        :return: boolean array, true if no triangle is between the points
+        """
+        start_points = np.asarray(start_points, dtype=np.float64).reshape(-1, 3)
+        end_points = np.asarray(end_points, dtype=np.float64).reshape(-1, 3)
+        return ~self.intersects(
+            start_points, end_points - start_points, 1.0 - tolerance, tolerance
+        )
+
+    def get_names(self, triangle_ids: Any) -> List[Optional[str]]:
+        """
+        :param triangle_ids: triangle ids (e.g. returned by intersect, -1 for rays without hit)
+        :return: name of the object of every triangle (None for rays without hit)
+        """
+        res: List[Optional[str]] = []
+        for triangle_id in np.asarray(triangle_ids, dtype=np.int64).tolist():
+            if triangle_id < 0:
+                res.append(None)
+            else:
+                res.append(self.object_names[int(self.object_ids[triangle_id])])
+        return res
+
+    @staticmethod
+    def _get_rays(
+        origins: Any, directions: Any, max_distance: Any
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        :return: origins, directions and maximal distances as arrays with one row per ray
+        """
+        origins = np.asarray(origins, dtype=np.float64).reshape(-1, 3)
+        directions = np.asarray(directions, dtype=np.float64).reshape(-1, 3)
+        if origins.shape != directions.shape:
+            raise Exception("Number of origins and directions must match")
+        max_distances = np.broadcast_to(
+            np.asarray(max_distance, dtype=np.float64), (len(origins),)
+        )
+        return origins, directions, max_distances
+
+    def _get_hits(
+        self,
+        origins: np.ndarray,
+        directions: np.ndarray,
+        max_distances: np.ndarray,
+        min_distance: float,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Traverses the hierarchy with a chunk of rays
+        :return: ray ids, triangle ids and hit distances (inf for misses) of all tested (ray, triangle) pairs
+        """
+        empty = np.zeros(0, dtype=np.int64)
+        if len(self) == 0 or len(origins) == 0:
+            return empty, empty, np.zeros(0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse = 1.0 / directions
+        rays = np.arange(len(origins), dtype=np.int64)
+        nodes = np.zeros(len(origins), dtype=np.int64)
+        for depth in range(len(self._levels) - 1, -1, -1):
+            level_min, level_max = self._levels[depth]
+            hit = self._intersect_boxes(
+                origins[rays],
+                inverse[rays],
+                level_min[nodes],
+                level_max[nodes],
+                min_distance,
+                max_distances[rays],
+            )
+            rays, nodes = rays[hit], nodes[hit]
+            if len(rays) == 0:
+                return empty, empty, np.zeros(0)
+            group_size = self.leaf_size if depth == 0 else self.branching
+            num_children = len(self.triangles)
+            if depth > 0:
+                num_children = len(self._levels[depth - 1][0])
+            rays, nodes = self._get_children(rays, nodes, group_size, num_children)
+
+        distances = self._intersect_triangles(
+            origins[rays], directions[rays], self.triangles[nodes]
+        )
+        distances[(distances < min_distance) | (distances > max_distances[rays])] = (
+            np.inf
+        )
+        return rays, nodes, distances
+
+    @staticmethod
+    def _get_children(
+        rays: np.ndarray, nodes: np.ndarray, group_size: int, num_children: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Expands (ray, node) pairs to the pairs of the ray and the children of the node
+        :param rays: ray of every pair
+        :param nodes: node of every pair
+        :param group_size: maximum number of children per node
+        :param num_children: number of nodes (or triangles) of the child level
+        :return: rays and children of the expanded pairs
+        """
+        starts = nodes * group_size
+        counts = np.minimum(group_size, num_children - starts)
+        total = int(counts.sum())
+        shifts = starts - (np.cumsum(counts) - counts)
+        children = np.repeat(shifts, counts) + np.arange(total, dtype=np.int64)
+        return np.repeat(rays, counts), children
+
+    @staticmethod
+    def _intersect_boxes(
+        origins: np.ndarray,
+        inverse: np.ndarray,
+        min_boxes: np.ndarray,
+        max_boxes: np.ndarray,
+        min_distance: float,
+        max_distances: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Slab test of rays and boxes (pairwise)
+        :return: boolean array, true if the ray hits the box within the distance range
+        """
+        with np.errstate(invalid="ignore"):
+            first = (min_boxes - origins) * inverse
+            second = (max_boxes - origins) * inverse
+        # fmin / fmax ignore nan, which results from rays within the plane of a slab (0 * inf)
+        near = np.fmax.reduce(np.fmin(first, second), axis=1)
+        far = np.fmin.reduce(np.fmax(first, second), axis=1)
+        res: np.ndarray = (
+            (near <= far) & (far >= min_distance) & (near <= max_distances)
+        )
+        return res
+
+    def _intersect_triangles(
+        self, origins: np.ndarray, directions: np.ndarray, triangles: np.ndarray
+    ) -> np.ndarray:
+        """
+        Moeller-Trumbore intersection of rays and triangles (pairwise, both sides of the triangles are hit)
+        :param origins: (P, 3) array of ray origins
+        :param directions: (P, 3) array of ray directions
+        :param triangles: (P, 3) array of zero based vertex indices
+        :return: hit distances (inf for misses)
+        """
+        first = self.vertices[triangles[:, 0]]
+        edge1 = self.vertices[triangles[:, 1]] - first
+        edge2 = self.vertices[triangles[:, 2]] - first
+        normal = np.cross(directions, edge2)
+        determinant = np.einsum("ij,ij->i", edge1, normal)
+        valid = np.abs(determinant) > 1e-12
+        with np.errstate(divide="ignore", invalid="ignore"):
+            inverse = 1.0 / determinant
+            offset = origins - first
+            u = np.einsum("ij,ij->i", offset, normal) * inverse
+            cross = np.cross(offset, edge1)
+            v = np.einsum("ij,ij->i", directions, cross) * inverse
+            distances = np.einsum("ij,ij->i", edge2, cross) * inverse
+            valid &= (u >= 0) & (v >= 0) & (u + v <= 1)
+        res: np.ndarray = np.where(valid, distances, np.inf)
+        return res
@@ -0,0 +1,105 @@
+from typing import Tuple
+
+import numpy as np
+
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_object_file import GeoObjectFile
+
+
+class VertexWelder:
+    """
+    Merges vertices sharing the same position and updates the faces referencing them.
+    Positions are compared numerically, either exactly or after quantizing them to a grid with the given epsilon.
+    """
+
+    @staticmethod
+    def get_unique_vertices(
+        vertices: np.ndarray, epsilon: float = 0.0
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Determines the distinct vertices of the given array in a single sort based pass
+        :param vertices: (N, dim) array of vertices
+        :param epsilon: grid size used for quantizing the vertices, vertices in the same grid cell are merged.
+        If 0, only vertices with exactly the same coordinates are merged
+        :return: sorted ids of the first occurrence of every distinct vertex,
+        inverse mapping every vertex to the index of its representative in the resulting vertex array
+        """
+        vertices = np.asarray(vertices, dtype=np.float64)
+        num_vertices = len(vertices)
+        if num_vertices == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        if epsilon > 0:
+            keys = np.floor(vertices / epsilon + 0.5)
+        else:
+            keys = vertices
+        # adding 0.0 maps -0.0 to 0.0
+        keys = np.ascontiguousarray(keys + 0.0)
+
+        # sort by a hash of the bit patterns, equal vertices are adjacent afterwards
+        bits = keys.view(np.uint64)
+        hashes = np.zeros(num_vertices, dtype=np.uint64)
+        for column in range(bits.shape[1]):
+            hashes ^= bits[:, column]
+            hashes *= np.uint64(0x9E3779B97F4A7C15)
+            hashes ^= hashes >> np.uint64(29)
+        order = np.argsort(hashes, kind="stable")
+        sorted_keys = keys[order]
+        different = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+        sorted_hashes = hashes[order]
+        if np.any(different & (sorted_hashes[1:] == sorted_hashes[:-1])):
+            # hash collision of different vertices, fall back to a lexicographic sort
+            order = np.lexsort(keys.T[::-1])
+            sorted_keys = keys[order]
+            different = np.any(sorted_keys[1:] != sorted_keys[:-1], axis=1)
+        new_group = np.ones(num_vertices, dtype=bool)
+        new_group[1:] = different
+        group = np.cumsum(new_group) - 1
+
+        # both sorts are stable, so the first element of every group is its first occurrence
+        first = order[new_group]
+        rank = np.empty(len(first), dtype=np.int64)
+        rank[np.argsort(first)] = np.arange(len(first))
+        inverse = np.empty(num_vertices, dtype=np.int64)
+        inverse[order] = rank[group]
+        return np.sort(first), inverse
+
+    @staticmethod
+    def weld(data: GeoObjectFile, epsilon: float = 0.0) -> GeoObjectFile:
+        """
+        Welds the vertices of the given file (in place), the first occurrence of every vertex is kept
+        :param data: to be welded
+        :param epsilon: grid size used for quantizing the vertices (0 for exact matches)
+        :return: the welded file
+        """
+        num_vertices = len(data.vertices)
+        if num_vertices == 0:
+            return data
+
+        unique, inverse = VertexWelder.get_unique_vertices(
+            data.get_vertex_array(), epsilon
+        )
+        if len(unique) == num_vertices:
+            return data
+
+        data.set_vertex_array(data.get_vertex_array()[unique])
+        # obj style indices: index i refers to position i - 1, index -i refers to position num_vertices - i
+        lookup = np.concatenate([inverse + 1, [0], inverse + 1])
+        lookup_list = None
+        for geo_object in data.objects:
+            if geo_object.is_packed():
+                table = geo_object.faces
+                geo_object.faces = FaceTable.from_arrays(
+                    lookup[table.indices.astype(np.int64) + num_vertices],
+                    table.offsets,
+                    table.normal_indices,
+                    table.normal_offsets,
+                    table.texture_coordinates,
+                    table.texture_offsets,
+                )
+            else:
+                if lookup_list is None:
+                    lookup_list = lookup.tolist()
+                for face in geo_object.faces:
+                    face.indices = [lookup_list[i + num_vertices] for i in face.indices]
+        return data
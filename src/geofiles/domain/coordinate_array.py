@@ -0,0 +1,145 @@
+from typing import Any, Iterator, List, Optional
+
+import numpy as np
+
+from geofiles.domain.growable_array import GrowableArray
+
+
+class CoordinateArray:
+    """
+    List-compatible view on a contiguous (N, dim) numpy array of coordinates.
+    Element access returns plain python lists, so code written for List[List[float]] keeps working,
+    while the underlying array can be accessed via the array property for vectorized operations.
+    """
+
+    def __init__(self, data: Any = None, dtype: Any = np.float64) -> None:
+        """
+        Initializes a CoordinateArray
+        :param data: optional initial coordinates (numpy array, CoordinateArray or list of coordinates)
+        :param dtype: data type used for storing the coordinates (np.float64 or np.float32)
+        """
+        if isinstance(data, CoordinateArray):
+            data = data.array.copy()
+        if data is None or (not isinstance(data, np.ndarray) and len(data) == 0):
+            self._data = GrowableArray(dtype=dtype, row_shape=(0,))
+        else:
+            array = np.asarray(data)
+            if array.dtype != dtype:
+                array = array.astype(dtype)
+            if array.ndim != 2:
+                raise Exception(
+                    f"Coordinates must be two-dimensional, but got shape {array.shape}"
+                )
+            self._data = GrowableArray(array)
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        :return: (N, dim) array of all coordinates (view, no copy)
+        """
+        return self._data.array
+
+    @property
+    def dtype(self) -> Any:
+        """
+        :return: data type of the coordinates
+        """
+        return self._data.dtype
+
+    @property
+    def dimension(self) -> int:
+        """
+        :return: number of components per coordinate (0 as long as no coordinate is stored)
+        """
+        return self._data.row_shape[0]
+
+    def append(self, coordinate: Any) -> None:
+        """
+        Appends a single coordinate
+        :param coordinate: to be appended
+        :return: None
+        """
+        if len(self._data) == 0 and self.dimension != len(coordinate):
+            self._data.set_row_shape((len(coordinate),))
+        elif len(coordinate) != self.dimension:
+            raise Exception(
+                f"Coordinate {coordinate} does not match dimension {self.dimension}"
+            )
+        self._data.append(coordinate)
+
+    def extend(self, coordinates: Any) -> None:
+        """
+        Appends multiple coordinates
+        :param coordinates: to be appended
+        :return: None
+        """
+        coordinates = np.asarray(coordinates, dtype=self.dtype)
+        if len(coordinates) == 0:
+            return
+        if len(self._data) == 0 and self.dimension != coordinates.shape[-1]:
+            self._data.set_row_shape((coordinates.shape[-1],))
+        self._data.extend(coordinates)
+
+    def clear(self) -> None:
+        """
+        Removes all coordinates
+        :return: None
+        """
+        self._data = GrowableArray(dtype=self.dtype, row_shape=(0,))
+
+    def copy(self) -> "CoordinateArray":
+        """
+        :return: copy of this CoordinateArray
+        """
+        return CoordinateArray(self.array.copy(), self.dtype)
+
+    def tolist(self) -> List[List[float]]:
+        """
+        :return: all coordinates as python lists
+        """
+        res: List[List[float]] = self.array.tolist()
+        return res
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __bool__(self) -> bool:
+        return len(self._data) > 0
+
+    def __getitem__(self, idx: Any) -> Any:
+        if isinstance(idx, slice):
+            return CoordinateArray(self.array[idx].copy(), self.dtype)
+        return self.array[idx].tolist()
+
+    def __setitem__(self, idx: int, coordinate: Any) -> None:
+        self._data.make_writeable()
+        self.array[idx] = coordinate
+
+    def __iter__(self) -> Iterator[List[float]]:
+        return iter(self.array.tolist())
+
+    def __contains__(self, coordinate: Any) -> bool:
+        if len(self._data) == 0 or len(coordinate) != self.dimension:
+            return False
+        return bool(np.any(np.all(self.array == np.asarray(coordinate), axis=1)))
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, CoordinateArray):
+            return np.array_equal(self.array, other.array)
+        if isinstance(other, list):
+            return self.tolist() == other
+        return NotImplemented
+
+    def __ne__(self, other: Any) -> bool:
+        res = self.__eq__(other)
+        if res is NotImplemented:
+            return res
+        return not res
+
+    def __array__(self, dtype: Any = None, copy: Optional[bool] = None) -> np.ndarray:
+        if dtype is None or dtype == self.dtype:
+            return self.array
+        return self.array.astype(dtype)
+
+    def __repr__(self) -> str:
+        return f"CoordinateArray({self.tolist()})"
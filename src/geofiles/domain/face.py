@@ -6,6 +6,8 @@ class Face:
     Class that represents an individual face
     """
 
+    __slots__ = ("indices", "normal_indices", "texture_coordinates")
+
     def __init__(self) -> None:
         """
         Initializes a face with the following attributes:
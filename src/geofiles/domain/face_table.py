@@ -0,0 +1,471 @@
+from itertools import chain
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from geofiles.domain.face import Face
+from geofiles.domain.growable_array import GrowableArray
+
+
+def _read_only(*args: Any, **kwargs: Any) -> None:
+    """
+    Rejects the modification of a face created from a FaceTable
+    """
+    raise Exception(
+        "Faces of a FaceTable are read-only, assign a new Face to the table or unpack the faces"
+    )
+
+
+class FaceRow(List[int]):
+    """
+    Read-only list of the indices of a face stored in a FaceTable.
+    The row is a copy of the packed data, so modifications are rejected instead of being silently dropped.
+    """
+
+    __setitem__ = _read_only
+    __delitem__ = _read_only
+    __iadd__ = _read_only  # type: ignore[assignment]
+    __imul__ = _read_only  # type: ignore[assignment]
+    append = _read_only
+    extend = _read_only
+    insert = _read_only
+    pop = _read_only  # type: ignore[assignment]
+    remove = _read_only
+    clear = _read_only
+    sort = _read_only  # type: ignore[assignment]
+    reverse = _read_only
+
+
+class PackedFace(Face):
+    """
+    Read-only face created on demand from a FaceTable (see FaceRow)
+    """
+
+    __slots__ = ()
+
+    def __init__(
+        self, indices: FaceRow, normal_indices: FaceRow, texture_coordinates: FaceRow
+    ) -> None:
+        """
+        Initializes the face with the given rows of the face table
+        :param indices: vertex indices of the face
+        :param normal_indices: normal indices of the face
+        :param texture_coordinates: texture coordinate indices of the face
+        """
+        object.__setattr__(self, "indices", indices)
+        object.__setattr__(self, "normal_indices", normal_indices)
+        object.__setattr__(self, "texture_coordinates", texture_coordinates)
+
+    __setattr__ = _read_only
+
+
+class FaceTable:
+    """
+    Compact representation of the faces of a GeoObject using a compressed sparse row (CSR) layout.
+    The indices of all faces are stored in one flat int32 array and the boundaries of the individual faces are
+    defined by an offsets array (face i uses indices[offsets[i]:offsets[i + 1]]).
+    The same layout is used for the normal indices and the texture coordinate indices.
+    The table is list-compatible: accessing an element creates a read-only PackedFace on demand, faces are
+    modified by assigning a new Face to the table (e.g. table[0] = face).
+
+    Note that indices use the obj ordering with start index 1 and indexes < 0 for tail access (see Face)
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty face table
+        """
+        self._indices = GrowableArray(dtype=np.int32)
+        self._offsets = GrowableArray(np.zeros(1, dtype=np.int64))
+        self._normal_indices = GrowableArray(dtype=np.int32)
+        self._normal_offsets = GrowableArray(np.zeros(1, dtype=np.int64))
+        self._texture_coordinates = GrowableArray(dtype=np.int32)
+        self._texture_offsets = GrowableArray(np.zeros(1, dtype=np.int64))
+
+    @staticmethod
+    def from_arrays(
+        indices: Any,
+        offsets: Any,
+        normal_indices: Any = None,
+        normal_offsets: Any = None,
+        texture_coordinates: Any = None,
+        texture_offsets: Any = None,
+    ) -> "FaceTable":
+        """
+        Creates a face table from the given CSR arrays
+        :param indices: flat array of all vertex indices
+        :param offsets: offsets array of length number of faces + 1
+        :param normal_indices: optional flat array of all normal indices
+        :param normal_offsets: offsets of the normal indices (required if normal_indices is given)
+        :param texture_coordinates: optional flat array of all texture coordinate indices
+        :param texture_offsets: offsets of the texture coordinate indices (required if texture_coordinates is given)
+        :return: the created face table
+        """
+        table = FaceTable()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        empty_offsets = np.zeros(len(offsets), dtype=np.int64)
+        table._indices = GrowableArray(np.asarray(indices, dtype=np.int32))
+        table._offsets = GrowableArray(offsets)
+        if normal_indices is not None:
+            table._normal_indices = GrowableArray(
+                np.asarray(normal_indices, dtype=np.int32)
+            )
+            table._normal_offsets = GrowableArray(
+                np.asarray(normal_offsets, dtype=np.int64)
+            )
+        else:
+            table._normal_offsets = GrowableArray(empty_offsets)
+        if texture_coordinates is not None:
+            table._texture_coordinates = GrowableArray(
+                np.asarray(texture_coordinates, dtype=np.int32)
+            )
+            table._texture_offsets = GrowableArray(
+                np.asarray(texture_offsets, dtype=np.int64)
+            )
+        else:
+            table._texture_offsets = GrowableArray(empty_offsets.copy())
+        return table
+
+    @staticmethod
+    def from_uniform(indices: Any) -> "FaceTable":
+        """
+        Creates a face table from a (N, k) array, where every row represents a face with k vertices
+        :param indices: (N, k) array of vertex indices
+        :return: the created face table
+        """
+        indices = np.asarray(indices, dtype=np.int32)
+        num_faces, face_size = indices.shape
+        offsets = np.arange(0, num_faces * face_size + 1, face_size, dtype=np.int64)
+        return FaceTable.from_arrays(indices.reshape(-1), offsets)
+
+    @staticmethod
+    def from_faces(faces: Iterable[Face]) -> "FaceTable":
+        """
+        Packs the given face objects into a face table
+        :param faces: to be packed
+        :return: the created face table
+        """
+        if isinstance(faces, FaceTable):
+            return faces
+        faces = list(faces)
+        num_faces = len(faces)
+        return FaceTable.from_arrays(
+            *FaceTable._pack([f.indices for f in faces], num_faces),
+            *FaceTable._pack([f.normal_indices for f in faces], num_faces),
+            *FaceTable._pack([f.texture_coordinates for f in faces], num_faces),
+        )
+
+    @staticmethod
+    def _pack(lists: List[List[int]], num_faces: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Packs the given lists into a flat array and an offsets array
+        :param lists: lists of indices (one per face)
+        :param num_faces: number of faces
+        :return: flat array, offsets
+        """
+        offsets = np.zeros(num_faces + 1, dtype=np.int64)
+        np.cumsum(
+            np.fromiter((len(a) for a in lists), np.int64, num_faces), out=offsets[1:]
+        )
+        flat = np.fromiter(chain.from_iterable(lists), np.int32, int(offsets[-1]))
+        return flat, offsets
+
+    @staticmethod
+    def concatenate(tables: Sequence["FaceTable"]) -> "FaceTable":
+        """
+        Concatenates the given face tables
+        :param tables: to be concatenated
+        :return: face table containing all faces of the given tables
+        """
+        if len(tables) == 0:
+            return FaceTable()
+        return FaceTable.from_arrays(
+            *FaceTable._concatenate([(t.indices, t.offsets) for t in tables]),
+            *FaceTable._concatenate(
+                [(t.normal_indices, t.normal_offsets) for t in tables]
+            ),
+            *FaceTable._concatenate(
+                [(t.texture_coordinates, t.texture_offsets) for t in tables]
+            ),
+        )
+
+    @staticmethod
+    def _concatenate(
+        parts: List[Tuple[np.ndarray, np.ndarray]],
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Concatenates the given CSR arrays
+        :param parts: (flat, offsets) tuples
+        :return: concatenated flat array, concatenated offsets
+        """
+        flat = np.concatenate([p[0] for p in parts])
+        offsets = [np.zeros(1, dtype=np.int64)]
+        start = 0
+        for part, part_offsets in parts:
+            offsets.append(part_offsets[1:] + start)
+            start += len(part)
+        return flat, np.concatenate(offsets)
+
+    @property
+    def indices(self) -> np.ndarray:
+        """
+        :return: flat array of the vertex indices of all faces
+        """
+        return self._indices.array
+
+    @property
+    def offsets(self) -> np.ndarray:
+        """
+        :return: offsets of the vertex indices of the faces (length: number of faces + 1)
+        """
+        return self._offsets.array
+
+    @property
+    def normal_indices(self) -> np.ndarray:
+        """
+        :return: flat array of the normal indices of all faces
+        """
+        return self._normal_indices.array
+
+    @property
+    def normal_offsets(self) -> np.ndarray:
+        """
+        :return: offsets of the normal indices of the faces (length: number of faces + 1)
+        """
+        return self._normal_offsets.array
+
+    @property
+    def texture_coordinates(self) -> np.ndarray:
+        """
+        :return: flat array of the texture coordinate indices of all faces
+        """
+        return self._texture_coordinates.array
+
+    @property
+    def texture_offsets(self) -> np.ndarray:
+        """
+        :return: offsets of the texture coordinate indices of the faces (length: number of faces + 1)
+        """
+        return self._texture_offsets.array
+
+    def get_counts(self) -> np.ndarray:
+        """
+        :return: number of vertices per face
+        """
+        return np.diff(self.offsets)
+
+    def get_uniform_size(self) -> Optional[int]:
+        """
+        :return: the number of vertices per face if all faces have the same size, else None
+        """
+        counts = self.get_counts()
+        if len(counts) == 0:
+            return None
+        if np.all(counts == counts[0]):
+            return int(counts[0])
+        return None
+
+    def contains_normals(self) -> bool:
+        """
+        :return: true iff at least one face references normals
+        """
+        return len(self.normal_indices) != 0
+
+    def contains_texture_coordinates(self) -> bool:
+        """
+        :return: true iff at least one face references texture coordinates
+        """
+        return len(self.texture_coordinates) != 0
+
+    def get_zero_based_indices(self, num_vertices: int) -> np.ndarray:
+        """
+        Converts the obj style vertex indices to python like indices
+        :param num_vertices: number of vertices of the referenced file (required for indices < 0)
+        :return: flat array of zero based vertex indices
+        """
+        indices = self.indices.astype(np.int64)
+        if len(indices) != 0 and np.any(indices == 0):
+            raise Exception("Index 0 not supported in OBJ")
+        return np.where(indices > 0, indices - 1, indices + num_vertices)
+
+    def take(self, face_ids: Any) -> "FaceTable":
+        """
+        Creates a new face table containing the faces with the given ids
+        :param face_ids: ids of the faces (in the resulting order)
+        :return: new face table
+        """
+        face_ids = np.asarray(face_ids, dtype=np.int64)
+        return FaceTable.from_arrays(
+            *self._take(self.indices, self.offsets, face_ids),
+            *self._take(self.normal_indices, self.normal_offsets, face_ids),
+            *self._take(self.texture_coordinates, self.texture_offsets, face_ids),
+        )
+
+    @staticmethod
+    def _take(
+        flat: np.ndarray, offsets: np.ndarray, face_ids: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gathers the CSR rows with the given ids
+        :param flat: flat array
+        :param offsets: offsets array
+        :param face_ids: rows to be gathered
+        :return: gathered flat array, gathered offsets
+        """
+        starts = offsets[:-1][face_ids]
+        counts = offsets[1:][face_ids] - starts
+        new_offsets = np.zeros(len(face_ids) + 1, dtype=np.int64)
+        np.cumsum(counts, out=new_offsets[1:])
+        positions = np.repeat(starts - new_offsets[:-1], counts) + np.arange(
+            new_offsets[-1]
+        )
+        return flat[positions], new_offsets
+
+    def triangulate(self) -> Tuple["FaceTable", np.ndarray]:
+        """
+        Splits all faces into triangles using a fan triangulation, i.e. a face (v0, ..., vk-1) results in the
+        triangles (v0, vi, vi+1) with 0 < i < k - 1. Normal and texture coordinate indices are not maintained.
+        :return: table containing only triangles, id of the original face for every triangle
+        """
+        counts = self.get_counts()
+        triangle_counts = np.maximum(counts - 2, 0)
+        face_ids = np.repeat(np.arange(len(counts)), triangle_counts)
+        triangle_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(triangle_counts, out=triangle_offsets[1:])
+        fan_positions = np.arange(len(face_ids)) - triangle_offsets[:-1][face_ids]
+        starts = self.offsets[:-1][face_ids]
+        indices = self.indices
+        triangles = np.column_stack(
+            (
+                indices[starts],
+                indices[starts + fan_positions + 1],
+                indices[starts + fan_positions + 2],
+            )
+        )
+        return FaceTable.from_uniform(triangles.reshape(-1, 3)), face_ids
+
+    def append(self, face: Face) -> None:
+        """
+        Appends the given face to the table
+        :param face: to be appended
+        :return: None
+        """
+        self._indices.extend(face.indices)
+        self._offsets.append(len(self._indices))
+        self._normal_indices.extend(face.normal_indices)
+        self._normal_offsets.append(len(self._normal_indices))
+        self._texture_coordinates.extend(face.texture_coordinates)
+        self._texture_offsets.append(len(self._texture_coordinates))
+
+    def extend(self, faces: Iterable[Face]) -> None:
+        """
+        Appends the given faces to the table
+        :param faces: to be appended
+        :return: None
+        """
+        self._assign(FaceTable.concatenate([self, FaceTable.from_faces(faces)]))
+
+    def _assign(self, other: "FaceTable") -> None:
+        """
+        Replaces the content of this table by the content of the given table
+        :param other: table providing the new content
+        :return: None
+        """
+        self._indices = other._indices
+        self._offsets = other._offsets
+        self._normal_indices = other._normal_indices
+        self._normal_offsets = other._normal_offsets
+        self._texture_coordinates = other._texture_coordinates
+        self._texture_offsets = other._texture_offsets
+
+    def to_faces(self) -> List[Face]:
+        """
+        :return: list of (modifiable) face objects representing the faces of this table
+        """
+        faces = []
+        for indices, normal_indices, texture_coordinates in self._iter_rows():
+            face = Face()
+            face.indices = indices
+            face.normal_indices = normal_indices
+            face.texture_coordinates = texture_coordinates
+            faces.append(face)
+        return faces
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __getitem__(self, idx: Any) -> Any:
+        if isinstance(idx, slice):
+            return self.take(np.arange(len(self))[idx])
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError("face index out of range")
+        return PackedFace(
+            self._row(self.indices, self.offsets, idx),
+            self._row(self.normal_indices, self.normal_offsets, idx),
+            self._row(self.texture_coordinates, self.texture_offsets, idx),
+        )
+
+    def __setitem__(self, idx: Any, face: Any) -> None:
+        if isinstance(idx, slice):
+            faces = self.to_faces()
+            faces[idx] = face
+            self._assign(FaceTable.from_faces(faces))
+            return
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or idx >= len(self):
+            raise IndexError("face index out of range")
+        rows = [
+            (self._indices, self.offsets, face.indices),
+            (self._normal_indices, self.normal_offsets, face.normal_indices),
+            (self._texture_coordinates, self.texture_offsets, face.texture_coordinates),
+        ]
+        if all(
+            offsets[idx + 1] - offsets[idx] == len(values)
+            for _, offsets, values in rows
+        ):
+            # the row lengths are unchanged, so the CSR arrays are updated in place
+            for flat, offsets, values in rows:
+                if len(values) != 0:
+                    # copies read-only buffers (e.g. memory mapped files)
+                    flat.reserve(len(flat))
+                    flat.array[offsets[idx] : offsets[idx + 1]] = values
+            return
+        faces = self.to_faces()
+        faces[idx] = face
+        self._assign(FaceTable.from_faces(faces))
+
+    @staticmethod
+    def _row(flat: np.ndarray, offsets: np.ndarray, idx: int) -> FaceRow:
+        """
+        :return: the row with the given index as read-only list
+        """
+        return FaceRow(flat[offsets[idx] : offsets[idx + 1]].tolist())
+
+    def __iter__(self) -> Iterator[Face]:
+        for indices, normal_indices, texture_coordinates in self._iter_rows():
+            yield PackedFace(
+                FaceRow(indices), FaceRow(normal_indices), FaceRow(texture_coordinates)
+            )
+
+    def _iter_rows(self) -> Iterator[Tuple[List[int], List[int], List[int]]]:
+        """
+        :return: iterator of the vertex, normal and texture coordinate indices of the faces as python lists
+        """
+        indices = self.indices.tolist()
+        offsets = self.offsets.tolist()
+        normal_indices = self.normal_indices.tolist()
+        normal_offsets = self.normal_offsets.tolist()
+        texture_coordinates = self.texture_coordinates.tolist()
+        texture_offsets = self.texture_offsets.tolist()
+        for i in range(len(self)):
+            yield (
+                indices[offsets[i] : offsets[i + 1]],
+                normal_indices[normal_offsets[i] : normal_offsets[i + 1]],
+                texture_coordinates[texture_offsets[i] : texture_offsets[i + 1]],
+            )
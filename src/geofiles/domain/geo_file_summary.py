@@ -0,0 +1,81 @@
+from typing import Any, Dict, List, Optional
+
+from geofiles.conversion.static import is_not_none_nor_empty
+from geofiles.domain.geo_object_file import GeoObjectFile
+
+
+class GeoFileSummary:
+    """
+    Class that represents the header information of a geo-referenced file, which is determined without reading its
+    geometry (see BaseReader.scan)
+    """
+
+    def __init__(self) -> None:
+        """
+        A summary with the following attributes (see GeoObjectFile):
+        - crs: name (string) of the used coordinate reference system
+        - origin: geo-referenced origin (tuple) of the geo objects
+        - translation: tuple containing the global translation of origin-based geo objects
+        - rotation: tuple containing the global rotation of origin-based geo objects
+        - scaling: tuple containing the global scaling of origin-based geo objects
+        - min_extent: minimal geographical extent of the vertices
+        - max_extent: maximal geographical extent of the vertices
+        - meta_information: Meta information of the file
+        - num_vertices: number of vertices (None if the header does not define it)
+        - num_faces: number of faces (None if the header does not define it)
+        - num_objects: number of objects (None if the header does not define it)
+        """
+        self.crs: Optional[str] = None
+        self.origin: Optional[List[float]] = None
+        self.translation: Optional[List[float]] = None
+        self.rotation: Optional[List[float]] = None
+        self.scaling: Optional[List[float]] = None
+        self.min_extent: Optional[List[float]] = []
+        self.max_extent: Optional[List[float]] = []
+        self.meta_information: Dict[str, Any] = dict()
+        self.num_vertices: Optional[int] = None
+        self.num_faces: Optional[int] = None
+        self.num_objects: Optional[int] = None
+
+    @staticmethod
+    def from_file(data: GeoObjectFile, include_counts: bool = True) -> "GeoFileSummary":
+        """
+        Creates the summary of the given file
+        :param data: (partially) read file
+        :param include_counts: If true, the counts are determined from the vertices and objects of the file
+        :return: summary of the given file
+        """
+        res = GeoFileSummary()
+        res.crs = data.crs
+        res.origin = data.origin
+        res.translation = data.translation
+        res.rotation = data.rotation
+        res.scaling = data.scaling
+        res.min_extent = data.min_extent
+        res.max_extent = data.max_extent
+        res.meta_information = data.meta_information
+        if include_counts:
+            res.num_vertices = len(data.vertices)
+            res.num_faces = sum(len(geoobj.faces) for geoobj in data.objects)
+            res.num_objects = len(data.objects)
+        return res
+
+    def is_origin_based(self) -> bool:
+        """
+        :return: true iff the file uses an origin
+        """
+        return self.origin is not None
+
+    def is_geo_referenced(self) -> bool:
+        """
+        :return: true iff the file is geo-referenced
+        """
+        return self.crs is not None
+
+    def contains_extent(self) -> bool:
+        """
+        :return: true iff the header contains extent information
+        """
+        return is_not_none_nor_empty(self.min_extent) and is_not_none_nor_empty(
+            self.max_extent
+        )
@@ -1,7 +1,8 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from geofiles.conversion.static import is_not_none_nor_empty
 from geofiles.domain.face import Face
+from geofiles.domain.face_table import FaceTable
 
 
 class GeoObject:
@@ -14,20 +15,92 @@ class GeoObject:
         A geo-referenced object with the following attributes:
         - name: the name of the individual object
         - parent: reference to a parent object to represent a hierarchy
-        - faces: a list of face-objects representing the geometry of this object
+        - faces: a list of face-objects (or a packed FaceTable) representing the geometry of this object
         - translation: tuple containing the local translation of origin-based geo objects
         - rotation: tuple containing the local rotation of origin-based geo objects
         - scaling: tuple containing the local scaling of origin-based geo objects
         - meta_information: Meta information that additionally describe the object
         """
+        self._extent_cache: Optional[Tuple[Any, List[float], List[float]]] = None
         self.name: str = ""
         self.parent: Optional[GeoObject] = None
-        self.faces: List[Face] = []
+        self.faces = []
         self.translation: Optional[List[float]] = None
         self.rotation: Optional[List[float]] = None
         self.scaling: Optional[List[float]] = None
         self.meta_information: Dict[str, Any] = dict()
 
+    @property
+    def faces(self) -> Any:
+        """
+        :return: all faces of this object (List[Face] or a packed FaceTable). The faces of a FaceTable are
+        read-only copies, they are modified by assigning a new face (faces[i] = face) or after unpack_faces.
+        """
+        return self._faces
+
+    @faces.setter
+    def faces(self, value: Any) -> None:
+        self._faces = value
+        self._extent_cache = None
+
+    def get_cached_extent(self, key: Any) -> Optional[Tuple[List[float], List[float]]]:
+        """
+        :param key: identifies the state of the referenced vertices
+        :return: cached min and max extent of this object, if it was determined for the same key
+        """
+        if self._extent_cache is None or self._extent_cache[0] != key:
+            return None
+        return self._extent_cache[1], self._extent_cache[2]
+
+    def set_cached_extent(
+        self, key: Any, min_extent: List[float], max_extent: List[float]
+    ) -> None:
+        """
+        Caches the extent of this object
+        :param key: identifies the state of the referenced vertices
+        :param min_extent: minimal extent of the vertices referenced by this object
+        :param max_extent: maximal extent of the vertices referenced by this object
+        :return: None
+        """
+        self._extent_cache = (key, min_extent, max_extent)
+
+    def invalidate_extent(self) -> None:
+        """
+        Removes the cached extent, required if the faces were modified in place
+        :return: None
+        """
+        self._extent_cache = None
+
+    def is_packed(self) -> bool:
+        """
+        :return: true iff the faces of this object are stored in a packed FaceTable
+        """
+        return isinstance(self._faces, FaceTable)
+
+    def get_face_table(self) -> FaceTable:
+        """
+        Returns the faces of this object in the packed CSR representation (without changing the object)
+        :return: FaceTable containing all faces of this object
+        """
+        if isinstance(self._faces, FaceTable):
+            return self._faces
+        return FaceTable.from_faces(self._faces)
+
+    def pack_faces(self) -> None:
+        """
+        Converts the faces of this object to the packed FaceTable representation
+        :return: None
+        """
+        self._faces = self.get_face_table()
+
+    def unpack_faces(self) -> None:
+        """
+        Converts the faces of this object to a list of Face objects
+        :return: None
+        """
+        if isinstance(self._faces, FaceTable):
+            self._faces = self._faces.to_faces()
+
     def contains_scaling(self) -> bool:
         """
         Checks if this geo-referenced file contains global scaling information
@@ -1,7 +1,12 @@
 import copy
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from geofiles.conversion.static import is_not_none_nor_empty, update_min_max
+import numpy as np
+
+from geofiles.conversion.face_deduplicator import FaceDeduplicator
+from geofiles.conversion.static import is_not_none_nor_empty
+from geofiles.domain.coordinate_array import CoordinateArray
+from geofiles.domain.face_table import FaceTable
 from geofiles.domain.geo_object import GeoObject
 
 
@@ -10,7 +15,7 @@ class GeoObjectFile:
     Basic class representing a file containing geo referenced object
     """
 
-    def __init__(self) -> None:
+    def __init__(self, columnar: bool = False, dtype: Any = np.float64) -> None:
         """
         Initializes a GeoObjectFile with the following attributes:
         - crs: name (string) of the used coordinate reference system
@@ -24,20 +29,282 @@ class GeoObjectFile:
         - texture_coordinates: List of all texture_coordinates within this GeoObjectFile
         - min_extent: minimal geographical extent of the vertices
         - max_extent: maximal geographical extent of the vertices
+
+        If columnar is set, vertices, normals and texture_coordinates are stored as contiguous (N, dim) numpy arrays
+        of the given dtype, which are wrapped by a list-compatible CoordinateArray.
         """
+        self._columnar_dtype: Optional[Any] = dtype if columnar else None
+        self._geometry_version = 0
+        # vertex storage, number of vertices and min/max of these vertices covered by the tracked extent
+        self._extent_state: Optional[Tuple[Any, int, np.ndarray, np.ndarray]] = None
         self.crs: Optional[str] = None
         self.origin: Optional[List[float]] = None
         self.translation: Optional[List[float]] = None
         self.rotation: Optional[List[float]] = None
         self.scaling: Optional[List[float]] = None
         self.objects: List[GeoObject] = []
-        self.vertices: List[List[float]] = []
-        self.normals: List[List[float]] = []
-        self.texture_coordinates: List[List[float]] = []
+        self.vertices = []
+        self.normals = []
+        self.texture_coordinates = []
         self.min_extent: Optional[List[float]] = []
         self.max_extent: Optional[List[float]] = []
         self.meta_information: Dict[str, Any] = dict()
 
+    @property
+    def vertices(self) -> Any:
+        """
+        :return: all vertices (List[List[float]] or CoordinateArray in columnar mode)
+        """
+        return self._vertices
+
+    @vertices.setter
+    def vertices(self, value: Any) -> None:
+        self._vertices = self._to_storage(value)
+        self._geometry_version += 1
+        self._extent_state = None
+
+    @property
+    def normals(self) -> Any:
+        """
+        :return: all normals (List[List[float]] or CoordinateArray in columnar mode)
+        """
+        return self._normals
+
+    @normals.setter
+    def normals(self, value: Any) -> None:
+        self._normals = self._to_storage(value)
+
+    @property
+    def texture_coordinates(self) -> Any:
+        """
+        :return: all texture coordinates (List[List[float]] or CoordinateArray in columnar mode)
+        """
+        return self._texture_coordinates
+
+    @texture_coordinates.setter
+    def texture_coordinates(self, value: Any) -> None:
+        self._texture_coordinates = self._to_storage(value)
+
+    def _to_storage(self, value: Any) -> Any:
+        """
+        Converts the given coordinates to the storage representation of this file
+        :param value: coordinates to be stored
+        :return: CoordinateArray in columnar mode (or if value is a numpy array), else the unchanged value
+        """
+        if isinstance(value, CoordinateArray):
+            return value
+        if isinstance(value, np.ndarray):
+            dtype = self._columnar_dtype
+            if dtype is None:
+                dtype = value.dtype if value.dtype.kind == "f" else np.float64
+            return CoordinateArray(value, dtype)
+        if self._columnar_dtype is not None:
+            return CoordinateArray(value, self._columnar_dtype)
+        return value
+
+    def get_geometry_version(self) -> int:
+        """
+        :return: counter, which changes whenever the vertices of this file are replaced (used for invalidating caches)
+        """
+        return self._geometry_version
+
+    def invalidate_geometry(self) -> None:
+        """
+        Signals that the vertices were modified in place, so cached information (e.g. extents) has to be recalculated
+        :return: None
+        """
+        self._geometry_version += 1
+        self._extent_state = None
+
+    def append_vertices(self, vertices: Any) -> None:
+        """
+        Appends the given vertices, a tracked extent is updated with the new vertices only
+        :param vertices: (N, dim) array or list of vertices
+        :return: None
+        """
+        clean = not self.is_extent_dirty()
+        if isinstance(self._vertices, CoordinateArray):
+            self._vertices.extend(vertices)
+        elif isinstance(vertices, np.ndarray):
+            self._vertices.extend(vertices.tolist())
+        else:
+            self._vertices.extend(list(vertex) for vertex in vertices)
+        if clean:
+            self.get_vertex_extent()
+
+    def is_extent_dirty(self) -> bool:
+        """
+        :return: true iff the tracked extent does not cover all vertices (so get_vertex_extent requires a reduction)
+        """
+        state = self._extent_state
+        return (
+            state is None
+            or state[0] is not self._vertices
+            or state[1] != len(self._vertices)
+        )
+
+    def get_vertex_extent(self) -> Tuple[List[float], List[float]]:
+        """
+        Provides the extent of all vertices. The extent is tracked, so it is only recalculated (vectorized) after the
+        vertices were replaced or modified in place (see invalidate_geometry), while appended vertices are merged
+        into the tracked extent.
+        :return: min and max extent of the vertices (empty lists if there are no vertices)
+        """
+        count = len(self._vertices)
+        state = self._extent_state
+        if count == 0:
+            self._extent_state = None
+            return [], []
+        if state is None or state[0] is not self._vertices or state[1] > count:
+            array = self.get_vertex_array()
+            min_extent = array.min(axis=0)
+            max_extent = array.max(axis=0)
+        elif state[1] < count:
+            if isinstance(self._vertices, CoordinateArray):
+                tail = self._vertices.array[state[1] :]
+            else:
+                tail = self._as_array(self._vertices[state[1] :])
+            min_extent = np.minimum(state[2], tail.min(axis=0))
+            max_extent = np.maximum(state[3], tail.max(axis=0))
+        else:
+            min_extent = state[2]
+            max_extent = state[3]
+        self._extent_state = (self._vertices, count, min_extent, max_extent)
+        return min_extent.tolist(), max_extent.tolist()
+
+    def get_object_extent(self, geoobj: GeoObject) -> Tuple[List[float], List[float]]:
+        """
+        Provides the extent of the vertices referenced by the given object. The extent is cached in the object until
+        its faces or the vertices of this file change (see GeoObject.invalidate_extent for faces modified in place).
+        :param geoobj: object of this file
+        :return: min and max extent (empty lists if the object has no faces)
+        """
+        key = (
+            id(self),
+            self._geometry_version,
+            len(self._vertices),
+            len(geoobj.faces),
+        )
+        cached = geoobj.get_cached_extent(key)
+        if cached is not None:
+            return list(cached[0]), list(cached[1])
+
+        table = geoobj.get_face_table()
+        if len(table.indices) == 0:
+            min_extent: List[float] = []
+            max_extent: List[float] = []
+        else:
+            vertices = self.get_vertex_array()
+            referenced = vertices[
+                np.unique(table.get_zero_based_indices(len(vertices)))
+            ]
+            min_extent = referenced.min(axis=0).tolist()
+            max_extent = referenced.max(axis=0).tolist()
+        geoobj.set_cached_extent(key, min_extent, max_extent)
+        return list(min_extent), list(max_extent)
+
+    def is_columnar(self) -> bool:
+        """
+        :return: true iff the vertices are stored in a contiguous numpy array
+        """
+        return isinstance(self._vertices, CoordinateArray)
+
+    def to_columnar(self, dtype: Any = np.float64) -> None:
+        """
+        Converts vertices, normals and texture coordinates to contiguous numpy arrays.
+        Coordinates assigned afterwards are converted automatically.
+        :param dtype: data type of the arrays (np.float64 or np.float32)
+        :return: None
+        """
+        self._columnar_dtype = dtype
+        self.vertices = CoordinateArray(self._vertices, dtype)
+        self.normals = CoordinateArray(self._normals, dtype)
+        self.texture_coordinates = CoordinateArray(self._texture_coordinates, dtype)
+
+    def to_lists(self) -> None:
+        """
+        Converts vertices, normals and texture coordinates back to python lists
+        :return: None
+        """
+        self._columnar_dtype = None
+        self.vertices = self._as_list(self._vertices)
+        self.normals = self._as_list(self._normals)
+        self.texture_coordinates = self._as_list(self._texture_coordinates)
+
+    def get_vertex_array(self) -> np.ndarray:
+        """
+        :return: (N, dim) array of all vertices (no copy in columnar mode)
+        """
+        return self._as_array(self._vertices)
+
+    def get_normal_array(self) -> np.ndarray:
+        """
+        :return: (N, dim) array of all normals (no copy in columnar mode)
+        """
+        return self._as_array(self._normals)
+
+    def get_texture_coordinate_array(self) -> np.ndarray:
+        """
+        :return: (N, dim) array of all texture coordinates (no copy in columnar mode)
+        """
+        return self._as_array(self._texture_coordinates)
+
+    def set_vertex_array(self, array: np.ndarray) -> None:
+        """
+        Replaces all vertices by the given array while keeping the representation (columnar or list) of this file
+        :param array: (N, dim) array of new vertices
+        :return: None
+        """
+        if self.is_columnar():
+            self.vertices = CoordinateArray(array, self._vertices.dtype)
+        else:
+            self.vertices = np.asarray(array).tolist()
+
+    @staticmethod
+    def _as_array(coordinates: Any) -> np.ndarray:
+        """
+        :param coordinates: list of coordinates or CoordinateArray
+        :return: numpy representation of the given coordinates
+        """
+        if isinstance(coordinates, CoordinateArray):
+            return coordinates.array
+        if len(coordinates) == 0:
+            return np.empty((0, 3), dtype=np.float64)
+        return np.asarray(coordinates, dtype=np.float64)
+
+    @staticmethod
+    def _as_list(coordinates: Any) -> List[List[float]]:
+        """
+        :param coordinates: list of coordinates or CoordinateArray
+        :return: python list representation of the given coordinates
+        """
+        if isinstance(coordinates, CoordinateArray):
+            return coordinates.tolist()
+        return list(coordinates)
+
+    def shallow_copy(self) -> "GeoObjectFile":
+        """
+        Creates a structural copy of this file, which shares the objects (including their faces), the vertices,
+        normals, texture coordinates and the meta information with this file.
+        Only the object list and the header information (origin, extent, transformation) are copied.
+        Note: Shared parts have to be replaced (e.g. by assigning new vertices) instead of modified in place.
+        :return: structural copy of this file
+        """
+        res = copy.copy(self)
+        res.objects = list(self.objects)
+        for attribute in [
+            "origin",
+            "translation",
+            "rotation",
+            "scaling",
+            "min_extent",
+            "max_extent",
+        ]:
+            value = getattr(self, attribute)
+            if value is not None:
+                setattr(res, attribute, list(value))
+        return res
+
     def get_translation_unit(self) -> str:
         """
         Getter for the translational unit
@@ -100,7 +367,7 @@ class GeoObjectFile:
         return self._access_idx(self.normals, idx)
 
     @staticmethod
-    def _access_idx(list_to_access: List[List[float]], idx: int) -> List[float]:
+    def _access_idx(list_to_access: Any, idx: int) -> List[float]:
         """
         Access the given list using the given index (Note: indices are .obj style starting with 1 and tail indices < 0)
         :param list_to_access: list to be accessed
@@ -146,23 +413,23 @@ class GeoObjectFile:
     def update_extent(self) -> None:
         """
         Updates the min and max extent values of this geo-referenced object file, it does not consider if the file is origin based,
-        nor any transformation information. For a more advanced functionality use the ExtentCalculator class
+        nor any transformation information. For a more advanced functionality use the ExtentCalculator class.
+        The extent is always recalculated from all vertices, since they may have been modified in place
+        (use get_vertex_extent for the incrementally tracked extent).
         """
-        if len(self.vertices) > 0:
-            min_extent = list(copy.deepcopy(self.vertices[0]))
-            max_extent = list(copy.deepcopy(self.vertices[0]))
-
-            for vertex in self.vertices:
-                update_min_max(vertex, min_extent, max_extent)
+        if len(self._vertices) > 0:
+            self._extent_state = None
+            self.min_extent, self.max_extent = self.get_vertex_extent()
 
-            self.min_extent = min_extent
-            self.max_extent = max_extent
-
-    def minimize(self, name: Optional[str] = None) -> None:
+    def minimize(
+        self, name: Optional[str] = None, orientation_invariant: bool = False
+    ) -> None:
         """
-        Minimizes this GeoObjectFile to one single object as required for GeoOFF and GeoPLY. Also eliminates duplicated faces.
+        Minimizes this GeoObjectFile to one single object as required for GeoOFF and GeoPLY. Also eliminates duplicated faces,
+        i.e. faces referencing the same vertices independent of the start vertex.
         Note: Object based meta information is lost, but file based information will be maintained.
         :param name: Name for the single object, if None the name of the first object is used
+        :param orientation_invariant: If true, faces with reversed winding order are also considered as duplicates
         """
         geoobject = GeoObject()
 
@@ -172,7 +439,8 @@ class GeoObjectFile:
         else:
             use_first_elements_name = True
 
-        face_set = set()
+        tables = []
+        packed = False
         for old_object in self.objects:
             if (
                 old_object.contains_translation()
@@ -186,10 +454,13 @@ class GeoObjectFile:
                 geoobject.name = old_object.name
                 use_first_elements_name = False
 
-            for face in old_object.faces:
-                face_set.add(face)
+            tables.append(old_object.get_face_table())
+            packed = packed or old_object.is_packed()
 
-        geoobject.faces = list(face_set)
+        faces = FaceDeduplicator.deduplicate(
+            FaceTable.concatenate(tables), orientation_invariant, len(self.vertices)
+        )
+        geoobject.faces = faces if packed else faces.to_faces()
 
         self.objects.clear()
         self.objects.append(geoobject)
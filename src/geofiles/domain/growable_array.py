@@ -0,0 +1,103 @@
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+
+class GrowableArray:
+    """
+    Contiguous numpy buffer which supports amortized O(1) appends along its first axis
+    """
+
+    def __init__(
+        self,
+        data: Optional[np.ndarray] = None,
+        dtype: Any = np.float64,
+        row_shape: Tuple[int, ...] = (),
+    ) -> None:
+        """
+        Initializes the buffer with the following attributes:
+        - data: optional initial content (used without copying if possible)
+        - dtype: data type of the buffer (ignored if data is given)
+        - row_shape: shape of an individual row (ignored if data is given)
+        """
+        if data is None:
+            self._buffer = np.empty((0,) + tuple(row_shape), dtype=dtype)
+        else:
+            self._buffer = data
+        self._size = len(self._buffer)
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        :return: view of the used part of the buffer
+        """
+        return self._buffer[: self._size]
+
+    @property
+    def dtype(self) -> Any:
+        """
+        :return: data type of the buffer
+        """
+        return self._buffer.dtype
+
+    @property
+    def row_shape(self) -> Tuple[int, ...]:
+        """
+        :return: shape of an individual row
+        """
+        return tuple(self._buffer.shape[1:])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def reserve(self, capacity: int) -> None:
+        """
+        Makes sure the buffer can hold at least the given number of rows without reallocation
+        :param capacity: number of rows
+        :return: None
+        """
+        if capacity <= len(self._buffer) and self._buffer.flags.writeable:
+            return
+        new_capacity = max(capacity, 2 * len(self._buffer), 16)
+        new_buffer = np.empty((new_capacity,) + self.row_shape, dtype=self.dtype)
+        new_buffer[: self._size] = self._buffer[: self._size]
+        self._buffer = new_buffer
+
+    def append(self, row: Any) -> None:
+        """
+        Appends a single row
+        :param row: to be appended
+        :return: None
+        """
+        self.reserve(self._size + 1)
+        self._buffer[self._size] = row
+        self._size += 1
+
+    def extend(self, rows: Any) -> None:
+        """
+        Appends multiple rows
+        :param rows: to be appended
+        :return: None
+        """
+        rows = np.asarray(rows, dtype=self.dtype).reshape((-1,) + self.row_shape)
+        self.reserve(self._size + len(rows))
+        self._buffer[self._size : self._size + len(rows)] = rows
+        self._size += len(rows)
+
+    def set_row_shape(self, row_shape: Tuple[int, ...]) -> None:
+        """
+        Changes the shape of an individual row (only allowed as long as the buffer is empty)
+        :param row_shape: new row shape
+        :return: None
+        """
+        if self._size != 0:
+            raise Exception("Row shape can only be changed for empty buffers")
+        self._buffer = np.empty((0,) + tuple(row_shape), dtype=self.dtype)
+
+    def make_writeable(self) -> None:
+        """
+        Copies the content if the underlying buffer is read-only (e.g. memory mapped)
+        :return: None
+        """
+        if not self._buffer.flags.writeable:
+            self._buffer = np.array(self.array)
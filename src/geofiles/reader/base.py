@@ -1,11 +1,30 @@
 import re
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from io import TextIOWrapper
-from typing import Any, Dict, Generator, Iterable, List
+from typing import (
+    Any,
+    Callable,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
+import numpy as np
+
+from geofiles.conversion.vertex_welder import VertexWelder
 from geofiles.domain.face import Face
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_file_summary import GeoFileSummary
+from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 
+T = TypeVar("T")
+
 
 class BaseReader(ABC):
     """
@@ -18,21 +37,70 @@ class BaseReader(ABC):
         :param file: to be read (may be a string representing the path or an opened file instance)
         :return: Domain representation of the GeoObjectFile
         """
-        close = False
-        to_read: Any = None
-        try:
-            if isinstance(file, str):
-                to_read = open(file)
-                close = True
-            elif isinstance(file, TextIOWrapper):
-                to_read = file
-            else:
-                raise Exception(f"Can't handle {file}")
-
-            return self._read(BaseReader._read_file_line(to_read))
-        finally:
-            if close and to_read is not None:
-                to_read.close()
+        return self._apply(file, self._read)
+
+    def scan(self, file: Any) -> GeoFileSummary:
+        """
+        Reads the header information (geo-referencing, extent, transformation and counts) of a given file.
+        Reading stops as soon as the header is known, formats without a header are read completely.
+        :param file: to be scanned (may be a string representing the path or an opened file instance)
+        :return: Summary of the file
+        """
+        return self._apply(file, self._scan)
+
+    def scan_string(self, input_string: str) -> GeoFileSummary:
+        """
+        Reads the header information of a given geometric object
+        :param input_string: string describing a geometric object
+        :return: Summary of the geometric object
+        """
+        return self._scan(BaseReader._split_str(input_string, "\n"))
+
+    def iter_objects(self, file: Any) -> Iterator[GeoObjectFile]:
+        """
+        Reads the objects of a given file one after another. Every object is returned in a file containing the
+        header information of the given file and only the vertices (normals, texture coordinates) referenced by the
+        object, so the objects can be processed and discarded without keeping the whole file in memory.
+        Readers without streaming support read the whole file first.
+        :param file: to be read (may be a string representing the path or an opened file instance)
+        :return: iterator of files containing a single object each
+        """
+        with BaseReader._open(file) as to_read:
+            yield from self._iter_objects(self._get_stream(to_read))
+
+    @staticmethod
+    def _apply(
+        file: Any,
+        function: Callable[[Iterable[str]], T],
+        stream: Optional[Callable[[TextIOWrapper], Iterable[str]]] = None,
+    ) -> T:
+        """
+        Applies the given function to the lines of the given file
+        :param file: to be read (may be a string representing the path or an opened file instance)
+        :param function: function reading the lines (e.g. _read)
+        :param stream: function splitting the opened file (lines if not given)
+        :return: result of the function
+        """
+        if stream is None:
+            stream = BaseReader._read_file_line
+        with BaseReader._open(file) as to_read:
+            return function(stream(to_read))
+
+    @staticmethod
+    @contextmanager
+    def _open(file: Any) -> Generator[TextIOWrapper, None, None]:
+        """
+        Opens the given file, files that are passed as opened file instance are not closed
+        :param file: to be read (may be a string representing the path or an opened file instance)
+        :return: context manager providing the opened file
+        """
+        if isinstance(file, str):
+            with open(file) as to_read:
+                yield to_read
+        elif isinstance(file, TextIOWrapper):
+            yield file
+        else:
+            raise Exception(f"Can't handle {file}")
 
     def read_strings(self, input_strings: List[str]) -> GeoObjectFile:
         """
@@ -51,14 +119,21 @@ class BaseReader(ABC):
     @staticmethod
     def _read_file_line(file: TextIOWrapper) -> Generator[str, None, None]:
         """
-        Lazy function (generator) to read a file line by line
+        Lazy function (generator) to read a file line by line, the file is read in blocks of multiple lines
         :param file: to be read
         """
         while True:
-            data = file.readline()
-            if not data:
+            lines = file.readlines(1 << 20)
+            if not lines:
                 break
-            yield data
+            yield from lines
+
+    def _get_stream(self, file: TextIOWrapper) -> Iterable[str]:
+        """
+        :param file: opened file
+        :return: text of the file as used by _iter_objects (lines by default)
+        """
+        return BaseReader._read_file_line(file)
 
     @staticmethod
     def _split_str(string: str, sep: str = "\n") -> Generator[str, None, None]:
@@ -82,31 +157,158 @@ class BaseReader(ABC):
         """
         return GeoObjectFile()
 
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        """
+        Scan implementation, reads the whole file by default
+        :param file: target to be scanned
+        :return: Summary of the file
+        """
+        return GeoFileSummary.from_file(self._read(file))
+
+    def _iter_objects(self, file: Iterable[str]) -> Iterator[GeoObjectFile]:
+        """
+        Object iterator implementation, reads the whole file by default
+        :param file: target to be read
+        :return: iterator of files containing a single object each
+        """
+        data = self._read(file)
+        vertices = data.get_vertex_array()
+        normals = data.get_normal_array()
+        texture_coordinates = data.get_texture_coordinate_array()
+        for geo_object in data.objects:
+            yield self._get_object_file(
+                data,
+                geo_object,
+                vertices,
+                normals,
+                texture_coordinates,
+                data.is_columnar(),
+            )
+
     @staticmethod
-    def _filter_faces(
-        unique_vertices: bool,
+    def _get_object_file(
+        header: GeoObjectFile,
+        geo_object: GeoObject,
+        vertices: np.ndarray,
+        normals: Optional[np.ndarray] = None,
+        texture_coordinates: Optional[np.ndarray] = None,
+        columnar: bool = False,
+    ) -> GeoObjectFile:
+        """
+        Creates a file containing the given object and only the coordinates referenced by it.
+        The faces of the object are re-indexed accordingly.
+        :param header: file providing the header information (crs, origin, transformation, extent, meta information)
+        :param geo_object: object to be contained
+        :param vertices: (N, dim) array of all vertices the object may reference
+        :param normals: optional (N, dim) array of all normals the object may reference
+        :param texture_coordinates: optional (N, dim) array of all texture coordinates the object may reference
+        :param columnar: If true, the resulting file stores its vertices as numpy arrays and its faces as packed
+        FaceTable, else python lists and Face objects are used
+        :return: file containing the object
+        """
+        res = GeoObjectFile(columnar=columnar)
+        res.crs = header.crs
+        for attribute in [
+            "origin",
+            "translation",
+            "rotation",
+            "scaling",
+            "min_extent",
+            "max_extent",
+        ]:
+            value = getattr(header, attribute)
+            setattr(res, attribute, list(value) if value is not None else None)
+        res.meta_information = dict(header.meta_information)
+
+        table = geo_object.get_face_table()
+        local_vertices, indices = BaseReader._reindex(table.indices, vertices)
+        res.vertices = local_vertices if columnar else local_vertices.tolist()
+        normal_indices = None
+        if normals is not None and table.contains_normals():
+            local_normals, normal_indices = BaseReader._reindex(
+                table.normal_indices, normals
+            )
+            res.normals = local_normals if columnar else local_normals.tolist()
+        texture_indices = None
+        if texture_coordinates is not None and table.contains_texture_coordinates():
+            local_coordinates, texture_indices = BaseReader._reindex(
+                table.texture_coordinates, texture_coordinates
+            )
+            res.texture_coordinates = (
+                local_coordinates if columnar else local_coordinates.tolist()
+            )
+
+        table = FaceTable.from_arrays(
+            indices,
+            table.offsets,
+            normal_indices,
+            table.normal_offsets if normal_indices is not None else None,
+            texture_indices,
+            table.texture_offsets if texture_indices is not None else None,
+        )
+        geo_object.faces = table if columnar else table.to_faces()
+        res.objects = [geo_object]
+        return res
+
+    @staticmethod
+    def _reindex(
+        indices: np.ndarray, coordinates: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gathers the coordinates referenced by the given indices
+        :param indices: obj style indices (starting with 1, < 0 for tail access)
+        :param coordinates: (N, dim) array of all coordinates
+        :return: (M, dim) array of the referenced coordinates, new obj style indices referencing this array
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        zero_based = np.where(indices > 0, indices - 1, indices + len(coordinates))
+        unique, inverse = np.unique(zero_based, return_inverse=True)
+        return coordinates[unique], inverse.reshape(-1) + 1
+
+    @staticmethod
+    def _add_vertex(
         coordinate: List[Any],
         face_object: Face,
         vertex_list: List[List[Any]],
-        vertex_indices: Dict[str, int],
     ) -> None:
         """
-        Implementation for filtering non_unique vertices
-        :param unique_vertices: Flag if vertices should be filtered
+        Adds the given coordinate as new vertex of the given face, duplicated vertices are merged afterwards in
+        a single pass (see _weld_vertices)
         :param coordinate: Current coordinate
         :param face_object: Current face
         :param vertex_list: List of all resulting vertices
-        :param vertex_indices: Dictionary mapping already known vertices (in str representation) with their idx in the list
         :return: None
         """
-        if unique_vertices:
-            str_rep = "-".join([str(a) for a in coordinate])
-            if not vertex_indices.get(str_rep):
-                vertex_indices[str_rep] = len(vertex_list) + 1
-                vertex_list.append(coordinate)
+        vertex_list.append(coordinate)
+        face_object.indices.append(len(vertex_list))
 
-            vertex_index = vertex_indices[str_rep]
-            face_object.indices.append(vertex_index + 1)
-        else:
-            face_object.indices.append(len(vertex_list))
-            vertex_list.append(coordinate)
+    @staticmethod
+    def _add_vertices(
+        coordinates: List[List[Any]],
+        face_object: Face,
+        vertex_list: List[List[Any]],
+    ) -> None:
+        """
+        Adds the given coordinates as new vertices of the given face (see _add_vertex)
+        :param coordinates: Current coordinates
+        :param face_object: Current face
+        :param vertex_list: List of all resulting vertices
+        :return: None
+        """
+        start = len(vertex_list) + 1
+        vertex_list.extend(coordinates)
+        face_object.indices.extend(range(start, len(vertex_list) + 1))
+
+    @staticmethod
+    def _weld_vertices(
+        result: GeoObjectFile, unique_vertices: bool, epsilon: float = 0.0
+    ) -> None:
+        """
+        Implementation for filtering non_unique vertices
+        :param result: read file, whose vertices and faces are updated
+        :param unique_vertices: Flag if vertices should be filtered
+        :param epsilon: tolerance used for merging vertices (0 merges only exactly equal vertices)
+        :return: None
+        """
+        if unique_vertices:
+            VertexWelder.weld(result, epsilon)
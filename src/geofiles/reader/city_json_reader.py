@@ -1,12 +1,21 @@
+import re
 from abc import ABC
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
 
 from geofiles.domain.face import Face
 from geofiles.domain.file_version import CityJsonVersion
+from geofiles.domain.geo_file_summary import GeoFileSummary
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
-from geofiles.reader.json_reader import JsonReader
+from geofiles.reader.coordinate_text import parse_numbers
+from geofiles.reader.json_reader import JsonReader, JsonStream
+
+# end of the vertices array (closing bracket of the last vertex and of the array)
+VERTICES_END = re.compile(r"\]\s*\]")
+BRACKETS = str.maketrans("[]", "  ")
 
 
 class CityJsonReader(JsonReader, BaseReader, ABC):
@@ -33,90 +42,266 @@ class CityJsonReader(JsonReader, BaseReader, ABC):
     def read_json(self, json_dict: Dict[Any, Any]) -> GeoObjectFile:
         result = GeoObjectFile()
 
+        self._validate_header(json_dict)
+        self._read_header(json_dict, result)
+
+        if json_dict.get("vertices"):
+            result.vertices = json_dict["vertices"]
+        else:
+            raise Exception("Undefined vertices in input file.")
+
+        if json_dict.get("CityObjects"):
+            city_objects = json_dict["CityObjects"]
+            for city_object_name, city_object in city_objects.items():
+                result.objects.append(
+                    self._read_city_object(city_object_name, city_object)
+                )
+        else:
+            raise Exception("No city objects defined")
+
+        return result
+
+    def scan(self, file: Any) -> GeoFileSummary:
+        """
+        Reads the metadata and transform information of a given file, the vertices and city objects are skipped
+        without being decoded
+        :param file: to be scanned (may be a string representing the path or an opened file instance)
+        :return: Summary of the file
+        """
+        return self._apply(file, self._scan, self._get_stream)
+
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        stream = JsonStream(file)
+        header: Dict[str, Any] = {}
+        result = GeoFileSummary()
+        result.num_vertices = 0
+        result.num_objects = 0
+        for key in stream.iter_object():
+            if key in ["metadata", "transform"]:
+                header[key] = stream.decode()
+            elif key == "vertices":
+                result.num_vertices = self._skip_vertices(stream)
+            elif key == "CityObjects":
+                for _ in stream.iter_object():
+                    stream.skip_value()
+                    result.num_objects += 1
+            else:
+                stream.skip_value()
+        self._read_header(header, result)
+        return result
+
+    def scan_json(self, json_dict: Dict[Any, Any]) -> GeoFileSummary:
+        """
+        Reads the metadata and transform information without creating objects and faces
+        :param json_dict: parsed json representation
+        :return: Summary of the file
+        """
+        result = GeoFileSummary()
+        self._read_header(json_dict, result)
+        result.num_vertices = len(json_dict.get("vertices", []))
+        result.num_objects = len(json_dict.get("CityObjects", {}))
+        return result
+
+    def _iter_objects(self, file: Iterable[str]) -> Iterator[GeoObjectFile]:
+        """
+        Reads the city objects one after another, the vertices are parsed into a compact array.
+        City objects that are defined before the vertices (or before a mandatory transform) are kept (with packed
+        faces) until this information is read. Metadata and optional transforms defined after the city objects only
+        apply to the following objects.
+        :param file: text chunks of the file
+        :return: iterator of files containing a single object each
+        """
+        stream = JsonStream(file)
+        header: Dict[str, Any] = dict()
+        vertices: Optional[np.ndarray] = None
+        pending: List[GeoObject] = []
+        result: Optional[GeoObjectFile] = None
+        transform_required = self._is_transform_required()
+        for key in stream.iter_object():
+            if key == "CityObjects":
+                if stream.peek() != "{":
+                    header[key] = stream.decode()
+                    continue
+                header[key] = True
+                for city_object_name in stream.iter_object():
+                    geo_object = self._read_city_object(
+                        city_object_name, stream.decode()
+                    )
+                    if result is None:
+                        geo_object.pack_faces()
+                        pending.append(geo_object)
+                    else:
+                        yield self._get_object_file(result, geo_object, vertices)
+            elif key == "vertices":
+                vertices = self._read_vertices(stream)
+                header[key] = len(vertices) > 0
+            else:
+                header[key] = stream.decode()
+                if result is not None:
+                    self._read_header({key: header[key]}, result)
+
+            if (
+                result is None
+                and vertices is not None
+                and (not transform_required or "transform" in header)
+            ):
+                result = self._get_stream_header(header)
+                for geo_object in pending:
+                    yield self._get_object_file(result, geo_object, vertices)
+                pending.clear()
+
+        if result is None:
+            result = self._get_stream_header(header)
+            for geo_object in pending:
+                yield self._get_object_file(result, geo_object, vertices)
+        if not header.get("CityObjects"):
+            raise Exception("No city objects defined")
+
+    def _get_stream_header(self, header: Dict[str, Any]) -> GeoObjectFile:
+        """
+        Creates the header file of a streamed CityJSON file
+        :param header: top level members read so far (vertices and city objects are replaced by flags)
+        :return: file containing the header information
+        """
+        result = GeoObjectFile()
+        self._validate_transform(header)
+        self._read_header(header, result)
+        if not header.get("vertices"):
+            raise Exception("Undefined vertices in input file.")
+        return result
+
+    def _validate_header(self, json_dict: Dict[Any, Any]) -> None:
+        """
+        Checks that the mandatory header information (metadata, reference system, transform) is defined
+        :param json_dict: parsed json representation
+        :return: None
+        """
         if not json_dict.get("metadata"):
             raise Exception(
                 "No metadata defined (at least reference system is required)"
             )
 
-        metadata = json_dict["metadata"]
+        self._validate_transform(json_dict)
 
-        transform = json_dict.get("transform")
-        if (
-            self.version != CityJsonVersion.V1_0
-            and transform is None
-            and not self.ignore_mandatory_transform
-        ):
+        if not json_dict["metadata"].get("referenceSystem"):
+            raise Exception("Unknown reference system in input file.")
+
+    def _validate_transform(self, json_dict: Dict[Any, Any]) -> None:
+        """
+        Checks that the transform information is defined if it is mandatory
+        :param json_dict: parsed json representation
+        :return: None
+        """
+        if self._is_transform_required() and json_dict.get("transform") is None:
             raise Exception("Transform information is mandatory in CityJSON >= 1.1")
 
+    def _is_transform_required(self) -> bool:
+        """
+        :return: true iff the transform information is mandatory (CityJSON >= 1.1 if it is not ignored)
+        """
+        return (
+            self.version != CityJsonVersion.V1_0 and not self.ignore_mandatory_transform
+        )
+
+    def _read_header(self, json_dict: Dict[Any, Any], result: Any) -> None:
+        """
+        Reads the metadata and transform information
+        :param json_dict: parsed json representation
+        :param result: GeoObjectFile or GeoFileSummary the header information is stored in
+        :return: None
+        """
+        metadata = json_dict.get("metadata")
+        if metadata:
+            result.crs = metadata.get("referenceSystem")
+            if metadata.get("geographicalExtent"):
+                extents = metadata["geographicalExtent"]
+                result.min_extent = extents[:3]
+                result.max_extent = extents[3:]
+
+        transform = json_dict.get("transform")
         if transform is not None:
-            translate = transform["translate"]
             if self.use_transform_for_origin:
-                result.origin = translate
+                result.origin = transform["translate"]
             else:
-                result.translation = translate
-            scale = transform["scale"]
-            result.scaling = scale
+                result.translation = transform["translate"]
+            result.scaling = transform["scale"]
 
-        if metadata.get("referenceSystem"):
-            result.crs = metadata.get("referenceSystem")
-        else:
-            raise Exception("Unknown reference system in input file.")
+    def _read_city_object(
+        self, city_object_name: str, city_object: Dict[Any, Any]
+    ) -> GeoObject:
+        """
+        Reads a single city object
+        :param city_object_name: identifier of the city object
+        :param city_object: parsed json representation of the city object
+        :return: Domain representation of the city object
+        """
+        geo_object = GeoObject()
+        geo_object.set_type(city_object["type"])
+        geo_object.name = city_object_name
+        geometry = city_object.get("geometry")
+        face_cnt = 0
+        if geometry:
+            for geometry_object in geometry:
+                geometry_type = geometry_object.get("type")
+                if geometry_type:
+                    geometry_type_entries = geo_object.meta_information.get(
+                        geometry_type
+                    )
+                    if geometry_type_entries is None:
+                        geometry_type_entries = []
+                        geo_object.meta_information[geometry_type] = (
+                            geometry_type_entries
+                        )
+                    geometry_type_entries.append(face_cnt)
 
-        if metadata.get("geographicalExtent"):
-            extents = metadata["geographicalExtent"]
-            result.min_extent = extents[:3]
-            result.max_extent = extents[3:]
+                boundaries = geometry_object.get("boundaries")
+                if boundaries:
+                    faces: List[Face] = []
+                    self.get_values_of_most_inner_array(boundaries, faces)
+                    geo_object.faces = faces
+                    face_cnt += len(faces) - 1
 
-        if json_dict.get("vertices"):
-            result.vertices = json_dict["vertices"]
-        else:
-            raise Exception("Undefined vertices in input file.")
-
-        if json_dict.get("CityObjects"):
-            city_objects = json_dict["CityObjects"]
-            for city_object_name, city_object in city_objects.items():
-                geo_object = GeoObject()
-                geo_object.set_type(city_object["type"])
-                result.objects.append(geo_object)
-                geo_object.name = city_object_name
-                geometry = city_object.get("geometry")
-                face_cnt = 0
-                if geometry:
-                    for geometry_object in geometry:
-                        geometry_type = geometry_object.get("type")
-                        if geometry_type:
-                            geometry_type_entries = geo_object.meta_information.get(
-                                geometry_type
-                            )
-                            if geometry_type_entries is None:
-                                geometry_type_entries = []
-                                geo_object.meta_information[
-                                    geometry_type
-                                ] = geometry_type_entries
-                            geometry_type_entries.append(face_cnt)
-
-                        boundaries = geometry_object.get("boundaries")
-                        if boundaries:
-                            faces: List[Face] = []
-                            self.get_values_of_most_inner_array(boundaries, faces)
-                            geo_object.faces = faces
-                            face_cnt += len(faces) - 1
-
-                        if geometry_type:
-                            geometry_type_entries = geo_object.meta_information.get(
-                                geometry_type
-                            )
-                            if geometry_type_entries is None:
-                                geometry_type_entries = []
-                                geo_object.meta_information[
-                                    geometry_type
-                                ] = geometry_type_entries
-                            geometry_type_entries.append(face_cnt)
+                if geometry_type:
+                    geometry_type_entries = geo_object.meta_information.get(
+                        geometry_type
+                    )
+                    if geometry_type_entries is None:
+                        geometry_type_entries = []
+                        geo_object.meta_information[geometry_type] = (
+                            geometry_type_entries
+                        )
+                    geometry_type_entries.append(face_cnt)
+        return geo_object
 
-        else:
-            raise Exception("No city objects defined")
+    @staticmethod
+    def _read_vertices(stream: JsonStream) -> np.ndarray:
+        """
+        Parses the vertices array of a CityJSON file without creating python lists
+        :param stream: stream positioned at the vertices array
+        :return: (N, 3) array of the vertices
+        """
+        stream.expect("[")
+        if stream.peek() == "]":
+            stream.expect("]")
+            return np.empty((0, 3), dtype=np.float64)
+        text = stream.read_until(VERTICES_END)
+        values = parse_numbers(text.translate(BRACKETS), np.float64, ",")
+        if len(values) != 3 * text.count("["):
+            raise Exception("Vertices have to be defined by three numbers")
+        return values.reshape(-1, 3)
 
-        return result
+    @staticmethod
+    def _skip_vertices(stream: JsonStream) -> int:
+        """
+        Skips the vertices array of a CityJSON file
+        :param stream: stream positioned at the vertices array
+        :return: number of vertices
+        """
+        stream.expect("[")
+        if stream.peek() == "]":
+            stream.expect("]")
+            return 0
+        return stream.skip_until(VERTICES_END, "[")
 
     def get_values_of_most_inner_array(
         self, input_list: List[Any], res: List[Any]
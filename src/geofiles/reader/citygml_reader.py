@@ -1,13 +1,27 @@
 import uuid
 import xml.etree.ElementTree as ET
 from abc import ABC
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from geofiles.domain.geo_file_summary import GeoFileSummary
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
 from geofiles.reader.gml_reader import GmlReader
 from geofiles.reader.xml_reader import XmlReader
 
+SURFACE_CLASSES = [
+    "GenericCityObject",
+    "CeilingSurface",
+    "InteriorWallSurface",
+    "FloorSurface",
+    "RoofSurface",
+    "WallSurface",
+    "GroundSurface",
+    "ClosureSurface",
+    "BuildingInstallation",
+]
+
 
 class CityGmlReader(GmlReader, XmlReader, BaseReader, ABC):
     """
@@ -15,8 +29,12 @@ class CityGmlReader(GmlReader, XmlReader, BaseReader, ABC):
     Note: Only polygons with their Exterior Linearrings are considered
     """
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, streaming: bool = False):
+        """
+        :param streaming: If true, the file is parsed incrementally and every Building is processed as soon as it
+        is complete
+        """
+        super().__init__(streaming)
         self.curr_object = None
         self.curr_object_used = False
 
@@ -33,30 +51,114 @@ class CityGmlReader(GmlReader, XmlReader, BaseReader, ABC):
         city_objects = xml.findall(".//cityObjectMember/Building")
 
         for city_object in city_objects:
-            self.curr_object = GeoObject()
-            self.curr_object.set_type("Building")
-            city_object_id = city_object.attrib.get("id")
-            if city_object_id is None:
-                city_object_id = str(uuid.uuid4())
-            self.curr_object.meta_information["id"] = city_object_id
-            for surface_class in [
-                "GenericCityObject",
-                "CeilingSurface",
-                "InteriorWallSurface",
-                "FloorSurface",
-                "RoofSurface",
-                "WallSurface",
-                "GroundSurface",
-                "ClosureSurface",
-                "BuildingInstallation",
-            ]:
-                self._internal_read_xml(result, city_object, f".//{surface_class}")
-            if self.curr_object_used:
-                result.objects.append(self.curr_object)
-                self.curr_object_used = False
+            self._read_building(result, city_object)
+        self.curr_object = None
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
+        return result
+
+    def read_xml_stream(self, file: Iterable[str]) -> GeoObjectFile:
+        result = GeoObjectFile()
+        for element in self._iterparse(
+            file, ["./boundedBy/Envelope", ".//cityObjectMember/Building"]
+        ):
+            if element.tag == "Envelope":
+                crs = element.attrib.get("srsName")
+                if crs is not None and result.crs is None:
+                    result.crs = crs
+            else:
+                self._read_building(result, element)
         self.curr_object = None
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
+        return result
+
+    def _read_building(self, result: GeoObjectFile, city_object: ET.Element) -> None:
+        """
+        Reads the surfaces of a single building
+        :param result: The resulting GeoObjectFile
+        :param city_object: Building element
+        :return: None
+        """
+        self.curr_object = GeoObject()
+        self.curr_object.set_type("Building")
+        city_object_id = city_object.attrib.get("id")
+        if city_object_id is None:
+            city_object_id = str(uuid.uuid4())
+        self.curr_object.meta_information["id"] = city_object_id
+        self._internal_read_surfaces(result, self._get_surfaces(city_object))
+        if self.curr_object_used:
+            result.objects.append(self.curr_object)
+            self.curr_object_used = False
+
+    @staticmethod
+    def _get_surfaces(
+        city_object: ET.Element,
+    ) -> List[Tuple[ET.Element, List[ET.Element]]]:
+        """
+        Collects the surfaces of a city object and their polygons in a single traversal.
+        Every polygon is assigned to its innermost surface, surfaces are ordered by their class (see SURFACE_CLASSES)
+        and by document order within a class.
+        :param city_object: city object element
+        :return: surface elements and their polygon elements
+        """
+        surfaces: Dict[str, List[Tuple[ET.Element, List[ET.Element]]]] = {
+            surface_class: [] for surface_class in SURFACE_CLASSES
+        }
+        stack: List[Tuple[ET.Element, Optional[List[ET.Element]]]] = [
+            (child, None) for child in reversed(city_object)
+        ]
+        while len(stack) > 0:
+            element, polygons = stack.pop()
+            if element.tag == "Polygon":
+                if polygons is not None:
+                    polygons.append(element)
+                continue
+            surface_list = surfaces.get(element.tag)
+            if surface_list is not None:
+                polygons = []
+                surface_list.append((element, polygons))
+            stack.extend((child, polygons) for child in reversed(element))
+        return [surface for c in SURFACE_CLASSES for surface in surfaces[c]]
+
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        """
+        Reads the envelope of the city model, parsing stops after the boundedBy element of the city model
+        or at the first city object
+        :param file: to be scanned
+        :return: Summary of the file (without counts)
+        """
+        result = GeoFileSummary()
+        tags: List[str] = []
+        for event, element in self._iter_events(file):
+            if event == "start":
+                tags.append(element.tag)
+                if len(tags) == 2 and element.tag == "cityObjectMember":
+                    return result
+                continue
+            tags.pop()
+            if element.tag == "Envelope" and tags[1:] == ["boundedBy"]:
+                result.crs = self._get_attribute(element, "srsName")
+                lower = self._get_corner(element, "lowerCorner")
+                upper = self._get_corner(element, "upperCorner")
+                if len(lower) > 0 and len(upper) > 0:
+                    result.min_extent = lower
+                    result.max_extent = upper
+            elif element.tag == "boundedBy" and len(tags) == 1:
+                # end of the boundedBy element of the city model
+                return result
         return result
 
+    @staticmethod
+    def _get_corner(envelope: ET.Element, name: str) -> List[float]:
+        """
+        :param envelope: Envelope element
+        :param name: name of the corner element (lowerCorner or upperCorner)
+        :return: coordinates of the corner (empty if not defined)
+        """
+        for child in envelope:
+            if child.tag == name and child.text is not None:
+                return [float(a) for a in child.text.split()]
+        return []
+
     def _internal_decorate_object(
         self, xml_object: ET.Element, geo_object: GeoObject
     ) -> None:
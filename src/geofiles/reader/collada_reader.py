@@ -1,13 +1,15 @@
-import re
 import xml.etree.ElementTree as ET
 from abc import ABC
-from typing import Any, Dict, List
+from itertools import chain
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from geofiles.conversion.static import triplewise
-from geofiles.domain.face import Face
+import numpy as np
+
+from geofiles.domain.face_table import FaceTable
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
+from geofiles.reader.coordinate_text import parse_numbers
 from geofiles.reader.xml_reader import XmlReader
 
 
@@ -16,81 +18,266 @@ class ColladaReader(XmlReader, BaseReader, ABC):
     Reader implementation for collada (.dae) files
     """
 
-    def __init__(self):
+    def __init__(self, streaming: bool = False, columnar: bool = False):
         """
         unique_vertices: defines that read vertices have to be unique
+        weld_epsilon: tolerance used for merging vertices if unique_vertices is set (0 for exact matches)
+        :param streaming: If true, the file is parsed incrementally and every geometry is processed as soon as it
+        is complete
+        :param columnar: If true, the resulting file stores its vertices as numpy arrays and its faces as packed
+        FaceTables, else python lists and Face objects are used
         """
+        super().__init__(streaming)
+        self.columnar = columnar
         self.unique_vertices = False
+        self.weld_epsilon = 0.0
 
     def read_xml(self, xml: ET.Element) -> GeoObjectFile:
-        result = GeoObjectFile()
+        result = GeoObjectFile(columnar=self.columnar)
         self.remove_namespaces(xml)
 
         if xml.attrib.get("crs") is not None:
             result.crs = xml.attrib["crs"]
 
         geometries = xml.findall(".//library_geometries/geometry")
-        vertex_list: List[List[Any]] = []
-        vertex_indices: Dict[str, int] = dict()
+        coordinates = self._get_coordinate_lists()
 
         for geometry in geometries:
-            geo_object = GeoObject()
-            mesh = geometry.find("./mesh")
-            if mesh is None:
-                raise Exception("Could not find mesh element")
-            triangles = mesh.find("./triangles")
-            if triangles is None:
-                raise Exception("Could not find triangles element")
-            vertex_input = triangles.find("./input[@semantic='VERTEX']")
-            if vertex_input is None:
+            result.objects.append(self._read_geometry(geometry, coordinates))
+        self._set_coordinates(result, coordinates)
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
+        return result
+
+    def read_xml_stream(self, file: Iterable[str]) -> GeoObjectFile:
+        result = GeoObjectFile(columnar=self.columnar)
+        coordinates = self._get_coordinate_lists()
+        for element in self._iterparse(file, [".", ".//library_geometries/geometry"]):
+            if element.tag == "geometry":
+                result.objects.append(self._read_geometry(element, coordinates))
+            elif element.attrib.get("crs") is not None:
+                result.crs = element.attrib["crs"]
+        self._set_coordinates(result, coordinates)
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
+        return result
+
+    @staticmethod
+    def _get_coordinate_lists() -> Dict[str, List[np.ndarray]]:
+        """
+        :return: empty lists of the vertex, normal and texture coordinate arrays (one per source) by their
+        GeoObjectFile attribute
+        """
+        return {"vertices": [], "normals": [], "texture_coordinates": []}
+
+    def _set_coordinates(
+        self, result: GeoObjectFile, coordinates: Dict[str, List[np.ndarray]]
+    ) -> None:
+        """
+        Assigns the read coordinates to the given file
+        :param result: The resulting GeoObjectFile
+        :param coordinates: read coordinate arrays by their GeoObjectFile attribute
+        :return: None
+        """
+        for attribute, arrays in coordinates.items():
+            values: Any = list(chain.from_iterable(a.tolist() for a in arrays))
+            if self.columnar and len({a.shape[1] for a in arrays}) == 1:
+                values = np.concatenate(arrays)
+            setattr(result, attribute, values)
+
+    def _read_geometry(
+        self, geometry: ET.Element, coordinates: Dict[str, List[np.ndarray]]
+    ) -> GeoObject:
+        """
+        Reads the triangles, polylists and polygons of a single geometry
+        :param geometry: geometry element
+        :param coordinates: vertex, normal and texture coordinate arrays read so far by their GeoObjectFile
+        attribute, the coordinates of the geometry are appended
+        :return: Domain representation of the geometry
+        """
+        geo_object = GeoObject()
+        mesh = geometry.find("./mesh")
+        if mesh is None:
+            raise Exception("Could not find mesh element")
+        primitives = [
+            element
+            for element in mesh
+            if element.tag in ["triangles", "polylist", "polygons"]
+        ]
+        if len(primitives) == 0:
+            raise Exception("Could not find triangles, polylist or polygons element")
+
+        # index of the first coordinate of every source that is already added to the coordinate lists
+        bases: Dict[str, int] = dict()
+        tables = []
+        for primitive in primitives:
+            indices, counts = self._read_primitive_indices(primitive)
+            offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+
+            arrays: Dict[str, np.ndarray] = dict()
+            for semantic, source_id, offset in self._get_inputs(primitive, mesh):
+                target = self._get_target(semantic)
+                if target is None or target in arrays:
+                    continue
+                if source_id not in bases:
+                    bases[source_id] = sum(len(a) for a in coordinates[target])
+                    coordinates[target].append(
+                        self._read_source(mesh, source_id, semantic)
+                    )
+                arrays[target] = indices[:, offset] + bases[source_id] + 1
+
+            if "vertices" not in arrays:
                 raise Exception(
                     "Could not find input element with semantic attribute VERTEX"
                 )
-            input_array_name = vertex_input.attrib["source"].replace("#", "")
-            elem = mesh.find(f"./vertices[@id='{input_array_name}']")
+            normal_indices = arrays.get("normals")
+            texture_coordinates = arrays.get("texture_coordinates")
+            tables.append(
+                FaceTable.from_arrays(
+                    arrays["vertices"],
+                    offsets,
+                    normal_indices,
+                    offsets if normal_indices is not None else None,
+                    texture_coordinates,
+                    offsets if texture_coordinates is not None else None,
+                )
+            )
+        table = FaceTable.concatenate(tables)
+        geo_object.faces = table if self.columnar else table.to_faces()
+        return geo_object
+
+    @staticmethod
+    def _get_target(semantic: str) -> Optional[str]:
+        """
+        :param semantic: semantic of an input element
+        :return: attribute of GeoObjectFile containing the coordinates of this semantic (None if not supported)
+        """
+        if semantic == "POSITION":
+            return "vertices"
+        if semantic == "NORMAL":
+            return "normals"
+        if semantic == "TEXCOORD":
+            return "texture_coordinates"
+        return None
+
+    @staticmethod
+    def _get_inputs(
+        primitive: ET.Element, mesh: ET.Element
+    ) -> List[Tuple[str, str, int]]:
+        """
+        Determines the inputs of a primitive, the VERTEX input is resolved to the inputs of the vertices element
+        :param primitive: triangles, polylist or polygons element
+        :param mesh: mesh element containing the primitive
+        :return: semantic, source id and offset of every input
+        """
+        res = []
+        for input_elem in primitive.findall("./input"):
+            semantic = input_elem.attrib.get("semantic")
+            source_id = input_elem.attrib["source"].replace("#", "")
+            offset = int(input_elem.attrib.get("offset", "0"))
+            if semantic != "VERTEX":
+                res.append((str(semantic), source_id, offset))
+                continue
+            elem = mesh.find(f"./vertices[@id='{source_id}']")
             if elem is None:
                 raise Exception("Could not find vertices element")
-            input_elem = elem.find("./input")
-            if input_elem is None:
+            vertex_inputs = elem.findall("./input")
+            if len(vertex_inputs) == 0:
                 raise Exception("Could not find input element")
-            input_array_name2 = input_elem.attrib["source"].replace("#", "")
-            source = mesh.find(f"./source[@id='{input_array_name2}']")
-            if source is None:
-                raise Exception("Could not find source element")
-            float_array = source.find("./float_array")
-            if float_array is None:
-                raise Exception("Could not find float_array element")
-            params = source.findall("./technique_common/accessor/param")
-            param_len = len(params)
-            float_array_content = float_array.text
-            if float_array_content is None:
-                raise Exception("Could not find text of float_array element")
-            positions = re.sub(
-                r"\s+", " ", float_array_content.replace("\n", " ")
-            ).split(" ")
-
-            p_elem = triangles.find("./p")
-            if p_elem is None:
-                raise Exception("Could not find p_elem element")
-            p_elem_content = p_elem.text
-            if p_elem_content is None:
-                raise Exception("Could not find text of p element")
-            indices = re.sub(r"\s+", " ", p_elem_content.replace("\n", " ")).split(" ")
-            for x in triplewise(indices):
-                face = Face()
-                for i in x:
-                    p = []
-                    for j in range(0, param_len):
-                        p.append(float(positions[int(i) * 3 + j]))
-                    self._filter_faces(
-                        self.unique_vertices,
-                        p,
-                        face,
-                        vertex_list,
-                        vertex_indices,
+            for vertex_input in vertex_inputs:
+                res.append(
+                    (
+                        str(vertex_input.attrib.get("semantic")),
+                        vertex_input.attrib["source"].replace("#", ""),
+                        offset,
                     )
-                geo_object.faces.append(face)
+                )
+        # positions are resolved first, so every primitive defines its vertices
+        res.sort(key=lambda entry: entry[0] != "POSITION")
+        return res
 
-            result.objects.append(geo_object)
-        result.vertices = vertex_list
-        return result
+    @staticmethod
+    def _read_primitive_indices(primitive: ET.Element) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Reads the interleaved indices of a triangles, polylist or polygons element
+        :param primitive: primitive element
+        :return: (N, number of inputs) array of indices (one row per face vertex), number of vertices per face
+        """
+        stride = (
+            max(
+                [
+                    int(i.attrib.get("offset", "0"))
+                    for i in primitive.findall("./input")
+                ],
+                default=0,
+            )
+            + 1
+        )
+        p_elems = primitive.findall("./p")
+        if len(p_elems) == 0:
+            raise Exception("Could not find p element")
+        texts = []
+        for p_elem in p_elems:
+            if p_elem.text is None:
+                raise Exception("Could not find text of p element")
+            texts.append(p_elem.text)
+
+        if primitive.tag == "polygons":
+            # every p element defines a single polygon
+            parsed = [parse_numbers(text, np.int64) for text in texts]
+            indices = (
+                np.concatenate(parsed) if len(parsed) > 0 else np.empty(0, np.int64)
+            )
+            counts = np.asarray([len(p) // stride for p in parsed], dtype=np.int64)
+        else:
+            indices = parse_numbers(" ".join(texts), np.int64)
+            if primitive.tag == "polylist":
+                vcount = primitive.find("./vcount")
+                if vcount is None or vcount.text is None:
+                    raise Exception("Could not find vcount element")
+                counts = parse_numbers(vcount.text, np.int64)
+            else:
+                counts = np.full(len(indices) // (3 * stride), 3, dtype=np.int64)
+
+        if len(indices) != counts.sum() * stride:
+            raise Exception(
+                f"Number of indices ({len(indices)}) does not match the number of face vertices"
+            )
+        return indices.reshape(-1, stride), counts
+
+    @staticmethod
+    def _read_source(mesh: ET.Element, source_id: str, semantic: str) -> np.ndarray:
+        """
+        Reads the coordinates of a source element considering the count, offset and stride of its accessor
+        :param mesh: mesh element containing the source
+        :param source_id: id of the source element
+        :param semantic: semantic of the input referencing the source (TEXCOORD sources are read as 2D)
+        :return: (count, number of named params) array of the coordinates
+        """
+        source = mesh.find(f"./source[@id='{source_id}']")
+        if source is None:
+            raise Exception("Could not find source element")
+        float_array = source.find("./float_array")
+        if float_array is None:
+            raise Exception("Could not find float_array element")
+        float_array_content = float_array.text
+        if float_array_content is None:
+            raise Exception("Could not find text of float_array element")
+        values = parse_numbers(float_array_content, np.float64)
+
+        accessor = source.find("./technique_common/accessor")
+        if accessor is None:
+            dimension = 2 if semantic == "TEXCOORD" else 3
+            return values.reshape(-1, dimension)
+        params = accessor.findall("./param")
+        stride = int(accessor.attrib.get("stride", str(max(len(params), 1))))
+        offset = int(accessor.attrib.get("offset", "0"))
+        count = int(accessor.attrib.get("count", str((len(values) - offset) // stride)))
+        if offset + count * stride > len(values):
+            raise Exception(f"Accessor of source {source_id} exceeds its float_array")
+        # unnamed params are skipped (see Collada specification)
+        columns = [idx for idx, param in enumerate(params) if param.attrib.get("name")]
+        if len(params) == 0:
+            columns = list(range(stride))
+        return values[offset : offset + count * stride].reshape(count, stride)[
+            :, columns
+        ]
@@ -0,0 +1,68 @@
+import warnings
+from typing import Any, Optional
+
+import numpy as np
+
+
+def parse_numbers(text: str, dtype: Any = np.float64, sep: str = " ") -> np.ndarray:
+    """
+    Parses all numbers of the given text (e.g. Collada arrays, OBJ records or CityJSON vertices) in a single
+    NumPy call
+    :param text: to be parsed
+    :param dtype: type of the numbers
+    :param sep: separator of the numbers, whitespace is allowed around it (" " for whitespace separated numbers)
+    :return: parsed numbers
+    """
+    if not text.strip():
+        return np.empty(0, dtype=dtype)
+    with warnings.catch_warnings():
+        # numpy warns (or raises if warnings are errors) if the text can not be parsed till its end
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            values: np.ndarray = np.fromstring(text, dtype=dtype, sep=sep)
+        except (DeprecationWarning, ValueError):
+            raise Exception(f"Invalid number text: {text[:50]}")
+    return values
+
+
+def parse_coordinates(
+    text: str,
+    dimension: Optional[int] = None,
+    drop_closing: bool = False,
+    default_dimension: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Parses a coordinate text (e.g. GML posList/pos or KML coordinates) in a single NumPy call.
+    Supported encodings are whitespace separated values ("x y z x y z") and whitespace separated tuples of comma
+    separated values ("x,y,z x,y,z").
+    :param text: to be parsed
+    :param dimension: number of values per coordinate (e.g. srsDimension), if not given it is derived from the
+    first comma separated tuple
+    :param drop_closing: If true, the last coordinate is removed if it closes the ring (i.e. equals the first one)
+    :param default_dimension: dimension of whitespace separated values if no dimension is given, if None the
+    coordinates are expected to be separated by line breaks and the dimension is derived from the first line
+    :return: (N, dimension) array of the coordinates
+    """
+    if "," in text:
+        if dimension is None:
+            dimension = text.split(None, 1)[0].count(",") + 1
+        text = text.replace(",", " ")
+    elif dimension is None:
+        dimension = default_dimension
+        if dimension is None:
+            first_line = next((line for line in text.splitlines() if line.strip()), "")
+            dimension = max(len(first_line.split()), 1)
+
+    values = parse_numbers(text)
+    if len(values) % dimension != 0:
+        raise Exception(
+            f"Number of values ({len(values)}) is not a multiple of the dimension {dimension}"
+        )
+    coordinates = values.reshape(-1, dimension)
+    if (
+        drop_closing
+        and len(coordinates) > 1
+        and np.array_equal(coordinates[0], coordinates[-1])
+    ):
+        coordinates = coordinates[:-1]
+    return coordinates
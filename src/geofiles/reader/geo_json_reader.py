@@ -17,8 +17,10 @@ class GeoJsonReader(JsonReader, BaseReader, ABC):
     def __init__(self):
         """
         unique_vertices: defines that read vertices have to be unique
+        weld_epsilon: tolerance used for merging vertices if unique_vertices is set (0 for exact matches)
         """
         self.unique_vertices = False
+        self.weld_epsilon = 0.0
 
     def read_json(self, json_dict: Dict[Any, Any]) -> GeoObjectFile:
         if not json_dict.get("type") or json_dict.get("type") != "FeatureCollection":
@@ -27,7 +29,6 @@ class GeoJsonReader(JsonReader, BaseReader, ABC):
         result = GeoObjectFile()
         result.crs = "urn:ogc:def:crs:OGC:2:84"
         vertex_list: List[List[Any]] = []
-        vertex_indices: Dict[str, int] = dict()
 
         features = json_dict.get("features")
         if features:
@@ -60,14 +61,9 @@ class GeoJsonReader(JsonReader, BaseReader, ABC):
                         face_object = Face()
                         geo_object.faces.append(face_object)
                         for coordinate in face:
-                            self._filter_faces(
-                                self.unique_vertices,
-                                coordinate,
-                                face_object,
-                                vertex_list,
-                                vertex_indices,
-                            )
+                            self._add_vertex(coordinate, face_object, vertex_list)
         result.vertices = vertex_list
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
         return result
 
     def get_values_of_most_inner_array(
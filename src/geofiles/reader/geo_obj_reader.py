@@ -1,25 +1,117 @@
 from abc import ABC
-from typing import Iterable
+from typing import Any, Dict, Generator, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
 
 from geofiles.domain.face import Face
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_file_summary import GeoFileSummary
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
+from geofiles.domain.growable_array import GrowableArray
 from geofiles.reader.base import BaseReader
+from geofiles.reader.coordinate_text import parse_numbers
 
 
 class GeoObjReader(BaseReader, ABC):
     """
     Reader implementation for geo-referenced .obj files
+    Vertex, normal, texture coordinate and face records are collected in blocks and parsed in bulk,
+    all other records (header, hierarchy, meta information) are parsed line by line.
     """
 
+    def __init__(self, columnar: bool = False, block_size: int = 65536) -> None:
+        """
+        :param columnar: If true, the resulting file stores its vertices as numpy arrays and its faces as packed
+        FaceTables, else python lists and Face objects are used
+        :param block_size: number of geometry records that are parsed at once
+        """
+        self.columnar = columnar
+        self.block_size = block_size
+
     def _read(self, file: Iterable[str]) -> GeoObjectFile:
         """
         Reads a given .geoobj file
         :param file: to be read (may be a string representing the path or an opened file instance)
         :return: Domain representation of the GeoObject
         """
-        res = GeoObjectFile()
+        res = GeoObjectFile(columnar=self.columnar)
+
+        # geometry records are buffered by their keyword and parsed block-wise
+        buffers: Dict[str, List[str]] = {"v ": [], "vn": [], "vt": [], "f ": []}
+        blocks: Dict[str, List[Any]] = {"v ": [], "vn": [], "vt": [], "f ": []}
+        for geo_object in self._read_objects(file, res, buffers, blocks):
+            res.objects.append(geo_object)
+
+        for key, attribute in [
+            ("v ", "vertices"),
+            ("vn", "normals"),
+            ("vt", "texture_coordinates"),
+        ]:
+            if buffers[key]:
+                blocks[key].append(self._parse_block(key, buffers[key]))
+            if blocks[key]:
+                setattr(res, attribute, self._combine_coordinates(blocks[key]))
+
+        return res
+
+    def _iter_objects(self, file: Iterable[str]) -> Iterator[GeoObjectFile]:
+        """
+        Reads the objects of a given .geoobj file one after another (split on "o" and "g" records).
+        Since faces may reference any previously defined vertex, the coordinates read so far are kept as compact
+        arrays, whereas the faces and the python objects only exist for the current object.
+        :param file: target to be read
+        :return: iterator of files containing a single object each
+        """
+        res = GeoObjectFile(columnar=self.columnar)
+        buffers: Dict[str, List[str]] = {"v ": [], "vn": [], "vt": [], "f ": []}
+        blocks: Dict[str, List[Any]] = {"v ": [], "vn": [], "vt": [], "f ": []}
+        coordinates: Dict[str, GrowableArray] = {}
+        for geo_object in self._read_objects(file, res, buffers, blocks):
+            for key in ["v ", "vn", "vt"]:
+                if buffers[key]:
+                    blocks[key].append(self._parse_block(key, buffers[key]))
+                    buffers[key].clear()
+                for block in blocks[key]:
+                    try:
+                        block = np.asarray(block, dtype=np.float64)
+                    except ValueError:
+                        raise Exception(
+                            "Objects can only be iterated for coordinates of uniform dimension"
+                        )
+                    if key not in coordinates:
+                        coordinates[key] = GrowableArray(row_shape=block.shape[1:])
+                    coordinates[key].extend(block)
+                blocks[key].clear()
+            yield self._get_object_file(
+                res,
+                geo_object,
+                (
+                    coordinates["v "].array
+                    if "v " in coordinates
+                    else np.empty((0, 3), dtype=np.float64)
+                ),
+                coordinates["vn"].array if "vn" in coordinates else None,
+                coordinates["vt"].array if "vt" in coordinates else None,
+                self.columnar,
+            )
 
+    def _read_objects(
+        self,
+        file: Iterable[str],
+        res: GeoObjectFile,
+        buffers: Dict[str, List[str]],
+        blocks: Dict[str, List[Any]],
+    ) -> Generator[GeoObject, None, None]:
+        """
+        Reads the records of a given .geoobj file, header information is stored in the given file
+        and objects are returned as soon as they are complete (i.e. their faces are assigned)
+        :param file: to be read
+        :param res: file the header information is stored in
+        :param buffers: buffered geometry records by their keyword
+        :param blocks: parsed geometry blocks by their keyword
+        :return: generator of the read objects
+        """
         current_level = 0
         current_parent = None
         current_object = GeoObject()
@@ -28,41 +120,44 @@ class GeoObjReader(BaseReader, ABC):
         filled_group = False
 
         for line in file:
-            trimmed = line.strip()
-            if not trimmed:
+            # check if current line is a vertex, normal, texture coordinate or face definition
+            key = line[:2]
+            buffer = buffers.get(key)
+            if buffer is None or (line[1] != " " and line[2:3] != " "):
+                trimmed = line.strip()
+                if not trimmed:
+                    continue
+                trimmed = " ".join(trimmed.split())
+                key = trimmed[:2]
+                buffer = buffers.get(key)
+                if buffer is None or (trimmed[1:2] != " " and trimmed[2:3] != " "):
+                    buffer = None
+                else:
+                    line = trimmed
+            if buffer is not None:
+                if line[-1] != "\n":
+                    line += "\n"
+                buffer.append(line)
+                if key != "v ":
+                    filled_group = True
+                if len(buffer) >= self.block_size:
+                    blocks[key].append(self._parse_block(key, buffer))
+                    buffer.clear()
                 continue
-            trimmed = " ".join(trimmed.split())
-            # check if current line is a classic vertex
-            if trimmed.startswith("v "):
-                coordinates = list([float(a) for a in trimmed[2:].split(" ")])
-                res.vertices.append(coordinates)
-            # check if current line is a face defintion
-            elif trimmed.startswith("f "):
-                face_defs = trimmed[2:].split(" ")
-                face = Face()
-                for face_def in face_defs:
-                    vals = face_def.split("/")
-                    list_len = len(vals)
-                    if list_len > 0:
-                        face.indices.append(int(vals[0]))
-                    if list_len > 1 and vals[1] is not None and len(vals[1]) != 0:
-                        face.texture_coordinates.append(int(vals[1]))
-                    if list_len > 2:
-                        face.normal_indices.append(int(vals[2]))
-                current_object.faces.append(face)
-                filled_group = True
+
             # check if current line is a group definition
-            elif trimmed.startswith("g ") or trimmed.startswith("o "):
+            if trimmed.startswith("g ") or trimmed.startswith("o "):
                 name = trimmed[2:]
                 # if it is the first group definition and if we have not found any other definition
                 # just set the name of the current group; otherwise it is a new group
                 if not found_group and not filled_group:
                     current_object.name = name
                 else:
+                    self._assign_faces(current_object, buffers, blocks)
                     new_object = GeoObject()
                     new_object.name = name
                     new_object.parent = current_parent
-                    res.objects.append(current_object)
+                    yield current_object
                     last_added_object = current_object
                     current_object = new_object
                 if trimmed.startswith("g "):
@@ -87,60 +182,268 @@ class GeoObjReader(BaseReader, ABC):
                         ):
                             current_parent = current_parent.parent
                 current_level = new_level
-            # check if the current line defines the coordinate reference system
-            elif trimmed.startswith("crs "):
-                res.crs = trimmed[4:]
-            # check if the current line defines the origin
-            elif trimmed.startswith("or "):
-                res.origin = [float(a) for a in trimmed[3:].split(" ")]
-            # check if the current line defines a file scale
-            elif trimmed.startswith("sc "):
-                scale = [float(a) for a in trimmed[3:].split(" ")]
-                if not found_group:
-                    res.scaling = scale
-                else:
-                    current_object.scaling = scale
-            # check if the current line defines a file translation
-            elif trimmed.startswith("t "):
-                translation = [float(a) for a in trimmed[2:].split(" ")]
-                if not found_group:
-                    res.translation = translation
-                else:
-                    current_object.translation = translation
-            # check if the current line defines a file rotation
-            elif trimmed.startswith("r "):
-                rotation = [float(a) for a in trimmed[2:].split(" ")]
-                if not found_group:
-                    res.rotation = rotation
-                else:
-                    current_object.rotation = rotation
-            elif trimmed.startswith("e "):
-                extent = [float(a) for a in trimmed[2:].split(" ")]
-                res.min_extent = extent[:3]
-                res.max_extent = extent[3:]
-            # check if the current line defines a texture coordinate
-            elif trimmed.startswith("vt "):
-                coordinates = [float(a) for a in trimmed[3:].split(" ")]
-                res.texture_coordinates.append(coordinates)
-                filled_group = True
-            # check if the current line defines a coordinate's normal
-            elif trimmed.startswith("vn "):
-                coordinates = [float(a) for a in trimmed[3:].split(" ")]
-                res.normals.append(coordinates)
-                filled_group = True
-            elif trimmed.startswith("m ") or trimmed.startswith("mf "):
-                splits = trimmed.split(" ")
-                if splits[0] == "m":
-                    target = current_object.meta_information
-                else:
-                    target = res.meta_information
-
-                if len(splits) == 3:
-                    target[splits[1]] = splits[2]
-                elif len(splits) > 3:
-                    target[splits[1]] = tuple(splits[2:])
+            else:
+                self._read_header_element(trimmed, res, current_object, found_group)
 
+        self._assign_faces(current_object, buffers, blocks)
         if last_added_object is not current_object:
-            res.objects.append(current_object)
+            yield current_object
 
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        """
+        Reads the file header, which ends at the first geometry, group or object record
+        :param file: to be scanned
+        :return: Summary of the file (without counts, since .geoobj files do not define them)
+        """
+        res = GeoObjectFile()
+        for line in file:
+            trimmed = " ".join(line.split())
+            if not trimmed:
+                continue
+            if trimmed.split(" ", 1)[0] in ["v", "vn", "vt", "f", "g", "o", "h", "m"]:
+                break
+            self._read_header_element(trimmed, res, GeoObject(), False)
+        return GeoFileSummary.from_file(res, False)
+
+    @staticmethod
+    def _read_header_element(
+        trimmed: str, res: GeoObjectFile, current_object: GeoObject, found_group: bool
+    ) -> None:
+        """
+        Reads a header or transformation record (crs, or, sc, t, r, e, m, mf)
+        :param trimmed: normalized record
+        :param res: file the header information is stored in
+        :param current_object: object the object based records (m and transformations within groups) belong to
+        :param found_group: true iff a group or object was already defined, so transformations belong to the
+        current object
+        :return: None
+        """
+        # check if the current line defines the coordinate reference system
+        if trimmed.startswith("crs "):
+            res.crs = trimmed[4:]
+        # check if the current line defines the origin
+        elif trimmed.startswith("or "):
+            res.origin = [float(a) for a in trimmed[3:].split(" ")]
+        # check if the current line defines a file scale
+        elif trimmed.startswith("sc "):
+            scale = [float(a) for a in trimmed[3:].split(" ")]
+            if not found_group:
+                res.scaling = scale
+            else:
+                current_object.scaling = scale
+        # check if the current line defines a file translation
+        elif trimmed.startswith("t "):
+            translation = [float(a) for a in trimmed[2:].split(" ")]
+            if not found_group:
+                res.translation = translation
+            else:
+                current_object.translation = translation
+        # check if the current line defines a file rotation
+        elif trimmed.startswith("r "):
+            rotation = [float(a) for a in trimmed[2:].split(" ")]
+            if not found_group:
+                res.rotation = rotation
+            else:
+                current_object.rotation = rotation
+        elif trimmed.startswith("e "):
+            extent = [float(a) for a in trimmed[2:].split(" ")]
+            res.min_extent = extent[:3]
+            res.max_extent = extent[3:]
+        elif trimmed.startswith("m ") or trimmed.startswith("mf "):
+            splits = trimmed.split(" ")
+            if splits[0] == "m":
+                target = current_object.meta_information
+            else:
+                target = res.meta_information
+
+            if len(splits) == 3:
+                target[splits[1]] = splits[2]
+            elif len(splits) > 3:
+                target[splits[1]] = tuple(splits[2:])
+
+    def _assign_faces(
+        self,
+        geo_object: GeoObject,
+        buffers: Dict[str, List[str]],
+        blocks: Dict[str, List[Any]],
+    ) -> None:
+        """
+        Parses the buffered face records and assigns them to the given object
+        :param geo_object: object the buffered faces belong to
+        :param buffers: buffered records
+        :param blocks: already parsed blocks
+        :return: None
+        """
+        if buffers["f "]:
+            blocks["f "].append(self._parse_block("f ", buffers["f "]))
+            buffers["f "].clear()
+        if blocks["f "]:
+            table = FaceTable.concatenate(blocks["f "])
+            geo_object.faces = table if self.columnar else table.to_faces()
+            blocks["f "].clear()
+
+    def _combine_coordinates(self, blocks: List[Any]) -> Any:
+        """
+        Combines the parsed coordinate blocks
+        :param blocks: numpy arrays of uniform coordinates or lists of non-uniform coordinates
+        :return: all coordinates (numpy array in columnar mode if possible, else list)
+        """
+        if all(isinstance(b, np.ndarray) for b in blocks) and (
+            len({b.shape[1] for b in blocks}) == 1
+        ):
+            array = np.concatenate(blocks) if len(blocks) > 1 else blocks[0]
+            return array if self.columnar else array.tolist()
+        res: List[List[float]] = []
+        for block in blocks:
+            res.extend(block.tolist() if isinstance(block, np.ndarray) else block)
         return res
+
+    @staticmethod
+    def _parse_block(key: str, lines: List[str]) -> Any:
+        """
+        Parses a block of records
+        :param key: record type ("v ", "vn", "vt" or "f ")
+        :param lines: records (each terminated by a newline)
+        :return: FaceTable for faces, (N, dim) array for uniform coordinates, else list of coordinates
+        """
+        text = "".join(lines)
+        counts = GeoObjReader._count_values(text)
+        if counts is None:
+            lines = [" ".join(line.split()) + "\n" for line in lines]
+            text = "".join(lines)
+            counts = GeoObjReader._count_values(text)
+        text = text.replace(key.strip(), "")
+
+        if key == "f ":
+            table = GeoObjReader._parse_face_block(text, lines[0], counts)
+            if table is None:
+                table = FaceTable.from_faces(
+                    [GeoObjReader._parse_face(line) for line in lines]
+                )
+            return table
+
+        if counts is not None and len(counts) > 0 and np.all(counts == counts[0]):
+            values = GeoObjReader._try_parse_numbers(text, np.float64)
+            if values is not None and len(values) == counts.sum():
+                return values.reshape(len(counts), int(counts[0]))
+        return [[float(a) for a in line.split()[1:]] for line in lines]
+
+    @staticmethod
+    def _parse_face_block(
+        text: str, first_line: str, counts: Optional[np.ndarray]
+    ) -> Optional[FaceTable]:
+        """
+        Parses a block of face records, which use the same index layout (v, v/vt, v/vt/vn or v//vn) for all vertices
+        :param text: face records without keywords
+        :param first_line: first face record, used for determining the index layout
+        :param counts: number of vertices per face
+        :return: FaceTable or None if the block can not be parsed in bulk
+        """
+        if counts is None or len(counts) == 0:
+            return None
+        first_token = first_line.split()[1]
+        slashes = first_token.count("/")
+        double_slashes = first_token.count("//")
+        num_tokens = int(counts.sum())
+        if slashes > 2 or double_slashes > 1:
+            return None
+        # every token has to use the layout of the first token, else the values would be assigned wrongly
+        slash_counts, double_slash_counts = GeoObjReader._count_slashes(text)
+        if (
+            len(slash_counts) != num_tokens
+            or np.any(slash_counts != slashes)
+            or np.any(double_slash_counts != double_slashes)
+        ):
+            return None
+
+        num_values = slashes + 1 - double_slashes
+        values = GeoObjReader._try_parse_numbers(text.replace("/", " "), np.int64)
+        if values is None or len(values) != num_tokens * num_values:
+            return None
+        values = values.reshape(num_tokens, num_values)
+
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        normal_indices = None
+        texture_coordinates = None
+        if double_slashes == 1:
+            normal_indices = values[:, 1]
+        elif slashes > 0:
+            texture_coordinates = values[:, 1]
+            if slashes == 2:
+                normal_indices = values[:, 2]
+        return FaceTable.from_arrays(
+            values[:, 0],
+            offsets,
+            normal_indices,
+            offsets,
+            texture_coordinates,
+            offsets,
+        )
+
+    @staticmethod
+    def _count_slashes(text: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Counts the slashes of every token, requires records that are separated by single spaces
+        :param text: newline terminated face records without keywords
+        :return: number of slashes per token, number of double slashes per token
+        """
+        data = np.frombuffer(text.encode(), dtype=np.uint8)
+        separators = (data == ord(" ")) | (data == ord("\n"))
+        token_ids = np.cumsum(separators)
+        num_ids = int(token_ids[-1]) + 1 if len(token_ids) > 0 else 0
+        non_empty = np.bincount(token_ids[~separators], minlength=num_ids) > 0
+        is_slash = data == ord("/")
+        double_slashes = is_slash[:-1] & is_slash[1:]
+        slash_counts = np.bincount(token_ids[is_slash], minlength=num_ids)
+        double_slash_counts = np.bincount(
+            token_ids[:-1][double_slashes], minlength=num_ids
+        )
+        return slash_counts[non_empty], double_slash_counts[non_empty]
+
+    @staticmethod
+    def _count_values(text: str) -> Optional[np.ndarray]:
+        """
+        Counts the values per record, requires records that are separated by single spaces
+        :param text: newline terminated records
+        :return: number of values per record (excluding the keyword) or None if the records are not normalized
+        """
+        if "  " in text or " \n" in text or "\t" in text or "\r" in text:
+            return None
+        data = np.frombuffer(text.encode(), dtype=np.uint8)
+        spaces = np.cumsum(data == ord(" "))[data == ord("\n")]
+        counts: np.ndarray = np.diff(spaces, prepend=0)
+        return counts
+
+    @staticmethod
+    def _try_parse_numbers(text: str, dtype: Any) -> Optional[np.ndarray]:
+        """
+        Parses all whitespace separated numbers of the given text
+        :param text: to be parsed
+        :param dtype: type of the numbers
+        :return: parsed numbers or None if the text contains invalid values (handled by the caller)
+        """
+        try:
+            return parse_numbers(text, dtype)
+        except Exception:
+            return None
+
+    @staticmethod
+    def _parse_face(line: str) -> Face:
+        """
+        Parses a single face record
+        :param line: face record
+        :return: parsed face
+        """
+        face_defs = line.split()[1:]
+        face = Face()
+        for face_def in face_defs:
+            vals = face_def.split("/")
+            list_len = len(vals)
+            if list_len > 0:
+                face.indices.append(int(vals[0]))
+            if list_len > 1 and vals[1] is not None and len(vals[1]) != 0:
+                face.texture_coordinates.append(int(vals[1]))
+            if list_len > 2:
+                face.normal_indices.append(int(vals[2]))
+        return face
@@ -1,7 +1,8 @@
 from abc import ABC
-from typing import Any, Iterable
+from typing import Any, Iterable, List, Optional
 
 from geofiles.domain.face import Face
+from geofiles.domain.geo_file_summary import GeoFileSummary
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
@@ -31,19 +32,10 @@ class GeoOffReader(BaseReader, ABC):
 
             if not found_headerdefinition:
                 # We have not found a header definition yet, so search for a GeoOFF or OFF header
-                idx = trimmed.find("GeoOFF")
-                if idx >= 0:
-                    # found a GeoOFF header, so will look for the crs definition + further options
-                    headerdefinition.append("crs")
-                    postfix = trimmed[idx + len("GeoOFF") :]
+                definition = self._get_header_definition(trimmed)
+                if definition is not None:
+                    headerdefinition = definition
                     found_headerdefinition = True
-                    for e in postfix:
-                        headerdefinition.append(e)
-                    headerdefinition.append("header")
-                elif trimmed.endswith("OFF"):
-                    # found a classic OFF file
-                    found_headerdefinition = True
-                    headerdefinition.append("header")
             elif search_for_vertices:
                 # We already looking for vertices and faces, since we know the number of vertices, just count to know when the faces start
                 splits = trimmed.split(" ")
@@ -61,35 +53,98 @@ class GeoOffReader(BaseReader, ABC):
                 element = headerdefinition.pop(0)
                 splits = trimmed.split(" ")
 
-                if element == "crs":
-                    res.crs = splits[0]
-                elif element == "header":
+                if element == "header":
                     num_of_vertices = int(splits[0])
                     search_for_vertices = True
-                elif element == "o":
-                    res.origin = [float(a) for a in splits]
-                elif element == "e":
-                    extents = [float(a) for a in splits]
-                    res.min_extent = extents[:3]
-                    res.max_extent = extents[3:]
-                elif element == "s":
-                    res.scaling = [float(a) for a in splits]
-                elif element == "t":
-                    res.translation = [float(a) for a in splits]
-                elif element == "r":
-                    res.rotation = [float(a) for a in splits]
-                elif element in ["m", "f"]:
-                    if element == "m":
-                        target = obj.meta_information
-                    else:
-                        target = res.meta_information
-
-                    k = splits[0]
-                    v: Any = ""
-                    if len(splits) > 2:
-                        v = tuple(splits[1:])
-                    else:
-                        v = splits[1]
-                    target[k] = v
+                else:
+                    self._read_header_element(element, splits, res, obj)
 
         return res
+
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        """
+        Reads the header up to the line defining the number of vertices and faces
+        :param file: to be scanned
+        :return: Summary of the file
+        """
+        res = GeoObjectFile()
+        obj = GeoObject()
+        headerdefinition: Optional[List[str]] = None
+        counts: List[str] = []
+        for line in file:
+            trimmed = " ".join(line.split())
+            if not trimmed:
+                continue
+            if headerdefinition is None:
+                headerdefinition = self._get_header_definition(trimmed)
+                continue
+            element = headerdefinition.pop(0)
+            splits = trimmed.split(" ")
+            if element == "header":
+                counts = splits
+                break
+            self._read_header_element(element, splits, res, obj)
+
+        summary = GeoFileSummary.from_file(res, False)
+        if len(counts) > 1:
+            summary.num_vertices = int(counts[0])
+            summary.num_faces = int(counts[1])
+            summary.num_objects = 1
+        return summary
+
+    @staticmethod
+    def _get_header_definition(trimmed: str) -> Optional[List[str]]:
+        """
+        Determines the header lines following the given line
+        :param trimmed: normalized line
+        :return: names of the following header lines or None if the line is no GeoOFF or OFF header
+        """
+        idx = trimmed.find("GeoOFF")
+        if idx >= 0:
+            # found a GeoOFF header, so will look for the crs definition + further options
+            postfix = trimmed[idx + len("GeoOFF") :]
+            return ["crs"] + list(postfix) + ["header"]
+        if trimmed.endswith("OFF"):
+            # found a classic OFF file
+            return ["header"]
+        return None
+
+    @staticmethod
+    def _read_header_element(
+        element: str, splits: List[str], res: GeoObjectFile, obj: GeoObject
+    ) -> None:
+        """
+        Reads a line of the GeoOFF header
+        :param element: name of the header line
+        :param splits: values of the line
+        :param res: resulting file
+        :param obj: resulting object
+        :return: None
+        """
+        if element == "crs":
+            res.crs = splits[0]
+        elif element == "o":
+            res.origin = [float(a) for a in splits]
+        elif element == "e":
+            extents = [float(a) for a in splits]
+            res.min_extent = extents[:3]
+            res.max_extent = extents[3:]
+        elif element == "s":
+            res.scaling = [float(a) for a in splits]
+        elif element == "t":
+            res.translation = [float(a) for a in splits]
+        elif element == "r":
+            res.rotation = [float(a) for a in splits]
+        elif element in ["m", "f"]:
+            if element == "m":
+                target = obj.meta_information
+            else:
+                target = res.meta_information
+
+            k = splits[0]
+            v: Any = ""
+            if len(splits) > 2:
+                v = tuple(splits[1:])
+            else:
+                v = splits[1]
+            target[k] = v
@@ -1,17 +1,117 @@
+import mmap
+import struct
 from abc import ABC
-from typing import Iterable
+from typing import Any, Dict, Iterable, List, Tuple
+
+import numpy as np
 
 from geofiles.domain.face import Face
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_file_summary import GeoFileSummary
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
 
+PLY_TYPES = {
+    "char": "i1",
+    "int8": "i1",
+    "uchar": "u1",
+    "uint8": "u1",
+    "short": "i2",
+    "int16": "i2",
+    "ushort": "u2",
+    "uint16": "u2",
+    "int": "i4",
+    "int32": "i4",
+    "uint": "u4",
+    "uint32": "u4",
+    "float": "f4",
+    "float32": "f4",
+    "double": "f8",
+    "float64": "f8",
+}
+
 
 class GeoPlyReader(BaseReader, ABC):
     """
     Reader implementaiton for geo-referenced .ply files (.geoply)
+    Supports ascii bodies as well as binary_little_endian and binary_big_endian bodies. Binary files are memory
+    mapped and their vertex and face blocks are accessed via numpy without parsing.
     """
 
+    def __init__(self, columnar: bool = False) -> None:
+        """
+        :param columnar: If true, the resulting file stores its vertices as numpy arrays and its faces as packed
+        FaceTable (binary files: vertices stored as native doubles are mapped without copying), else python lists
+        and Face objects are used
+        """
+        self.columnar = columnar
+
+    def read(self, file: Any) -> GeoObjectFile:
+        """
+        Reads a given file
+        :param file: to be read (may be a string representing the path or an opened file instance)
+        :return: Domain representation of the GeoObjectFile
+        """
+        if isinstance(file, str):
+            with open(file, "rb") as binary_file:
+                header_lines = []
+                for line in iter(binary_file.readline, b""):
+                    header_lines.append(line.decode("ascii").strip())
+                    if header_lines[-1] == "end_header":
+                        break
+                body_offset = binary_file.tell()
+                if self._get_format(header_lines) != "ascii":
+                    mapped = mmap.mmap(binary_file.fileno(), 0, access=mmap.ACCESS_READ)
+                    return self._read_binary(header_lines, mapped, body_offset)
+        return super().read(file)
+
+    def scan(self, file: Any) -> GeoFileSummary:
+        """
+        Reads the header information of a given file, reading stops after end_header
+        :param file: to be scanned (may be a string representing the path or an opened file instance)
+        :return: Summary of the file
+        """
+        if isinstance(file, str):
+            # the header is read in binary mode, since the body may be binary
+            with open(file, "rb") as binary_file:
+                header_lines = []
+                for line in iter(binary_file.readline, b""):
+                    header_lines.append(line.decode("ascii"))
+                    if header_lines[-1].strip() == "end_header":
+                        break
+                return self._scan(header_lines)
+        return super().scan(file)
+
+    def read_bytes(self, data: bytes) -> GeoObjectFile:
+        """
+        Reads a given ascii or binary PLY file content
+        :param data: content of the file
+        :return: Domain representation of the GeoObjectFile
+        """
+        header_end = data.find(b"end_header")
+        if header_end < 0:
+            raise Exception("Could not find end_header")
+        body_offset = data.index(b"\n", header_end) + 1
+        header_lines = data[:body_offset].decode("ascii").splitlines()
+        if self._get_format(header_lines) == "ascii":
+            return self.read_string(data.decode("ascii"))
+        return self._read_binary(
+            [line.strip() for line in header_lines], data, body_offset
+        )
+
+    @staticmethod
+    def _get_format(header_lines: List[str]) -> str:
+        """
+        :param header_lines: lines of the PLY header
+        :return: format of the body (ascii if not defined)
+        """
+        for line in header_lines:
+            splits = line.split()
+            if len(splits) > 1 and splits[0] == "format":
+                return splits[1]
+        return "ascii"
+
     def _read(self, file: Iterable[str]) -> GeoObjectFile:
         res = GeoObjectFile()
         obj = GeoObject()
@@ -26,35 +126,12 @@ class GeoPlyReader(BaseReader, ABC):
                 continue
             trimmed = " ".join(trimmed.split())
             if not search_for_vertices:
-                if trimmed.startswith("crs"):
-                    res.crs = trimmed[4:]
-                elif trimmed.startswith("element vertex"):
+                if trimmed.startswith("element vertex"):
                     num_of_vertices = int(trimmed[14:])
-                elif trimmed.startswith("origin"):
-                    res.origin = [float(a) for a in trimmed[7:].split(" ")]
-                elif trimmed.startswith("scale"):
-                    res.scaling = [float(a) for a in trimmed[6:].split(" ")]
-                elif trimmed.startswith("translate"):
-                    res.translation = [float(a) for a in trimmed[10:].split(" ")]
-                elif trimmed.startswith("rotate"):
-                    res.rotation = [float(a) for a in trimmed[7:].split(" ")]
-                elif trimmed.startswith("extent"):
-                    extent = [float(a) for a in trimmed[7:].split(" ")]
-                    res.min_extent = extent[:3]
-                    res.max_extent = extent[3:]
-                elif trimmed.startswith("meta"):
-                    splits = trimmed.split(" ")
-                    if splits[0] == "meta":
-                        target = obj.meta_information
-                    else:
-                        target = res.meta_information
-
-                    if len(splits) > 3:
-                        target[splits[1]] = tuple(splits[2:])
-                    else:
-                        target[splits[1]] = splits[2]
                 elif trimmed.startswith("end_header"):
                     search_for_vertices = True
+                else:
+                    self._read_header_line(trimmed, res, obj)
             else:
                 splits = trimmed.split(" ")
                 if cnt < num_of_vertices:
@@ -65,4 +142,218 @@ class GeoPlyReader(BaseReader, ABC):
                     face.indices = [int(a) + 1 for a in splits[1:]]
                     obj.faces.append(face)
 
+        if self.columnar:
+            res.to_columnar()
+            obj.pack_faces()
         return res
+
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        """
+        Reads the header up to end_header
+        :param file: to be scanned
+        :return: Summary of the file
+        """
+        res = GeoObjectFile()
+        obj = GeoObject()
+        counts: Dict[str, int] = {}
+        for line in file:
+            trimmed = " ".join(line.split())
+            if trimmed.startswith("end_header"):
+                break
+            splits = trimmed.split(" ")
+            if splits[0] == "element" and len(splits) > 2:
+                counts[splits[1]] = int(splits[2])
+            elif trimmed:
+                self._read_header_line(trimmed, res, obj)
+
+        summary = GeoFileSummary.from_file(res, False)
+        summary.num_vertices = counts.get("vertex")
+        summary.num_faces = counts.get("face")
+        summary.num_objects = 1
+        return summary
+
+    @staticmethod
+    def _read_header_line(trimmed: str, res: GeoObjectFile, obj: GeoObject) -> None:
+        """
+        Reads the geo-referencing information of a header line
+        :param trimmed: normalized header line
+        :param res: resulting file
+        :param obj: resulting object
+        :return: None
+        """
+        if trimmed.startswith("crs"):
+            res.crs = trimmed[4:]
+        elif trimmed.startswith("origin"):
+            res.origin = [float(a) for a in trimmed[7:].split(" ")]
+        elif trimmed.startswith("scale"):
+            res.scaling = [float(a) for a in trimmed[6:].split(" ")]
+        elif trimmed.startswith("translate"):
+            res.translation = [float(a) for a in trimmed[10:].split(" ")]
+        elif trimmed.startswith("rotate"):
+            res.rotation = [float(a) for a in trimmed[7:].split(" ")]
+        elif trimmed.startswith("extent"):
+            extent = [float(a) for a in trimmed[7:].split(" ")]
+            res.min_extent = extent[:3]
+            res.max_extent = extent[3:]
+        elif trimmed.startswith("meta"):
+            splits = trimmed.split(" ")
+            if splits[0] == "meta":
+                target = obj.meta_information
+            else:
+                target = res.meta_information
+
+            if len(splits) > 3:
+                target[splits[1]] = tuple(splits[2:])
+            else:
+                target[splits[1]] = splits[2]
+
+    def _read_binary(
+        self, header_lines: List[str], data: Any, body_offset: int
+    ) -> GeoObjectFile:
+        """
+        Reads a PLY file with a binary body
+        :param header_lines: lines of the PLY header
+        :param data: buffer containing the whole file (e.g. memory mapped file)
+        :param body_offset: position of the first byte after the header
+        :return: Domain representation of the GeoObjectFile
+        """
+        res = GeoObjectFile(columnar=self.columnar)
+        obj = GeoObject()
+        res.objects.append(obj)
+
+        ply_format = self._get_format(header_lines)
+        if ply_format not in ["binary_little_endian", "binary_big_endian"]:
+            raise Exception(f"Unknown PLY format {ply_format}")
+        byte_order = "<" if ply_format == "binary_little_endian" else ">"
+        elements: List[Tuple[str, int, List[List[str]]]] = []
+        for line in header_lines:
+            trimmed = " ".join(line.split())
+            splits = trimmed.split(" ")
+            if splits[0] == "element":
+                elements.append((splits[1], int(splits[2]), []))
+            elif splits[0] == "property" and len(elements) > 0:
+                elements[-1][2].append(splits[1:])
+            else:
+                self._read_header_line(trimmed, res, obj)
+
+        offset = body_offset
+        for name, count, properties in elements:
+            if name == "vertex":
+                vertices, offset = self._read_binary_vertices(
+                    data, offset, count, properties, byte_order
+                )
+                res.vertices = vertices if self.columnar else vertices.tolist()
+            elif name == "face":
+                table, offset = self._read_binary_faces(
+                    data, offset, count, properties, byte_order
+                )
+                obj.faces = table if self.columnar else table.to_faces()
+            elif any(p[0] == "list" for p in properties):
+                # elements with a variable size can not be skipped without parsing them
+                break
+            else:
+                offset += count * self._get_dtype(properties, byte_order).itemsize
+        return res
+
+    @staticmethod
+    def _get_dtype(properties: List[List[str]], byte_order: str) -> np.dtype:
+        """
+        :param properties: scalar properties of an element (type, name)
+        :param byte_order: "<" for little endian, ">" for big endian
+        :return: structured numpy data type of the element
+        """
+        return np.dtype([(p[1], byte_order + PLY_TYPES[p[0]]) for p in properties])
+
+    @staticmethod
+    def _read_binary_vertices(
+        data: Any,
+        offset: int,
+        count: int,
+        properties: List[List[str]],
+        byte_order: str,
+    ) -> Tuple[np.ndarray, int]:
+        """
+        Reads the binary vertex block
+        :param data: file buffer
+        :param offset: start of the vertex block
+        :param count: number of vertices
+        :param properties: properties of the vertex element
+        :param byte_order: "<" for little endian, ">" for big endian
+        :return: (count, 3) array of the vertices, offset of the next block
+        """
+        if any(p[0] == "list" for p in properties):
+            raise Exception("List properties of vertices are not supported")
+        dtype = GeoPlyReader._get_dtype(properties, byte_order)
+        names = [p[1] for p in properties[:3]]
+        if names != ["x", "y", "z"]:
+            raise Exception("Vertices must start with the properties x, y and z")
+        end = offset + count * dtype.itemsize
+
+        if len(properties) == 3 and dtype.fields is not None:
+            coordinate_type = dtype.fields["x"][0]
+            if all(dtype.fields[n][0] == coordinate_type for n in names):
+                vertices = np.frombuffer(
+                    data, dtype=coordinate_type, count=3 * count, offset=offset
+                ).reshape(count, 3)
+                return vertices.astype(np.float64, copy=False), end
+
+        records = np.frombuffer(data, dtype=dtype, count=count, offset=offset)
+        vertices = np.empty((count, 3), dtype=np.float64)
+        for idx, name in enumerate(names):
+            vertices[:, idx] = records[name]
+        return vertices, end
+
+    @staticmethod
+    def _read_binary_faces(
+        data: Any,
+        offset: int,
+        count: int,
+        properties: List[List[str]],
+        byte_order: str,
+    ) -> Tuple[FaceTable, int]:
+        """
+        Reads the binary face block
+        :param data: file buffer
+        :param offset: start of the face block
+        :param count: number of faces
+        :param properties: properties of the face element (a single list property is supported)
+        :param byte_order: "<" for little endian, ">" for big endian
+        :return: faces, offset of the next block
+        """
+        if len(properties) != 1 or properties[0][0] != "list":
+            raise Exception("Faces must consist of a single list of vertex indices")
+        count_type = np.dtype(byte_order + PLY_TYPES[properties[0][1]])
+        index_type = np.dtype(byte_order + PLY_TYPES[properties[0][2]])
+        if count == 0:
+            return FaceTable(), offset
+
+        # common case: all faces have the same number of vertices, so the block can be viewed as records
+        face_size = int(np.frombuffer(data, count_type, 1, offset)[0])
+        record_type = np.dtype([("n", count_type), ("i", index_type, (face_size,))])
+        if offset + count * record_type.itemsize <= len(data):
+            records = np.frombuffer(data, record_type, count, offset)
+            if np.all(records["n"] == face_size):
+                table = FaceTable.from_uniform(records["i"].astype(np.int64) + 1)
+                return table, offset + count * record_type.itemsize
+
+        counts = np.empty(count, dtype=np.int64)
+        starts = np.empty(count, dtype=np.int64)
+        count_format = byte_order + count_type.char
+        position = offset
+        for idx in range(count):
+            face_size = struct.unpack_from(count_format, data, position)[0]
+            counts[idx] = face_size
+            starts[idx] = position + count_type.itemsize
+            position += count_type.itemsize + face_size * index_type.itemsize
+
+        offsets = np.zeros(count + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        # byte position of every index: start of its face + position within the face
+        positions = np.repeat(starts - offsets[:-1] * index_type.itemsize, counts)
+        positions += np.arange(offsets[-1]) * index_type.itemsize
+        body = np.frombuffer(data, np.uint8, position - offset, offset)
+        index_bytes = body[
+            (positions[:, None] - offset + np.arange(index_type.itemsize)).reshape(-1)
+        ]
+        indices = index_bytes.view(index_type).astype(np.int64) + 1
+        return FaceTable.from_arrays(indices, offsets), position
@@ -1,60 +1,167 @@
+import os
+import struct
 from abc import ABC
-from typing import Any, Dict, Iterable
+from typing import Any, Iterable, List, Optional
 
-from geofiles.domain.face import Face
+import numpy as np
+
+from geofiles.conversion.vertex_welder import VertexWelder
+from geofiles.domain.face_table import FaceTable
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
 
+STL_RECORD = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
 
 class GeoStlReader(BaseReader, ABC):
     """
     Reader implementaiton for geo-referenced .stl files (.geostl)
+    Supports ascii files as well as binary files (see GeoStlWriter for the binary geo header).
+    Vertices sharing the same position are merged.
     """
 
-    def _read(self, file: Iterable[str]) -> GeoObjectFile:
+    def __init__(self, columnar: bool = False) -> None:
+        """
+        :param columnar: If true, the resulting file stores its vertices as numpy arrays and its faces as packed
+        FaceTable, else python lists and Face objects are used
+        """
+        self.columnar = columnar
+
+    def read(self, file: Any) -> GeoObjectFile:
+        """
+        Reads a given file
+        :param file: to be read (may be a string representing the path or an opened file instance)
+        :return: Domain representation of the GeoObjectFile
+        """
+        if isinstance(file, str) and self._is_binary(file):
+            with open(file, "rb") as binary_file:
+                data = binary_file.read()
+            sidecar = None
+            if os.path.exists(file + ".geoheader"):
+                with open(file + ".geoheader") as sidecar_file:
+                    sidecar = sidecar_file.read()
+            return self.read_bytes(data, sidecar)
+        return super().read(file)
 
-        res = GeoObjectFile()
+    @staticmethod
+    def _is_binary(file: str) -> bool:
+        """
+        Checks if the given file is a binary STL file (the size matches the number of triangles in the header)
+        :param file: path to the file
+        :return: true iff it is a binary STL file
+        """
+        size = os.path.getsize(file)
+        if size < 84:
+            return False
+        with open(file, "rb") as binary_file:
+            binary_file.seek(80)
+            num_triangles = struct.unpack("<I", binary_file.read(4))[0]
+        return size == 84 + num_triangles * STL_RECORD.itemsize
+
+    def read_bytes(self, data: bytes, sidecar: Optional[str] = None) -> GeoObjectFile:
+        """
+        Reads the content of a binary STL file
+        :param data: content of the file
+        :param sidecar: content of the sidecar file (required if the header references a sidecar)
+        :return: Domain representation of the GeoObjectFile
+        """
+        res = GeoObjectFile(columnar=self.columnar)
         obj = GeoObject()
         res.objects.append(obj)
-        vertices: Dict[Any, Any] = dict()
-        cnt = 1
-        current_face: Face
+
+        header = data[:80]
+        if header.startswith(b"geosolid"):
+            flags, x, y, z = struct.unpack_from("<B3d", header, 8)
+            if flags & 2:
+                if sidecar is None:
+                    raise Exception("Missing sidecar file containing the geo header")
+                self._read_solid_line(" ".join(sidecar.split()), res, obj)
+            else:
+                res.crs = header[33:].rstrip(b"\0").decode("ascii")
+                if flags & 1:
+                    res.origin = [x, y, z]
+
+        num_triangles = struct.unpack_from("<I", data, 80)[0]
+        records = np.frombuffer(data, STL_RECORD, num_triangles, 84)
+        self._set_geometry(res, records["vertices"].reshape(-1, 3), 3)
+        return res
+
+    def _read(self, file: Iterable[str]) -> GeoObjectFile:
+        res = GeoObjectFile(columnar=self.columnar)
+        obj = GeoObject()
+        res.objects.append(obj)
+        vertices: List[str] = []
+        counts: List[int] = []
         for line in file:
             trimmed = line.strip()
             if not trimmed:
                 continue
             trimmed = " ".join(trimmed.split())
-            is_geo_solid = trimmed.startswith("geosolid")
-            if is_geo_solid or trimmed.startswith("solid"):
-                splits = trimmed.split(" ")
-                if is_geo_solid:
-                    res.crs = splits[1]
-                list_len = len(splits)
-                if list_len in (5, 6):
-                    res.origin = [float(a) for a in splits[2:5]]
-                    if list_len == 6:
-                        obj.name = splits[-1]
-
-                if list_len == 2:
-                    obj.name = splits[-1]
+            if trimmed.startswith("geosolid") or trimmed.startswith("solid"):
+                self._read_solid_line(trimmed, res, obj)
             elif trimmed.startswith("facet"):
-                current_face = Face()
-                obj.faces.append(current_face)
+                counts.append(0)
             elif trimmed.startswith("vertex"):
-                v = trimmed[7:]
-                idx = vertices.get(v)
-                if idx is None:
-                    vertices[v] = cnt
-                    idx = cnt
-                    cnt += 1
-                current_face.indices.append(idx)
-
-        for vs in vertices:
-            splits = vs.split(" ")
-            x = float(splits[0])
-            y = float(splits[1])
-            z = float(splits[2])
-            res.vertices.append([x, y, z])
+                vertices.append(trimmed[7:])
+                counts[-1] += 1
 
+        values = np.array(" ".join(vertices).split(), dtype=np.float64)
+        if len(values) == 3 * len(vertices):
+            coordinates = values.reshape(-1, 3)
+        else:
+            coordinates = np.array(
+                [[float(a) for a in v.split(" ")[:3]] for v in vertices],
+                dtype=np.float64,
+            ).reshape(-1, 3)
+        self._set_geometry(res, coordinates, counts)
         return res
+
+    @staticmethod
+    def _read_solid_line(trimmed: str, res: GeoObjectFile, obj: GeoObject) -> None:
+        """
+        Reads the solid or geosolid definition
+        :param trimmed: normalized line
+        :param res: resulting file
+        :param obj: resulting object
+        :return: None
+        """
+        splits = trimmed.split(" ")
+        if trimmed.startswith("geosolid"):
+            res.crs = splits[1]
+        list_len = len(splits)
+        if list_len in (5, 6):
+            res.origin = [float(a) for a in splits[2:5]]
+            if list_len == 6:
+                obj.name = splits[-1]
+
+        if list_len == 2:
+            obj.name = splits[-1]
+
+    def _set_geometry(
+        self, res: GeoObjectFile, coordinates: np.ndarray, counts: Any
+    ) -> None:
+        """
+        Merges the vertices of all facets and sets the resulting vertices and faces
+        :param res: resulting file
+        :param coordinates: (N, 3) corners of all facets
+        :param counts: number of corners per facet (int if all facets have the same number of corners)
+        :return: None
+        """
+        obj = res.objects[0]
+        unique, inverse = VertexWelder.get_unique_vertices(coordinates)
+        vertices = coordinates[unique].astype(np.float64)
+        if isinstance(counts, int):
+            offsets = np.arange(0, len(coordinates) + 1, counts, dtype=np.int64)
+        else:
+            offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+            np.cumsum(counts, out=offsets[1:])
+        table = FaceTable.from_arrays(inverse + 1, offsets)
+        if self.columnar:
+            res.vertices = vertices
+            obj.faces = table
+        else:
+            res.vertices = vertices.tolist()
+            obj.faces = table.to_faces()
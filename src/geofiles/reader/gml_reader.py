@@ -1,12 +1,13 @@
 # pylint: disable=R0201
 import xml.etree.ElementTree as ET
 from abc import ABC
-from typing import Any, Dict, List
+from typing import Any, Iterable, List, Optional, Tuple
 
 from geofiles.domain.face import Face
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
+from geofiles.reader.coordinate_text import parse_coordinates
 from geofiles.reader.xml_reader import XmlReader
 
 
@@ -16,16 +17,28 @@ class GmlReader(XmlReader, BaseReader, ABC):
     Note: That only Solids containing Polygons are supported. Additionally, only the Exterior Linearrings are considered.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, streaming: bool = False) -> None:
         """
         unique_vertices: defines that read vertices have to be unique
+        weld_epsilon: tolerance used for merging vertices if unique_vertices is set (0 for exact matches)
+        :param streaming: If true, the file is parsed incrementally and every Solid is processed as soon as it is
+        complete
         """
+        super().__init__(streaming)
         self.unique_vertices = False
+        self.weld_epsilon = 0.0
 
     def read_xml(self, xml: ET.Element) -> GeoObjectFile:
         result = GeoObjectFile()
         self.remove_namespaces(xml)
         self._internal_read_xml(result, xml, ".//Solid")
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
+        return result
+
+    def read_xml_stream(self, file: Iterable[str]) -> GeoObjectFile:
+        result = GeoObjectFile()
+        self._internal_read_solids(result, self._iterparse(file, [".//Solid"]))
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
         return result
 
     def _internal_decorate_object(self, _: ET.Element, __: GeoObject) -> None:
@@ -45,60 +58,93 @@ class GmlReader(XmlReader, BaseReader, ABC):
         :param xml: root element
         :param baseelements: xpath string defining the base elements
         """
-        solids = xml.findall(baseelements)
+        self._internal_read_solids(result, xml.findall(baseelements))
+
+    def _internal_read_solids(
+        self, result: GeoObjectFile, solids: Iterable[ET.Element]
+    ) -> None:
+        """
+        Internal method for reading solid elements
+        :param result: The resulting GeoObjectfiled
+        :param solids: solid elements (or other elements containing polygons)
+        """
+        self._internal_read_surfaces(
+            result, ((solid, solid.findall(".//Polygon")) for solid in solids)
+        )
 
-        vertex_list: List[List[Any]] = []
-        if len(result.vertices) != 0:
-            vertex_list = result.vertices.copy()
-        vertex_indices: Dict[str, int] = dict()
+    def _internal_read_surfaces(
+        self,
+        result: GeoObjectFile,
+        surfaces: Iterable[Tuple[ET.Element, List[ET.Element]]],
+    ) -> None:
+        """
+        Internal method for reading already collected polygons, one GeoObject is created per surface
+        :param result: The resulting GeoObjectfiled
+        :param surfaces: surface elements (e.g. solids) and their polygon elements
+        """
+        vertex_list: List[List[Any]] = result.vertices
 
-        if len(solids) > 0:
-            first_solid = solids[0]
-            crs = self._get_attribute(first_solid, "srsName")
-            if crs is not None:
-                result.crs = crs
-            for solid in solids:
-                solid_crs = self._get_attribute(solid, "srsName")
-                if solid_crs is not None and solid_crs != result.crs:
-                    raise Exception(
-                        "Found non uniform CRS definition in Solid elements. Currently not supported in this implementation."
-                    )
-                geo_object = GeoObject()
-                self._internal_decorate_object(solid, geo_object)
-                polygons = solid.findall(".//Polygon")
+        first_solid = True
+        for solid, polygons in surfaces:
+            if first_solid:
+                crs = self._get_attribute(solid, "srsName")
+                if crs is not None:
+                    result.crs = crs
+                first_solid = False
+            solid_crs = self._get_attribute(solid, "srsName")
+            if solid_crs is not None and solid_crs != result.crs:
+                raise Exception(
+                    "Found non uniform CRS definition in Solid elements. Currently not supported in this implementation."
+                )
+            geo_object = GeoObject()
+            self._internal_decorate_object(solid, geo_object)
 
-                for polygon in polygons:
-                    linearrings = polygon.findall(".//exterior/LinearRing")
-                    for linearring in linearrings:
-                        face_object = Face()
-                        poslists = linearring.findall("./posList")
-                        for poslist in poslists:
-                            if poslist is not None and poslist.text is not None:
-                                splits = poslist.text.split(" ")
-                                splits.pop()
-                                for split in splits:
-                                    coordinate = [float(a) for a in split.split(",")]
-                                    self._filter_faces(
-                                        self.unique_vertices,
-                                        coordinate,
-                                        face_object,
-                                        vertex_list,
-                                        vertex_indices,
-                                    )
+            for polygon in polygons:
+                linearrings = polygon.findall(".//exterior/LinearRing")
+                for linearring in linearrings:
+                    face_object = Face()
+                    poslists = linearring.findall("./posList")
+                    for poslist in poslists:
+                        if poslist is not None and poslist.text is not None:
+                            coordinates = parse_coordinates(
+                                poslist.text,
+                                self._get_dimension(poslist, solid),
+                                True,
+                                3,
+                            )
+                            self._add_vertices(
+                                coordinates.tolist(), face_object, vertex_list
+                            )
 
-                        positions = linearring.findall("./pos")
-                        for position in positions:
-                            if position is not None and position.text is not None:
-                                splits = position.text.split(" ")
-                                coordinate = [float(a) for a in splits]
-                                self._filter_faces(
-                                    self.unique_vertices,
-                                    coordinate,
-                                    face_object,
-                                    vertex_list,
-                                    vertex_indices,
-                                )
-                        geo_object.faces.append(face_object)
-                result.objects.append(geo_object)
+                    positions = [
+                        position
+                        for position in linearring.findall("./pos")
+                        if position is not None and position.text is not None
+                    ]
+                    if len(positions) > 0:
+                        # every pos element defines a single coordinate
+                        dimension = self._get_dimension(positions[0], solid)
+                        if dimension is None:
+                            dimension = len(str(positions[0].text).split())
+                        coordinates = parse_coordinates(
+                            " ".join(str(p.text) for p in positions), dimension
+                        )
+                        self._add_vertices(
+                            coordinates.tolist(), face_object, vertex_list
+                        )
+                    geo_object.faces.append(face_object)
+            result.objects.append(geo_object)
 
         result.vertices = vertex_list
+
+    def _get_dimension(self, element: ET.Element, solid: ET.Element) -> Optional[int]:
+        """
+        :param element: coordinate element (or its parent)
+        :param solid: solid element containing the coordinates
+        :return: srsDimension of the coordinate element or the solid if defined, else None
+        """
+        for candidate in [element, solid]:
+            dimension = self._get_attribute(candidate, "srsDimension")
+            if dimension is not None:
+                return int(dimension)
+        return None
@@ -1,10 +1,17 @@
 import json
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Iterable
+from io import TextIOWrapper
+from typing import Any, Dict, Generator, Iterable, Iterator, Optional
 
+from geofiles.domain.geo_file_summary import GeoFileSummary
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
 
+WHITESPACE = re.compile(r"\s*")
+STRUCTURE = re.compile(r'[][{}"]')
+STRING_END = re.compile(r'(?:[^"\\]|\\.)*"')
+
 
 class JsonReader(BaseReader, ABC):
     """
@@ -17,6 +24,43 @@ class JsonReader(BaseReader, ABC):
 
         return self.read_json(loaded)
 
+    def _get_stream(self, file: TextIOWrapper) -> Iterable[str]:
+        """
+        :param file: opened file
+        :return: text of the file in chunks of fixed size, since json files may consist of a single line
+        """
+        return JsonReader._read_chunks(file)
+
+    @staticmethod
+    def _read_chunks(
+        file: TextIOWrapper, chunk_size: int = 1 << 20
+    ) -> Generator[str, None, None]:
+        """
+        Reads a given file in chunks
+        :param file: to be read
+        :param chunk_size: number of characters per chunk
+        :return: generator of the chunks
+        """
+        while True:
+            chunk = file.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def _scan(self, file: Iterable[str]) -> GeoFileSummary:
+        json_file = "\n".join(file)
+        loaded: Dict[Any, Any] = json.loads(json_file)
+
+        return self.scan_json(loaded)
+
+    def scan_json(self, json_dict: Dict[Any, Any]) -> GeoFileSummary:
+        """
+        Scan implementation for json based files, creates the whole domain representation by default
+        :param json_dict: parsed json representation
+        :return: Summary of the file
+        """
+        return GeoFileSummary.from_file(self.read_json(json_dict))
+
     @abstractmethod
     def read_json(self, json_dict: Dict[Any, Any]) -> GeoObjectFile:
         """
@@ -25,3 +69,178 @@ class JsonReader(BaseReader, ABC):
         :return: Domain representation of the GeoObjectFile
         """
         return GeoObjectFile()
+
+
+class JsonStream:
+    """
+    Incremental json parser, which reads the members of (nested) json objects one after another,
+    so only the currently processed value has to be kept in memory
+    """
+
+    def __init__(self, chunks: Iterable[str]) -> None:
+        """
+        :param chunks: text of the json document in chunks
+        """
+        self._chunks: Iterator[str] = iter(chunks)
+        self._decoder = json.JSONDecoder()
+        self._text = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self) -> str:
+        """
+        Skips whitespace and returns the next character without consuming it
+        :return: next character or empty string at the end of the document
+        """
+        while True:
+            match = WHITESPACE.match(self._text, self._pos)
+            if match is not None:
+                self._pos = match.end()
+            if self._pos < len(self._text) or not self._read_more():
+                break
+        return self._text[self._pos : self._pos + 1]
+
+    def expect(self, character: str) -> None:
+        """
+        Consumes the given character
+        :param character: expected next (non whitespace) character
+        :return: None
+        """
+        found = self.peek()
+        if found != character:
+            raise Exception(f"Expected '{character}' but found '{found}'")
+        self._pos += 1
+
+    def decode(self) -> Any:
+        """
+        Decodes the next json value
+        :return: decoded value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._text, self._pos)
+                # numbers may continue in the next chunk
+                if end < len(self._text) or self._eof:
+                    self._pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+            self._read_more(len(self._text) - self._pos)
+
+    def read_until(self, pattern: "re.Pattern[str]") -> str:
+        """
+        Consumes the text up to the end of the first match of the given pattern
+        :param pattern: pattern, which must not match across more than 64 characters
+        :return: consumed text
+        """
+        start = self._pos
+        while True:
+            match = pattern.search(self._text, start)
+            if match is not None:
+                res = self._text[self._pos : match.end()]
+                self._pos = match.end()
+                return res
+            searched = len(self._text) - self._pos
+            if not self._read_more(searched):
+                raise Exception("Unexpected end of json document")
+            # the consumed text is dropped by _read_more, so the buffer starts at the current position
+            start = max(0, searched - 64)
+
+    def skip_until(self, pattern: "re.Pattern[str]", character: str) -> int:
+        """
+        Consumes the text up to the end of the first match of the given pattern without keeping it in memory
+        :param pattern: pattern, which must not match across more than 64 characters
+        :param character: character to be counted
+        :return: number of occurrences of the given character in the consumed text
+        """
+        count = 0
+        while True:
+            match = pattern.search(self._text, self._pos)
+            if match is not None:
+                count += self._text.count(character, self._pos, match.end())
+                self._pos = match.end()
+                return count
+            # the last characters are kept, since the pattern may continue in the next chunk
+            keep = max(self._pos, len(self._text) - 64)
+            count += self._text.count(character, self._pos, keep)
+            self._pos = keep
+            if not self._read_more():
+                raise Exception("Unexpected end of json document")
+
+    def skip_value(self) -> None:
+        """
+        Consumes the next json value without decoding it
+        :return: None
+        """
+        if self.peek() not in ["{", "["]:
+            self.decode()
+            return
+        depth = 0
+        while True:
+            match = STRUCTURE.search(self._text, self._pos)
+            if match is None:
+                self._pos = len(self._text)
+                if not self._read_more():
+                    raise Exception("Unexpected end of json document")
+                continue
+            found = match.group()
+            if found == '"':
+                end = STRING_END.match(self._text, match.end())
+                if end is None:
+                    # the string continues in the next chunk
+                    self._pos = match.start()
+                    if not self._read_more(len(self._text) - self._pos):
+                        raise Exception("Unexpected end of json document")
+                    continue
+                self._pos = end.end()
+                continue
+            self._pos = match.end()
+            depth += 1 if found in "[{" else -1
+            if depth == 0:
+                return
+
+    def iter_object(self) -> Generator[str, None, None]:
+        """
+        Iterates the members of the next json object. Each member value has to be consumed
+        (e.g. by decode, skip_value or iter_object) before the iteration is continued.
+        :return: generator of the member names
+        """
+        self.expect("{")
+        if self.peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.decode()
+            self.expect(":")
+            yield key
+            separator = self.peek()
+            self._pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise Exception(f"Expected ',' or '}}' but found '{separator}'")
+
+    def _read_more(self, minimum: Optional[int] = None) -> bool:
+        """
+        Appends the next chunks to the buffer and drops the consumed text
+        :param minimum: minimal number of characters to be appended (one chunk if not given)
+        :return: False if the end of the document is reached
+        """
+        if self._eof:
+            return False
+        chunks = [self._text[self._pos :]]
+        appended = 0
+        while True:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._eof = True
+                break
+            chunks.append(chunk)
+            appended += len(chunk)
+            if minimum is None or appended >= minimum:
+                break
+        self._text = "".join(chunks)
+        self._pos = 0
+        return appended > 0
@@ -1,12 +1,13 @@
 import xml.etree.ElementTree as ET
 from abc import ABC
-from typing import Any, Dict, List
+from typing import Any, Iterable, List
 
 from geofiles.conversion.static import get_wgs_84
 from geofiles.domain.face import Face
 from geofiles.domain.geo_object import GeoObject
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
+from geofiles.reader.coordinate_text import parse_coordinates
 from geofiles.reader.xml_reader import XmlReader
 
 
@@ -16,20 +17,34 @@ class KmlReader(XmlReader, BaseReader, ABC):
     Note: That only Solids containing Polygons are supported. Additionally, only the Exterior Linearrings are considered.
     """
 
-    def __init__(self):
+    def __init__(self, streaming: bool = False):
         """
         unique_vertices: defines that read vertices have to be unique
+        weld_epsilon: tolerance used for merging vertices if unique_vertices is set (0 for exact matches)
+        :param streaming: If true, the file is parsed incrementally and every Placemark is processed as soon as it
+        is complete
         """
+        super().__init__(streaming)
         self.unique_vertices = False
+        self.weld_epsilon = 0.0
 
     def read_xml(self, xml: ET.Element) -> GeoObjectFile:
+        self.remove_namespaces(xml)
+        return self._read_placemarks(xml.findall(".//Placemark"))
+
+    def read_xml_stream(self, file: Iterable[str]) -> GeoObjectFile:
+        return self._read_placemarks(self._iterparse(file, [".//Placemark"]))
+
+    def _read_placemarks(self, placemarks: Iterable[ET.Element]) -> GeoObjectFile:
+        """
+        Reads the given placemarks
+        :param placemarks: Placemark elements
+        :return: Domain representation of the GeoObjectFile
+        """
         result = GeoObjectFile()
         result.crs = get_wgs_84()
 
-        self.remove_namespaces(xml)
         vertex_list: List[List[Any]] = []
-        vertex_indices: Dict[str, int] = dict()
-        placemarks = xml.findall(".//Placemark")
         for placemark in placemarks:
             geo_object = GeoObject()
             result.objects.append(geo_object)
@@ -43,20 +58,13 @@ class KmlReader(XmlReader, BaseReader, ABC):
                 )
                 if len(coordinates) == 1 and coordinates[0].text:
                     face_object = Face()
-                    splitted_coordinates = coordinates[0].text.split("\n")
-                    splitted_coordinates.pop()
-                    for splitted_coordinate in [a for a in splitted_coordinates if a]:
-                        splitted = [
-                            float(a) for a in splitted_coordinate.split(" ") if a
-                        ]
-                        self._filter_faces(
-                            self.unique_vertices,
-                            splitted,
-                            face_object,
-                            vertex_list,
-                            vertex_indices,
-                        )
+                    self._add_vertices(
+                        parse_coordinates(coordinates[0].text, None, True).tolist(),
+                        face_object,
+                        vertex_list,
+                    )
                     geo_object.faces.append(face_object)
 
         result.vertices = vertex_list
+        self._weld_vertices(result, self.unique_vertices, self.weld_epsilon)
         return result
@@ -1,6 +1,6 @@
 import xml.etree.ElementTree as ET
 from abc import ABC, abstractmethod
-from typing import Iterable, Optional
+from typing import Generator, Iterable, List, Optional, Tuple
 
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.base import BaseReader
@@ -11,12 +11,30 @@ class XmlReader(BaseReader, ABC):
     Base class for reading xml-based files
     """
 
+    def __init__(self, streaming: bool = False) -> None:
+        """
+        :param streaming: If true, the file is parsed incrementally and processed elements are discarded
+        (see read_xml_stream), else the whole element tree is created first
+        """
+        self.streaming = streaming
+
     def _read(self, file: Iterable[str]) -> GeoObjectFile:
+        if self.streaming:
+            return self.read_xml_stream(file)
+
         xml_file = "".join(file)
         tree = ET.fromstring(xml_file)
 
         return self.read_xml(tree)
 
+    def read_xml_stream(self, file: Iterable[str]) -> GeoObjectFile:
+        """
+        Streaming read implementation for xml based files, creates the whole element tree by default
+        :param file: text of the file (lines or chunks)
+        :return: Domain representation of the GeoObjectFile
+        """
+        return self.read_xml(ET.fromstring("".join(file)))
+
     @abstractmethod
     def read_xml(self, xml: ET.Element) -> GeoObjectFile:
         """
@@ -28,20 +46,107 @@ class XmlReader(BaseReader, ABC):
 
     def remove_namespaces(self, el: ET.Element) -> None:
         """
-        Recursively search this element tree, removing namespaces.
+        Search this element tree, removing namespaces.
         Source: https://stackoverflow.com/a/32552776
         :param el: Element for which namespace should be removed
         :return: None
         """
+        for element in el.iter():
+            XmlReader._remove_namespace(element)
+
+    @staticmethod
+    def _remove_namespace(el: ET.Element) -> None:
+        """
+        Removes the namespaces of the tag and the attributes of a single element
+        :param el: Element for which namespace should be removed
+        :return: None
+        """
         if el.tag.startswith("{"):
             el.tag = el.tag.split("}", 1)[1]  # strip namespace
-        for k in el.attrib.keys():
+        for k in list(el.attrib.keys()):
             if k.startswith("{"):
                 k2 = k.split("}", 1)[1]
                 el.attrib[k2] = el.attrib[k]
                 del el.attrib[k]
-        for child in el:
-            self.remove_namespaces(child)
+
+    @staticmethod
+    def _iterparse(
+        file: Iterable[str], paths: List[str]
+    ) -> Generator[ET.Element, None, None]:
+        """
+        Parses the given file incrementally and returns the elements matching one of the given paths as soon as
+        they are complete. Namespaces are removed during parsing, elements that are neither matched nor contained
+        in a matched element are discarded, matched elements are cleared after they have been processed.
+        Matched elements are not searched for further matches.
+        :param file: text of the file (lines or chunks)
+        :param paths: simple paths of local names relative to the root element, either "./a/b" (absolute),
+        ".//a/b" (anywhere) or "." (root element, returned without children as soon as its start tag is read)
+        :return: generator of the matched elements
+        """
+        patterns: List[Tuple[bool, List[str]]] = []
+        for path in paths:
+            if path.startswith(".//"):
+                patterns.append((True, path[3:].split("/")))
+            elif path.startswith("./"):
+                patterns.append((False, path[2:].split("/")))
+            elif path != ".":
+                raise Exception(f"Unsupported path {path}")
+
+        stack: List[ET.Element] = []
+        tags: List[str] = []
+        matched: List[bool] = []
+        open_matches = 0
+        for event, element in XmlReader._iter_events(file):
+            if event == "start":
+                stack.append(element)
+                tags.append(element.tag)
+                if len(stack) == 1:
+                    # the root element is returned without its children
+                    matched.append(False)
+                    if "." in paths:
+                        yield element
+                    continue
+                is_match = open_matches == 0 and any(
+                    (tags[-len(names) :] == names if anywhere else tags[1:] == names)
+                    for anywhere, names in patterns
+                )
+                matched.append(is_match)
+                if is_match:
+                    open_matches += 1
+                continue
+
+            stack.pop()
+            tags.pop()
+            is_match = matched.pop()
+            if is_match:
+                open_matches -= 1
+                yield element
+            if (is_match or open_matches == 0) and len(stack) > 0:
+                element.clear()
+                parent = stack[-1]
+                if len(parent) > 0 and parent[-1] is element:
+                    del parent[-1]
+
+    @staticmethod
+    def _iter_events(
+        file: Iterable[str],
+    ) -> Generator[Tuple[str, ET.Element], None, None]:
+        """
+        Parses the given file incrementally, namespaces are removed as soon as an element starts
+        :param file: text of the file (lines or chunks)
+        :return: generator of the start and end events and their elements
+        """
+        parser = ET.XMLPullParser(events=("start", "end"))
+        for line in file:
+            # long lines (e.g. single line files) are fed in chunks, so parsing can be stopped (or elements can be
+            # cleared) early
+            for start in range(0, len(line), 1 << 16):
+                parser.feed(line[start : start + (1 << 16)])
+                for event, element in parser.read_events():
+                    if event == "start":
+                        XmlReader._remove_namespace(element)
+                    yield event, element
+        parser.close()
 
     @staticmethod
     def _get_attribute(xml: ET.Element, attribute_name: str) -> Optional[str]:
@@ -3,6 +3,9 @@ from abc import ABC, abstractmethod
 from io import StringIO, TextIOWrapper
 from typing import Any, Union
 
+import numpy as np
+
+from geofiles.domain.face_table import FaceTable
 from geofiles.domain.geo_object_file import GeoObjectFile
 
 
@@ -123,6 +126,50 @@ class BaseWriter(ABC):
         if append_new_line:
             file.write(self._encode("\n", write_binary, encoding))
 
+    def _write_face_table(
+        self,
+        file: Union[TextIOWrapper, StringIO],
+        table: FaceTable,
+        num_vertices: int,
+        write_binary: bool,
+        chunk_size: int = 65536,
+    ) -> None:
+        """
+        Writes the faces of the given table as lines of the form "<number of indices> <index> ... <index>"
+        using zero based indices (as used by e.g. OFF and PLY)
+        :param file: to be written to
+        :param table: faces to be written
+        :param num_vertices: number of vertices of the file (required for indices < 0)
+        :param write_binary: flag if data should be written binary ascii-encoded
+        :param chunk_size: number of faces which are formatted at once
+        :return: None
+        """
+        counts = table.get_counts()
+        indices = table.get_zero_based_indices(num_vertices)
+        face_size = table.get_uniform_size()
+        for start in range(0, len(table), chunk_size):
+            end = min(start + chunk_size, len(table))
+            if face_size is not None:
+                rows = np.column_stack(
+                    (
+                        counts[start:end],
+                        indices[start * face_size : end * face_size].reshape(
+                            -1, face_size
+                        ),
+                    )
+                )
+                line_format = " ".join(["%d"] * (face_size + 1))
+                lines = [line_format % tuple(row) for row in rows.tolist()]
+            else:
+                offsets = table.offsets[start : end + 1].tolist()
+                flat = indices[offsets[0] : offsets[-1]].tolist()
+                first = offsets[0]
+                lines = []
+                for i in range(end - start):
+                    row = flat[offsets[i] - first : offsets[i + 1] - first]
+                    lines.append(f"{len(row)} {' '.join(map(str, row))}")
+            self._write_to_file(file, "\n".join(lines), write_binary, True)
+
     @staticmethod
     def _encode(data: Any, write_binary: bool, encoding: str = "ascii") -> Any:
         """
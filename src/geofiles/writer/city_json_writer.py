@@ -136,7 +136,7 @@ class CityJsonWriter(JsonWriter, BaseWriter, ABC):
                     else:
                         boundary.append(idx - 1)
                 boundaries.append([boundary])
-        res["vertices"] = data.vertices
+        res["vertices"] = list(data.vertices)
 
         return res
 
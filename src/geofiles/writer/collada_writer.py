@@ -149,8 +149,9 @@ class ColladaWriter(XmlWriter, BaseWriter, ABC):
             vertices_input.attrib["semantic"] = "POSITION"
             vertices_input.attrib["source"] = f"#{source_name}"
 
+            face_table = geoobj.get_face_table()
             triangles = ET.Element("triangles")
-            triangles.attrib["count"] = str(len(geoobj.faces))
+            triangles.attrib["count"] = str(len(face_table))
             mesh.append(triangles)
             triangles_input = ET.Element("input")
             triangles.append(triangles_input)
@@ -160,11 +161,8 @@ class ColladaWriter(XmlWriter, BaseWriter, ABC):
 
             p = ET.Element("p")
             triangles.append(p)
-            face_indices = []
-            for face in geoobj.faces:
-                for idx in face.indices:
-                    face_indices.append(str(idx - 1))
-            p.text = " ".join(face_indices)
+            face_indices = face_table.get_zero_based_indices(len(data.vertices))
+            p.text = " ".join(map(str, face_indices.tolist()))
 
         return ET.ElementTree(root)
 
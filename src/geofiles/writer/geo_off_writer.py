@@ -29,7 +29,6 @@ class GeoOffWriter(BaseWriter, ABC):
             raise Exception("GeoOFF can represent only one object. Minimize the data.")
 
         num_vertices = len(data.vertices)
-        faces = []
         obj = data.objects[0]
         if (
             obj.contains_scaling()
@@ -39,9 +38,8 @@ class GeoOffWriter(BaseWriter, ABC):
             raise Exception(
                 "GeoOFF does not support local object transformation information."
             )
-        for face in obj.faces:
-            faces.append(face)
-        num_faces = len(faces)
+        face_table = obj.get_face_table()
+        num_faces = len(face_table)
         origin_based = data.is_origin_based()
         contains_extent = data.contains_extent()
         contains_scaling = data.contains_scaling()
@@ -123,16 +121,7 @@ class GeoOffWriter(BaseWriter, ABC):
 
         for v in data.vertices:
             self._write_to_file(file, " ".join([str(f) for f in v]), write_binary, True)
-        for face in faces:
-            s = ""
-            for f in face.indices:
-                s += " "
-                f = int(f)
-                if f > 0:
-                    s += str(f - 1)
-                else:
-                    s += str(num_vertices - f)
-            self._write_to_file(file, f"{len(face.indices)}{s}", write_binary, True)
+        self._write_face_table(file, face_table, num_vertices, write_binary)
 
     def get_file_type(self) -> str:
         """
@@ -2,6 +2,9 @@ from abc import ABC
 from io import TextIOWrapper
 from typing import Any, Dict
 
+import numpy as np
+
+from geofiles.domain.face_table import FaceTable
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.writer.base import BaseWriter
 
@@ -11,6 +14,46 @@ class GeoPlyWriter(BaseWriter, ABC):
     Writer implementation for creating Geo PLY geometry files (.geoply)
     """
 
+    def __init__(self, ply_format: str = "ascii") -> None:
+        """
+        :param ply_format: format of the body ("ascii", "binary_little_endian" or "binary_big_endian").
+        Binary bodies store the vertices as doubles and the faces as uchar count + int indices.
+        """
+        if ply_format not in ["ascii", "binary_little_endian", "binary_big_endian"]:
+            raise Exception(f"Unknown PLY format {ply_format}")
+        self.ply_format = ply_format
+
+    def is_binary(self) -> bool:
+        """
+        :return: true iff the body is written in a binary format
+        """
+        return self.ply_format != "ascii"
+
+    def write(
+        self,
+        file: Any,
+        data: GeoObjectFile,
+        write_binary: bool = False,
+        append_file_type: bool = True,
+        random_seed: Any = None,
+    ) -> None:
+        """
+        Allows to create write a file at the given file position
+        :param file: file to be written. Either a opened file or a path to the file
+        :param data: to be written
+        :param write_binary: flag if file should be written in binary style (always set for binary PLY formats)
+        :param append_file_type: flag if a writer's associated file type should be appended to the given file (only if it is a path)
+        :param random_seed: may be used by the writer for e.g. IDs
+        :return: None
+        """
+        super().write(
+            file,
+            data,
+            write_binary or self.is_binary(),
+            append_file_type,
+            random_seed,
+        )
+
     def _write(
         self,
         file: TextIOWrapper,
@@ -29,25 +72,25 @@ class GeoPlyWriter(BaseWriter, ABC):
             raise Exception("GeoPLY can represent only one object. Minimize the data.")
 
         num_vertices = len(data.vertices)
-        faces = []
-        for obj in data.objects:
-            if (
-                obj.contains_scaling()
-                or obj.contains_rotation()
-                or obj.contains_translation()
-            ):
-                raise Exception(
-                    "GeoPLY does not support local object transformation information."
-                )
-            for face in obj.faces:
-                faces.append(face)
-        num_faces = len(faces)
+        obj = data.objects[0]
+        if (
+            obj.contains_scaling()
+            or obj.contains_rotation()
+            or obj.contains_translation()
+        ):
+            raise Exception(
+                "GeoPLY does not support local object transformation information."
+            )
+        if self.is_binary() and not write_binary:
+            raise Exception(f"PLY format {self.ply_format} requires a binary file")
+        face_table = obj.get_face_table()
+        num_faces = len(face_table)
         if data.is_geo_referenced():
             self._write_to_file(file, "geoply", write_binary, True)
         else:
             self._write_to_file(file, "ply", write_binary, True)
 
-        self._write_to_file(file, "format ascii 1.0", write_binary, True)
+        self._write_to_file(file, f"format {self.ply_format} 1.0", write_binary, True)
         if data.is_geo_referenced() and data.crs is not None:
             self._write_to_file(file, f"crs {data.crs}", write_binary, True)
 
@@ -103,27 +146,53 @@ class GeoPlyWriter(BaseWriter, ABC):
             "meta", data.objects[0].meta_information, file, write_binary
         )
         self._write_to_file(file, f"element vertex {num_vertices}", write_binary, True)
-        self._write_to_file(file, "property float x", write_binary, True)
-        self._write_to_file(file, "property float y", write_binary, True)
-        self._write_to_file(file, "property float z", write_binary, True)
+        vertex_type = "double" if self.is_binary() else "float"
+        self._write_to_file(file, f"property {vertex_type} x", write_binary, True)
+        self._write_to_file(file, f"property {vertex_type} y", write_binary, True)
+        self._write_to_file(file, f"property {vertex_type} z", write_binary, True)
         self._write_to_file(file, f"element face  {num_faces}", write_binary, True)
         self._write_to_file(
             file, "property list uchar int vertex_index", write_binary, True
         )
         self._write_to_file(file, "end_header", write_binary, True)
 
+        if self.is_binary():
+            byte_order = "<" if self.ply_format == "binary_little_endian" else ">"
+            vertices = data.get_vertex_array().astype(f"{byte_order}f8", copy=False)
+            file.write(vertices.tobytes())
+            file.write(self._get_binary_faces(face_table, num_vertices, byte_order))
+            return
+
         for v in data.vertices:
             self._write_to_file(file, " ".join([str(f) for f in v]), write_binary, True)
-        for face in faces:
-            s = ""
-            for f in face.indices:
-                s += " "
-                f = int(f)
-                if f > 0:
-                    s += str(f - 1)
-                else:
-                    s += str(num_vertices - f)
-            self._write_to_file(file, f"{len(face.indices)}{s}", write_binary, True)
+        self._write_face_table(file, face_table, num_vertices, write_binary)
+
+    @staticmethod
+    def _get_binary_faces(
+        table: FaceTable, num_vertices: int, byte_order: str
+    ) -> bytes:
+        """
+        Creates the binary representation of the given faces
+        (per face: uchar number of indices followed by the int32 indices)
+        :param table: faces to be converted
+        :param num_vertices: number of vertices of the file (required for indices < 0)
+        :param byte_order: "<" for little endian, ">" for big endian
+        :return: binary representation
+        """
+        counts = table.get_counts()
+        if len(counts) != 0 and counts.max() > 255:
+            raise Exception("PLY faces with more than 255 vertices are not supported")
+        indices = table.get_zero_based_indices(num_vertices)
+
+        # face i starts at byte i + 4 * offsets[i], so index j starts at byte face_of(j) + 1 + 4 * j
+        buffer = np.empty(len(counts) + 4 * len(indices), dtype=np.uint8)
+        buffer[np.arange(len(counts)) + 4 * table.offsets[:-1]] = counts
+        starts = (
+            np.repeat(np.arange(len(counts)), counts) + 1 + 4 * np.arange(len(indices))
+        )
+        index_bytes = indices.astype(f"{byte_order}i4").view(np.uint8).reshape(-1, 4)
+        buffer[(starts[:, None] + np.arange(4)).reshape(-1)] = index_bytes.reshape(-1)
+        return buffer.tobytes()
 
     def get_file_type(self) -> str:
         """
@@ -1,18 +1,56 @@
+import struct
 from abc import ABC
 from io import TextIOWrapper
 from typing import Any, List
 
+import numpy as np
+
 from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.writer.base import BaseWriter
 
+STL_RECORD = np.dtype(
+    [("normal", "<f4", (3,)), ("vertices", "<f4", (3, 3)), ("attribute", "<u2")]
+)
+
 
 class GeoStlWriter(BaseWriter, ABC):
     """
     Writer implementation for creating Geo-Referenced STL geometry files (.geostl)
+
+    Binary GeoSTL files use the 80-byte header of binary STL for the geo-referencing information:
+    "geosolid" marker (8 bytes), flags (1 byte: 1 = origin, 2 = sidecar), origin (3 little endian doubles) and
+    the crs (ascii, 47 bytes, zero padded). If the crs does not fit, the ascii geosolid line is written to the
+    sidecar file <file>.geoheader. Note that binary STL stores coordinates as 32-bit floats, so origin based
+    data is recommended.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, binary: bool = False) -> None:
+        """
+        :param binary: If true, binary STL files are written (faces are triangulated and normals are computed)
+        """
         self.stl_name = ""
+        self.binary = binary
+
+    def write(
+        self,
+        file: Any,
+        data: GeoObjectFile,
+        write_binary: bool = False,
+        append_file_type: bool = True,
+        random_seed: Any = None,
+    ) -> None:
+        """
+        Allows to create write a file at the given file position
+        :param file: file to be written. Either a opened file or a path to the file
+        :param data: to be written
+        :param write_binary: flag if file should be written in binary style (always set for binary STL files)
+        :param append_file_type: flag if a writer's associated file type should be appended to the given file (only if it is a path)
+        :param random_seed: may be used by the writer for e.g. IDs
+        :return: None
+        """
+        super().write(
+            file, data, write_binary or self.binary, append_file_type, random_seed
+        )
 
     def _write(
         self,
@@ -36,6 +74,12 @@ class GeoStlWriter(BaseWriter, ABC):
 
         self._contains_transformation_information(data)
 
+        if self.binary:
+            if not write_binary:
+                raise Exception("Binary STL requires a binary file")
+            self._write_binary(file, data)
+            return
+
         if data.is_geo_referenced():
             origin = ""
             if data.is_origin_based() and data.origin is not None:
@@ -85,6 +129,101 @@ class GeoStlWriter(BaseWriter, ABC):
         else:
             self._write_to_file(file, "endsolid", write_binary, True)
 
+    def _write_binary(self, file: Any, data: GeoObjectFile) -> None:
+        """
+        Writes the given data as binary STL
+        :param file: target to be written
+        :param data: content to be written
+        :return: None
+        """
+        obj = data.objects[0]
+        if (
+            obj.contains_scaling()
+            or obj.contains_rotation()
+            or obj.contains_translation()
+        ):
+            raise Exception(
+                "GeoSTL does not support local object transformation information"
+            )
+        file.write(self._get_binary_header(file, data))
+
+        table = obj.get_face_table()
+        vertices = data.get_vertex_array()
+        triangles, face_ids = table.triangulate()
+        corners = vertices[triangles.get_zero_based_indices(len(vertices))].reshape(
+            -1, 3, 3
+        )
+        records = np.zeros(len(triangles), dtype=STL_RECORD)
+        records["vertices"] = corners
+        records["normal"] = self._get_normals(data, corners, face_ids)
+        file.write(struct.pack("<I", len(records)))
+        file.write(records.tobytes())
+
+    def _get_binary_header(self, file: Any, data: GeoObjectFile) -> bytes:
+        """
+        Creates the 80-byte header (and the sidecar file if required)
+        :param file: target to be written
+        :param data: content to be written
+        :return: header
+        """
+        if not data.is_geo_referenced():
+            return self.stl_name.encode("ascii")[:80].ljust(80, b" ")
+
+        flags = 0
+        origin = [0.0, 0.0, 0.0]
+        if data.is_origin_based() and data.origin is not None:
+            flags |= 1
+            origin = [float(a) for a in data.origin]
+        crs = str(data.crs).encode("ascii")
+        if len(crs) > 47:
+            flags |= 2
+            name = getattr(file, "name", None)
+            if not isinstance(name, str):
+                raise Exception("CRS too long for the binary STL header")
+            origin_str = " ".join([str(c) for c in origin]) if flags & 1 else ""
+            with open(name + ".geoheader", "w") as sidecar:
+                sidecar.write(f"geosolid {data.crs} {origin_str} {self.stl_name}\n")
+            crs = b""
+        header = b"geosolid" + struct.pack("<B3d", flags, *origin) + crs
+        return header.ljust(80, b"\0")
+
+    @staticmethod
+    def _get_normals(
+        data: GeoObjectFile, corners: np.ndarray, face_ids: np.ndarray
+    ) -> np.ndarray:
+        """
+        Determines the normals of the given triangles, the mean of the referenced normals is used for faces with normal
+        indices, otherwise the normalized cross product of the triangle edges
+        :param data: file containing the triangles
+        :param corners: (N, 3, 3) corners of the triangles
+        :param face_ids: ids of the faces, the triangles are part of
+        :return: (N, 3) normals
+        """
+        normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+        lengths = np.linalg.norm(normals, axis=1)
+        np.divide(normals, lengths[:, None], out=normals, where=lengths[:, None] > 0)
+
+        table = data.objects[0].get_face_table()
+        if table.contains_normals():
+            normal_counts = np.diff(table.normal_offsets)
+            with_normals = np.flatnonzero(normal_counts > 0)
+            normal_indices = table.normal_indices.astype(np.int64)
+            normal_indices = np.where(
+                normal_indices > 0,
+                normal_indices - 1,
+                normal_indices + len(data.normals),
+            )
+            referenced = data.get_normal_array()[normal_indices]
+            sums = np.add.reduceat(
+                referenced, table.normal_offsets[:-1][with_normals], axis=0
+            )
+            face_normals = np.full((len(table), 3), np.nan)
+            face_normals[with_normals] = sums / normal_counts[with_normals, None]
+            explicit = face_normals[face_ids]
+            use_explicit = ~np.isnan(explicit[:, 0])
+            normals[use_explicit] = explicit[use_explicit]
+        return normals
+
     def get_file_type(self) -> str:
         """
         :return: the supported file type of this writer
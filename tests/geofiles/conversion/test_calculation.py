@@ -1,11 +1,18 @@
 import unittest
 
+import numpy as np
+
 from geofiles.conversion.calculation import (
+    apply_affine_matrix,
     convert_obj_index,
+    get_affine_matrix,
     get_angle_between_points,
+    get_angles_between_points,
     get_center,
     get_distant_point,
+    get_distant_points,
     get_point_distance,
+    get_point_distances,
     rotate_point,
 )
 
@@ -173,3 +180,42 @@ class TestCalculation(unittest.TestCase):
 
         # then
         self.assertTrue("Index 0 not supported in OBJ" in str(context.exception))
+
+    def test_vectorized_calculations(self) -> None:
+        # given
+        points = np.asarray([[1.0, 2.0, 3.0], [-1.0, 0.5, 0.0], [0.0, 1.0, -2.0]])
+        angles = np.asarray([0.0, 45.0, 270.0])
+        distances = np.asarray([1.0, 2.0, 3.0])
+
+        # when
+        distant_points = get_distant_points(1, 2, distances, angles)
+        point_distances = get_point_distances(points, [0, 0, 0])
+        point_angles = get_angles_between_points(points, [0, 1])
+
+        # then
+        for idx, point in enumerate(points.tolist()):
+            ref = get_distant_point(1, 2, distances[idx], angles[idx])
+            self.assertAlmostEqual(distant_points[idx][0], ref[0])
+            self.assertAlmostEqual(distant_points[idx][1], ref[1])
+            self.assertAlmostEqual(
+                point_distances[idx], get_point_distance([0, 0, 0], point)
+            )
+            self.assertAlmostEqual(
+                point_angles[idx], get_angle_between_points(point, [0, 1])
+            )
+
+    def test_get_affine_matrix(self) -> None:
+        # given
+        points = np.asarray([[1.0, 2.0, 3.0], [-1.0, 0.5, 0.0], [0.0, 1.0, -2.0]])
+        center = [0.5, 0.5, 0.5]
+
+        # when
+        matrix = get_affine_matrix(center, [2, 3, 4], [30, 45, 60], [1, 2, 3])
+        res = apply_affine_matrix(points, matrix)
+
+        # then
+        for idx, point in enumerate(points.tolist()):
+            scaled = [(p - c) * s for p, c, s in zip(point, center, [2, 3, 4])]
+            ref = rotate_point(scaled, [0, 0, 0], 30, 45, 60)
+            for i in range(3):
+                self.assertAlmostEqual(res[idx][i], ref[i] + center[i] + i + 1)
@@ -1,3 +1,5 @@
+import pyproj
+
 from geofiles.conversion.crs_converter import CrsConverter
 from tests.geofiles.base_test import BaseTest
 
@@ -30,3 +32,65 @@ class TestCrsConverter(BaseTest):
         self.assertAlmostEqual(converted.vertices[0][0], 4981328.249156999)
         self.assertAlmostEqual(converted.vertices[0][1], 17994606.922839668)
         self.assertAlmostEqual(converted.vertices[0][2], 279.307006835938)
+
+    def test_convert_inplace(self) -> None:
+        # given
+        cube = self.get_cube()
+        converter = CrsConverter()
+
+        # when
+        converted = converter.convert(cube, "urn:ogc:def:crs:EPSG::4326", inplace=True)
+
+        # then
+        self.assertIs(converted, cube)
+        self.assertEqual(cube.crs, "urn:ogc:def:crs:EPSG::4326")
+        self.assertAlmostEqual(cube.vertices[0][0], 48.3028533074941)
+
+    def test_convert_shares_structure(self) -> None:
+        # given
+        cube = self.get_cube()
+        converter = CrsConverter()
+
+        # when
+        converted = converter.convert(cube, "urn:ogc:def:crs:EPSG::4326")
+
+        # then
+        self.assertEqual(cube.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertAlmostEqual(cube.vertices[0][0], 14.2842865755919)
+        self.assertIs(converted.objects[0], cube.objects[0])
+        self.assertIs(converted.meta_information, cube.meta_information)
+
+    def test_convert_update_extent(self) -> None:
+        # given
+        cube = self.get_cube()
+        converter = CrsConverter()
+
+        # when
+        converted = converter.convert(
+            cube, "urn:ogc:def:crs:EPSG::4326", update_extent=True
+        )
+
+        # then
+        self.assertEqual(
+            converted.min_extent, [48.3028443243414, 14.2842730710145, 279.307006835938]
+        )
+        self.assertEqual(
+            converted.max_extent, [48.3028533074941, 14.2842865755919, 280.307006835938]
+        )
+
+    def test_convert_array(self) -> None:
+        # given
+        cube = self.get_cube()
+        transformer = pyproj.Transformer.from_crs(
+            "urn:ogc:def:crs:EPSG::4326", "EPSG:26915", always_xy=True
+        )
+
+        # when
+        converted = CrsConverter.convert_array(
+            cube.get_vertex_array(), transformer, True, False, chunk_size=3
+        )
+
+        # then
+        self.assertEqual(converted.shape, (8, 3))
+        self.assertAlmostEqual(converted[0][0], 4981328.249156999)
+        self.assertAlmostEqual(converted[0][1], 17994606.922839668)
@@ -1,4 +1,8 @@
+import numpy as np
+
 from geofiles.conversion.extent_calculation import ExtentCalculator
+from geofiles.domain.geo_object import GeoObject
+from geofiles.domain.geo_object_file import GeoObjectFile
 from tests.geofiles.base_test import BaseTest
 
 
@@ -101,3 +105,114 @@ class TestExtentCalculator(BaseTest):
             updated.min_extent,
             [14.284095127597515, 48.30273672014227, 269.307006835938],
         )
+
+    @staticmethod
+    def get_building(num_vertices: int = 10000) -> GeoObjectFile:
+        """
+        :param num_vertices: number of vertices
+        :return: origin based file with random vertices within a 60m x 40m x 20m box
+        """
+        rng = np.random.default_rng(0)
+        res = GeoObjectFile(columnar=True)
+        res.crs = "urn:ogc:def:crs:OGC:2:84"
+        res.origin = [14.2842798233032, 48.30284881591775, 279.807006835938]
+        res.vertices = rng.random((num_vertices, 3)) * [60, 40, 20] - [30, 20, 10]
+        return res
+
+    def test_analytic_extent(self) -> None:
+        # given
+        building = self.get_building()
+        building.rotation = [0, 0, 30]
+        building.scaling = [1, 2, 1]
+        calculator = ExtentCalculator()
+
+        # when
+        local = calculator.update_extent(building, include_transformation=True)
+        exact_local = calculator.update_extent(
+            building, include_transformation=True, exact=True
+        )
+        geospatial = calculator.update_extent(
+            building, include_transformation=True, geospatial_extent=True
+        )
+        exact_geospatial = calculator.update_extent(
+            building, include_transformation=True, geospatial_extent=True, exact=True
+        )
+
+        # then
+        for idx in range(3):
+            self.assertAlmostEqual(local.min_extent[idx], exact_local.min_extent[idx])
+            self.assertAlmostEqual(local.max_extent[idx], exact_local.max_extent[idx])
+            self.assertAlmostEqual(
+                geospatial.min_extent[idx], exact_geospatial.min_extent[idx]
+            )
+            self.assertAlmostEqual(
+                geospatial.max_extent[idx], exact_geospatial.max_extent[idx]
+            )
+
+    def test_analytic_extent_rotated(self) -> None:
+        # given
+        building = self.get_building(20000)
+        building.vertices = building.get_vertex_array() * 10
+        building.rotation = [10, 20, 45]
+        calculator = ExtentCalculator()
+
+        # when
+        local = calculator.update_extent(building, include_transformation=True)
+        exact = calculator.update_extent(
+            building, include_transformation=True, exact=True
+        )
+
+        # then
+        self.assertGreater(
+            len(building.vertices), ExtentCalculator.MIN_SAMPLED_VERTICES
+        )
+        for idx in range(3):
+            self.assertAlmostEqual(local.min_extent[idx], exact.min_extent[idx])
+            self.assertAlmostEqual(local.max_extent[idx], exact.max_extent[idx])
+
+    def test_analytic_extent_geo_referenced(self) -> None:
+        # given
+        building = self.get_building()
+        building.translation = [10, 10, 10]
+        calculator = ExtentCalculator()
+        geo_referenced = calculator.update_extent(
+            building, include_transformation=True, geospatial_extent=True
+        )
+        building.translation = None
+        geo_referenced.vertices = calculator.update_extent(
+            building, geospatial_extent=True
+        ).vertices
+
+        # when
+        analytic = calculator.update_extent(geo_referenced, include_transformation=True)
+        exact = calculator.update_extent(
+            geo_referenced, include_transformation=True, exact=True
+        )
+
+        # then
+        for idx in range(3):
+            self.assertAlmostEqual(analytic.min_extent[idx], exact.min_extent[idx])
+            self.assertAlmostEqual(analytic.max_extent[idx], exact.max_extent[idx])
+
+    def test_get_object_extent(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.objects[0].translation = [1, 2, 3]
+        calculator = ExtentCalculator()
+
+        # when
+        extent = calculator.get_object_extent(cube, cube.objects[0])
+        transformed = calculator.get_object_extent(
+            cube, cube.objects[0], include_transformation=True
+        )
+        cube.vertices = [[2 * a for a in vertex] for vertex in cube.vertices]
+        replaced = calculator.get_object_extent(cube, cube.objects[0])
+        cube.objects[0].faces = cube.objects[0].faces[:1]
+        reduced = calculator.get_object_extent(cube, cube.objects[0])
+
+        # then
+        self.assertEqual(extent, ([-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]))
+        self.assertEqual(transformed, ([0.5, 1.5, 2.5], [1.5, 2.5, 3.5]))
+        self.assertEqual(replaced, ([-1.0, -1.0, -1.0], [1.0, 1.0, 1.0]))
+        self.assertEqual(reduced[0][0], reduced[1][0])
+        self.assertEqual(calculator.get_object_extent(cube, GeoObject()), ([], []))
@@ -0,0 +1,62 @@
+import numpy as np
+
+from geofiles.conversion.face_deduplicator import FaceDeduplicator
+from geofiles.domain.face_table import FaceTable
+from tests.geofiles.base_test import BaseTest
+
+
+class TestFaceDeduplicator(BaseTest):
+    def test_deduplicate(self) -> None:
+        # given
+        table = FaceTable.from_uniform([[1, 2, 3], [2, 3, 1], [3, 2, 1], [4, 5, 6]])
+
+        # when
+        deduplicated = FaceDeduplicator.deduplicate(table)
+
+        # then
+        self.assertEqual(
+            [f.indices for f in deduplicated], [[1, 2, 3], [3, 2, 1], [4, 5, 6]]
+        )
+
+    def test_deduplicate_orientation_invariant(self) -> None:
+        # given
+        table = FaceTable.from_uniform([[1, 2, 3], [2, 3, 1], [3, 2, 1], [4, 5, 6]])
+
+        # when
+        deduplicated = FaceDeduplicator.deduplicate(table, orientation_invariant=True)
+
+        # then
+        self.assertEqual([f.indices for f in deduplicated], [[1, 2, 3], [4, 5, 6]])
+
+    def test_deduplicate_mixed_sizes(self) -> None:
+        # given
+        table = FaceTable.from_arrays(
+            [1, 2, 3, 4, 1, 2, 3, 3, 4, 1, 2], [0, 4, 7, 11], [1, 2, 3], [0, 1, 2, 3]
+        )
+
+        # when
+        deduplicated = FaceDeduplicator.deduplicate(table)
+
+        # then
+        self.assertEqual([f.indices for f in deduplicated], [[1, 2, 3, 4], [1, 2, 3]])
+        self.assertEqual([f.normal_indices for f in deduplicated], [[1], [2]])
+
+    def test_deduplicate_negative_indices(self) -> None:
+        # given
+        table = FaceTable.from_uniform([[1, 2, 3], [-10, -9, -8]])
+
+        # when
+        deduplicated = FaceDeduplicator.deduplicate(table, num_vertices=10)
+
+        # then
+        self.assertEqual(len(deduplicated), 1)
+
+    def test_canonicalize_repeated_index(self) -> None:
+        # given
+        rows = np.array([[1, 2, 1, 3], [1, 3, 1, 2]])
+
+        # when
+        canonical = FaceDeduplicator.canonicalize(rows)
+
+        # then
+        self.assertTrue(np.array_equal(canonical, [[1, 2, 1, 3], [1, 2, 1, 3]]))
@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from geofiles.conversion.local_converter import LocalConverter
 from tests.geofiles.base_test import BaseTest
 
@@ -43,6 +45,27 @@ class TestLocalConverter(BaseTest):
             self.assertAlmostEqual(vertex[1], res[idx][1])
             self.assertAlmostEqual(vertex[2], res[idx][2])
 
+    def test_from_local_enu(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        converter = LocalConverter()
+        crs = "urn:ogc:def:crs:OGC:2:84"
+        origin = [14.2842798233032, 48.30284881591775, 279.807006835938]
+        report: Dict[str, Any] = {}
+
+        # when
+        exact = converter.from_local(cube, crs, origin, False)
+        converted = converter.from_local(
+            cube, crs, origin, False, approximation="enu", report=report
+        )
+
+        # then
+        self.assertEqual(report["method"], "enu")
+        for idx, vertex in enumerate(converted.vertices):
+            self.assertAlmostEqual(vertex[0], exact.vertices[idx][0], 10)
+            self.assertAlmostEqual(vertex[1], exact.vertices[idx][1], 10)
+            self.assertAlmostEqual(vertex[2], exact.vertices[idx][2])
+
     def test_to_local(self) -> None:
         # given
         cube = self.get_cube()
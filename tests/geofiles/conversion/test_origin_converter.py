@@ -1,3 +1,5 @@
+from typing import Any, Dict
+
 from geofiles.conversion.local_converter import OriginConverter
 from tests.geofiles.base_test import BaseTest
 
@@ -41,3 +43,113 @@ class TestOriginConverter(BaseTest):
             self.assertAlmostEqual(vertex[0], res.vertices[idx][0], 4)
             self.assertAlmostEqual(vertex[1], res.vertices[idx][1], 4)
             self.assertAlmostEqual(vertex[2], res.vertices[idx][2])
+
+    def test_from_origin_inplace(self) -> None:
+        # given
+        converter = OriginConverter()
+        cube = self.get_cube(True)
+        origin = cube.origin
+
+        # when
+        converted = converter.from_origin(cube, inplace=True)
+
+        # then
+        self.assertIs(converted, cube)
+        self.assertIsNone(cube.origin)
+        self.assertAlmostEqual(cube.vertices[0][0], 14.2842865755919, 4)
+        self.assertAlmostEqual(cube.vertices[0][2], origin[2] - 0.5)
+
+    def test_to_origin_shares_structure(self) -> None:
+        # given
+        converter = OriginConverter()
+        cube = self.get_cube()
+
+        # when
+        converted = converter.to_origin(cube)
+
+        # then
+        self.assertFalse(cube.is_origin_based())
+        self.assertIs(converted.objects[0], cube.objects[0])
+        self.assertIsNot(converted.vertices, cube.vertices)
+
+    def test_round_trip_columnar(self) -> None:
+        # given
+        converter = OriginConverter()
+        cube = self.get_cube()
+        cube.to_columnar()
+
+        # when
+        origin_based = converter.to_origin(cube, update_extent=True)
+        converted = converter.from_origin(origin_based, update_extent=True)
+
+        # then
+        self.assertTrue(origin_based.is_columnar())
+        self.assertAlmostEqual(origin_based.min_extent[2], -0.5)
+        self.assertAlmostEqual(origin_based.max_extent[2], 0.5)
+        for idx, vertex in enumerate(converted.vertices):
+            ref = self.get_cube().vertices[idx]
+            self.assertAlmostEqual(vertex[0], ref[0], 4)
+            self.assertAlmostEqual(vertex[1], ref[1], 4)
+            self.assertAlmostEqual(vertex[2], ref[2])
+        self.assertAlmostEqual(converted.min_extent[0], 14.2842730710145, 4)
+        self.assertAlmostEqual(converted.max_extent[1], 48.3028533074941, 4)
+
+    def test_to_origin_enu(self) -> None:
+        # given
+        converter = OriginConverter()
+        cube = self.get_cube()
+        report: Dict[str, Any] = {}
+
+        # when
+        exact = converter.to_origin(cube, bearing_offset=10)
+        approximated = converter.to_origin(
+            cube, bearing_offset=10, approximation="enu", report=report
+        )
+
+        # then
+        self.assertEqual(report["method"], "enu")
+        self.assertLess(report["max_error"], 1e-6)
+        self.assertEqual(report["sampled_vertices"], 8)
+        for idx, vertex in enumerate(approximated.vertices):
+            self.assertAlmostEqual(vertex[0], exact.vertices[idx][0], 6)
+            self.assertAlmostEqual(vertex[1], exact.vertices[idx][1], 6)
+            self.assertEqual(vertex[2], exact.vertices[idx][2])
+
+    def test_from_origin_enu(self) -> None:
+        # given
+        converter = OriginConverter()
+        cube = self.get_cube(True)
+        cube.crs = "urn:ogc:def:crs:EPSG::4326"
+        cube.origin = [cube.origin[1], cube.origin[0], cube.origin[2]]
+        report: Dict[str, Any] = {}
+
+        # when
+        exact = converter.from_origin(cube)
+        approximated = converter.from_origin(cube, approximation="enu", report=report)
+
+        # then
+        self.assertEqual(report["method"], "enu")
+        self.assertLess(report["max_error"], 1e-6)
+        for idx, vertex in enumerate(approximated.vertices):
+            self.assertAlmostEqual(vertex[0], exact.vertices[idx][0], 10)
+            self.assertAlmostEqual(vertex[1], exact.vertices[idx][1], 10)
+            self.assertEqual(vertex[2], exact.vertices[idx][2])
+
+    def test_enu_fallback(self) -> None:
+        # given
+        converter = OriginConverter()
+        cube = self.get_cube()
+        report: Dict[str, Any] = {}
+
+        # when
+        exact = converter.to_origin(cube)
+        converted = converter.to_origin(
+            cube, approximation="enu", max_approximation_extent=0.1, report=report
+        )
+
+        # then
+        self.assertEqual(report["method"], "exact")
+        self.assertGreater(report["extent"], 0.1)
+        self.assertEqual(converted.vertices, exact.vertices)
+        with self.assertRaises(Exception):
+            converter.to_origin(cube, approximation="utm")
@@ -0,0 +1,88 @@
+import numpy as np
+
+from geofiles.conversion.crs_converter import CrsConverter
+from geofiles.conversion.local_converter import LocalConverter
+from geofiles.conversion.origin_converter import OriginConverter
+from geofiles.conversion.pipeline import ConversionPipeline
+from geofiles.conversion.transformer import Transformer
+from tests.geofiles.base_test import BaseTest
+
+
+class TestConversionPipeline(BaseTest):
+    def test_execute(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.scaling = [2, 3, 4]
+        cube.rotation = [10, 20, 30]
+        cube.translation = [1, 2, 3]
+        crs = "urn:ogc:def:crs:OGC:2:84"
+        origin = [14.2842798233032, 48.30284881591775, 279.807006835938]
+        geo_referenced = LocalConverter.from_local(cube, crs, origin)
+        transformed = Transformer.transform(geo_referenced)
+        converted = OriginConverter.from_origin(transformed)
+        reference = CrsConverter().convert(converted, "EPSG:31256", update_extent=True)
+
+        # when
+        pipeline = (
+            ConversionPipeline(cube, chunk_size=3)
+            .from_local(crs, origin)
+            .transform()
+            .from_origin()
+            .convert("EPSG:31256")
+        )
+        res = pipeline.execute(update_extent=True)
+
+        # then
+        self.assertEqual(pipeline.get_plan(), ["affine", "from_origin", "crs"])
+        self.assertEqual(res.crs, "EPSG:31256")
+        self.assertIsNone(res.origin)
+        self.assertIsNone(res.rotation)
+        self.assertEqual(cube.rotation, [10, 20, 30])
+        self.assertIsNone(cube.crs)
+        self.assertTrue(
+            np.allclose(res.get_vertex_array(), reference.get_vertex_array())
+        )
+        self.assertTrue(np.allclose(res.min_extent, reference.min_extent))
+        self.assertTrue(np.allclose(res.max_extent, reference.max_extent))
+
+    def test_fuse_affine_steps(self) -> None:
+        # given
+        cube = self.get_cube(True)
+        cube.rotation = [90, 0, 0]
+        cube.scaling = [2, 2, 2]
+        matrix = np.eye(4)
+        matrix[:3, 3] = [5, 5, 5]
+        reference = Transformer.apply_matrix(Transformer.transform(cube), matrix)
+        reference = Transformer.transform(reference)
+
+        # when
+        pipeline = (
+            ConversionPipeline(cube)
+            .transform(scale=False)
+            .transform(rotate=False)
+            .apply_matrix(matrix)
+            .transform()
+            .convert("urn:ogc:def:crs:EPSG::4326")
+        )
+        res = pipeline.execute(inplace=True)
+
+        # then
+        self.assertEqual(pipeline.get_plan(), ["affine"])
+        self.assertIs(res, cube)
+        self.assertAlmostEqual(res.origin[0], 48.30284881591775)
+        self.assertEqual(res.min_extent, [])
+        for idx, vertex in enumerate(res.vertices):
+            for i in range(3):
+                self.assertAlmostEqual(vertex[i], reference.vertices[idx][i])
+
+    def test_invalid_steps(self) -> None:
+        # given
+        pipeline = ConversionPipeline(self.get_cube())
+
+        # when / then
+        with self.assertRaises(Exception):
+            pipeline.transform()
+        with self.assertRaises(Exception):
+            pipeline.from_origin()
+        with self.assertRaises(Exception):
+            pipeline.from_local("urn:ogc:def:crs:OGC:2:84", [0, 0, 0])
@@ -0,0 +1,130 @@
+import os
+import tempfile
+
+import numpy as np
+
+from geofiles.conversion.spatial_index import SpatialIndex
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_object import GeoObject
+from geofiles.domain.geo_object_file import GeoObjectFile
+from tests.geofiles.base_test import BaseTest
+
+
+class TestSpatialIndex(BaseTest):
+    def get_city(self, size: int = 10) -> GeoObjectFile:
+        """
+        :param size: number of cubes per row and column
+        :return: local file with a grid of unit cubes (one object per cube) with a spacing of 2
+        """
+        cube = self.get_local_cube()
+        table = cube.objects[0].get_face_table()
+        res = GeoObjectFile()
+        vertices = []
+        for idx in range(size * size):
+            offset = np.asarray([(idx % size) * 2, (idx // size) * 2, 0])
+            vertices.append(np.asarray(cube.vertices) + offset)
+            geoobj = GeoObject()
+            geoobj.name = f"cube{idx}"
+            geoobj.faces = FaceTable.from_arrays(table.indices + 8 * idx, table.offsets)
+            res.objects.append(geoobj)
+        res.set_vertex_array(np.concatenate(vertices))
+        return res
+
+    def test_query_box(self) -> None:
+        # given
+        city = self.get_city()
+        index = SpatialIndex.from_objects(city, node_capacity=4)
+
+        # when
+        entries = index.query_box([1.0, 1.0, 0.0], [4.0, 2.0, 0.0])
+        objects = index.get_objects(city, entries)
+
+        # then
+        self.assertEqual([o.name for o in objects], ["cube11", "cube12"])
+        self.assertEqual(len(index.query_box([0.6, 0.6, 0], [0.9, 0.9, 0])), 0)
+        self.assertEqual(index.get_extent(), ([-0.5, -0.5, -0.5], [18.5, 18.5, 0.5]))
+
+    def test_query_point(self) -> None:
+        # given
+        city = self.get_city()
+        index = SpatialIndex.from_faces(city)
+
+        # when
+        entries = index.query_point([4.5, 6.0, 0.0])
+
+        # then
+        self.assertTrue(np.all(index.object_ids[entries] == 32))
+        self.assertEqual(
+            sorted(index.face_ids[entries].tolist()),
+            [
+                idx
+                for idx, face in enumerate(city.objects[32].faces)
+                if all(city.get_vertex(i)[0] == 4.5 for i in face.indices)
+            ],
+        )
+
+    def test_query_random(self) -> None:
+        # given
+        rng = np.random.default_rng(0)
+        min_boxes = rng.random((1000, 3)) * 100
+        max_boxes = min_boxes + rng.random((1000, 3)) * 5
+        index = SpatialIndex(min_boxes, max_boxes, np.arange(1000))
+        low = np.asarray([20, 30, 0])
+        high = np.asarray([40, 50, 100])
+
+        # when
+        entries = index.query_box(low, high)
+
+        # then
+        expected = np.flatnonzero(
+            np.all(min_boxes <= high, axis=1) & np.all(max_boxes >= low, axis=1)
+        )
+        self.assertEqual(entries.tolist(), expected.tolist())
+
+    def test_nearest(self) -> None:
+        # given
+        city = self.get_city()
+        index = SpatialIndex.from_objects(city, node_capacity=4)
+
+        # when
+        entries = index.nearest([5.0, 4.0, 3.0], 3)
+
+        # then
+        self.assertEqual(index.object_ids[entries[:2]].tolist(), [22, 23])
+        self.assertIn(index.object_ids[entries[2]], [12, 13, 32, 33])
+        self.assertEqual(len(index.nearest([0, 0, 0], 1000)), 100)
+
+    def test_empty(self) -> None:
+        # given
+        data = GeoObjectFile()
+
+        # when
+        index = SpatialIndex.from_faces(data)
+
+        # then
+        self.assertEqual(len(index), 0)
+        self.assertEqual(len(index.query_box([0, 0, 0], [1, 1, 1])), 0)
+        self.assertEqual(len(index.nearest([0, 0, 0])), 0)
+        self.assertEqual(index.get_extent(), ([], []))
+
+    def test_save_load(self) -> None:
+        # given
+        city = self.get_city()
+        index = SpatialIndex.from_faces(city)
+
+        # when
+        with tempfile.TemporaryDirectory() as directory:
+            path = SpatialIndex.get_index_path(os.path.join(directory, "city.obj"))
+            index.save(path)
+            loaded = SpatialIndex.load(path)
+
+        # then
+        self.assertTrue(path.endswith("city.obj.sidx"))
+        self.assertEqual(len(loaded), len(index))
+        self.assertEqual(
+            loaded.query_box([3, 3, 0], [7, 5, 0]).tolist(),
+            index.query_box([3, 3, 0], [7, 5, 0]).tolist(),
+        )
+        self.assertEqual(
+            loaded.nearest([9, 9, 9], 5).tolist(), index.nearest([9, 9, 9], 5).tolist()
+        )
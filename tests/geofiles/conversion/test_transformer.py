@@ -1,5 +1,7 @@
 import copy
 
+import numpy as np
+
 from geofiles.conversion.transformer import Transformer
 from tests.geofiles.base_test import BaseTest
 
@@ -26,7 +28,8 @@ class TestTransformer(BaseTest):
 
         # then
         for idx, vertex in enumerate(rotated.vertices):
-            self.assertEqual(vertex, res[idx])
+            for i in range(3):
+                self.assertAlmostEqual(vertex[i], res[idx][i])
 
     def test_translate(self) -> None:
         # given
@@ -82,7 +85,8 @@ class TestTransformer(BaseTest):
 
         # then
         for idx, vertex in enumerate(transformed.vertices):
-            self.assertEqual(vertex, res[idx])
+            for i in range(3):
+                self.assertAlmostEqual(vertex[i], res[idx][i])
 
     def test_transform2(self) -> None:
         # given
@@ -123,3 +127,94 @@ class TestTransformer(BaseTest):
             self.assertNotEqual(elem, transformed.objects[1].faces[idx])
         self.assertEqual(transformed.min_extent, [-1.0, -1.0, -1.0])
         self.assertEqual(transformed.max_extent, [11.0, 11.0, 11.0])
+
+    def test_transform_inplace(self) -> None:
+        # given
+        cube = self.get_cube(True)
+        cube.translation = [5, -5, 10]
+        vertices = cube.vertices
+        transformer = Transformer()
+
+        # when
+        translated = transformer.translate(cube, inplace=True)
+
+        # then
+        self.assertIs(translated, cube)
+        self.assertIsNone(cube.translation)
+        for idx, vertex in enumerate(cube.vertices):
+            self.assertAlmostEqual(vertex[0], vertices[idx][0] + 5)
+
+    def test_transform_local_does_not_modify_input(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.crs = "urn:ogc:def:crs:OGC:2:84"
+        cube.origin = [14.2842798233032, 48.30284881591775, 279.807006835938]
+        cube.objects.append(copy.deepcopy(cube.objects[0]))
+        cube.objects[1].translation = [10, 10, 10]
+        cube.objects[1].parent = cube.objects[0]
+        transformer = Transformer()
+
+        # when
+        transformed = transformer.transform(cube, apply_only_global=False)
+
+        # then
+        self.assertEqual(cube.objects[1].translation, [10, 10, 10])
+        self.assertIsNone(transformed.objects[1].translation)
+        self.assertIs(transformed.objects[1].parent, transformed.objects[0])
+        self.assertEqual(len(cube.vertices), 8)
+
+    def test_get_transformation_matrix(self) -> None:
+        # given
+        cube = self.get_cube(True)
+        cube.rotation = [90, 0, 0]
+        cube.translation = [5, 5, 5]
+        cube.scaling = [2, 2, 2]
+        transformer = Transformer()
+
+        # when
+        matrix = transformer.get_transformation_matrix(cube)
+        rotation = transformer.get_transformation_matrix(
+            cube, scale=False, translate=False
+        )
+        translation = transformer.get_transformation_matrix(
+            cube, scale=False, rotate=False
+        )
+        scaling = transformer.get_transformation_matrix(
+            cube, rotate=False, translate=False
+        )
+        chained = transformer.apply_matrix(cube, translation @ rotation @ scaling)
+
+        # then
+        self.assertEqual(matrix.shape, (4, 4))
+        self.assertEqual(cube.rotation, [90, 0, 0])
+        self.assertTrue(np.allclose(matrix, translation @ rotation @ scaling))
+        self.assertEqual(chained.rotation, [90, 0, 0])
+        transformed = transformer.transform(cube)
+        for idx, vertex in enumerate(chained.vertices):
+            for i in range(3):
+                self.assertAlmostEqual(vertex[i], transformed.vertices[idx][i])
+
+    def test_transform_local_scaling(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.crs = "urn:ogc:def:crs:OGC:2:84"
+        cube.origin = [14.2842798233032, 48.30284881591775, 279.807006835938]
+        cube.objects.append(copy.deepcopy(cube.objects[0]))
+        cube.objects[1].scaling = [2, 2, 2]
+        cube.objects[1].pack_faces()
+        transformer = Transformer()
+
+        # when
+        transformed = transformer.transform(cube, apply_only_global=False)
+
+        # then
+        self.assertEqual(len(transformed.vertices), 16)
+        self.assertIsNone(transformed.objects[1].scaling)
+        self.assertTrue(transformed.objects[1].is_packed())
+        self.assertFalse(transformed.objects[0].is_packed())
+        self.assertEqual(transformed.vertices[8], [-1.0, -1.0, 1.0])
+        self.assertEqual(list(transformed.objects[1].faces[0].indices), [9, 10, 11])
+        self.assertEqual(
+            [face.indices for face in transformed.objects[0].faces],
+            [face.indices for face in cube.objects[0].faces],
+        )
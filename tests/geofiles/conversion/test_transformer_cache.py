@@ -0,0 +1,119 @@
+from threading import Thread
+from typing import Any, List
+
+from pyproj.aoi import AreaOfInterest
+
+from geofiles.conversion.crs_converter import CrsConverter
+from geofiles.conversion.transformer_cache import (
+    CrsTransformerCache,
+    get_default_transformer_cache,
+)
+from tests.geofiles.base_test import BaseTest
+
+
+class TestCrsTransformerCache(BaseTest):
+    def test_get_transformer(self) -> None:
+        # given
+        cache = CrsTransformerCache()
+
+        # when
+        first = cache.get_transformer("EPSG:4326", "EPSG:26915")
+        second = cache.get_transformer("EPSG:4326", "EPSG:26915")
+        third = cache.get_transformer("EPSG:4326", "EPSG:26915", always_xy=False)
+
+        # then
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(
+            {"hits": 1, "misses": 2, "evictions": 0, "size": 2, "max_size": 64},
+            cache.get_stats(),
+        )
+
+    def test_area_of_interest(self) -> None:
+        # given
+        cache = CrsTransformerCache()
+
+        # when
+        first = cache.get_transformer(
+            "EPSG:4326", "EPSG:31256", area_of_interest=(14.0, 48.0, 15.0, 49.0)
+        )
+        second = cache.get_transformer(
+            "EPSG:4326",
+            "EPSG:31256",
+            area_of_interest=AreaOfInterest(14.0, 48.0, 15.0, 49.0),
+        )
+        third = cache.get_transformer("EPSG:4326", "EPSG:31256")
+
+        # then
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+
+    def test_eviction(self) -> None:
+        # given
+        cache = CrsTransformerCache(max_size=2)
+        first = cache.get_transformer("EPSG:4326", "EPSG:26915")
+        cache.get_transformer("EPSG:4326", "EPSG:26916")
+
+        # when
+        cache.get_transformer("EPSG:4326", "EPSG:26915")
+        cache.get_transformer("EPSG:4326", "EPSG:26917")
+
+        # then
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.get_stats()["evictions"])
+        self.assertIs(first, cache.get_transformer("EPSG:4326", "EPSG:26915"))
+        self.assertEqual(3, cache.get_stats()["misses"])
+
+    def test_invalidate(self) -> None:
+        # given
+        cache = CrsTransformerCache()
+        cache.get_transformer("EPSG:4326", "EPSG:26915")
+        cache.get_transformer("EPSG:4326", "EPSG:26916")
+        cache.get_transformer("EPSG:26915", "EPSG:4326")
+
+        # when
+        removed_target = cache.invalidate(target="EPSG:26915")
+        removed_source = cache.invalidate(source="EPSG:4326")
+        cache.clear()
+
+        # then
+        self.assertEqual(1, removed_target)
+        self.assertEqual(1, removed_source)
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.get_stats()["misses"])
+
+    def test_thread_safety(self) -> None:
+        # given
+        cache = CrsTransformerCache()
+        results: List[Any] = []
+
+        def worker() -> None:
+            for _ in range(20):
+                results.append(cache.get_transformer("EPSG:4326", "EPSG:26915"))
+
+        threads = [Thread(target=worker) for _ in range(4)]
+
+        # when
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # then
+        self.assertEqual(80, len(results))
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(1, len(cache))
+
+    def test_crs_converter_uses_cache(self) -> None:
+        # given
+        cache = CrsTransformerCache()
+        converter = CrsConverter(cache)
+
+        # when
+        converter.convert(self.get_cube(), "EPSG:26915")
+        converter.convert(self.get_cube(), "EPSG:26915")
+
+        # then
+        self.assertEqual(1, cache.get_stats()["misses"])
+        self.assertEqual(1, cache.get_stats()["hits"])
+        self.assertIs(get_default_transformer_cache(), CrsConverter().transformer_cache)
@@ -0,0 +1,107 @@
+import numpy as np
+
+from geofiles.conversion.triangle_bvh import TriangleBvh
+from geofiles.domain.face_table import FaceTable
+from geofiles.domain.geo_object import GeoObject
+from geofiles.domain.geo_object_file import GeoObjectFile
+from tests.geofiles.base_test import BaseTest
+
+
+class TestTriangleBvh(BaseTest):
+    def get_street(self, size: int = 20) -> GeoObjectFile:
+        """
+        :param size: number of cubes
+        :return: local file with a row of unit cubes along the x axis (one object per cube) with a spacing of 2
+        """
+        cube = self.get_local_cube()
+        table = cube.objects[0].get_face_table()
+        res = GeoObjectFile()
+        vertices = []
+        for idx in range(size):
+            vertices.append(np.asarray(cube.vertices) + [idx * 2, 0, 0])
+            geoobj = GeoObject()
+            geoobj.name = f"cube{idx}"
+            geoobj.faces = FaceTable.from_arrays(table.indices + 8 * idx, table.offsets)
+            res.objects.append(geoobj)
+        res.set_vertex_array(np.concatenate(vertices))
+        return res
+
+    def test_intersect(self) -> None:
+        # given
+        street = self.get_street()
+        bvh = TriangleBvh.from_file(street, leaf_size=2, branching=2)
+
+        # when
+        distances, triangle_ids = bvh.intersect(
+            [[-5, 0, 0], [12, 0, 5], [13, 0, 5], [7, 0.2, 0.1]],
+            [[1, 0, 0], [0, 0, -1], [0, 1, 0], [-1, 0, 0]],
+        )
+
+        # then
+        self.assertEqual(len(bvh), 240)
+        self.assertAlmostEqual(distances[0], 4.5)
+        self.assertAlmostEqual(distances[1], 4.5)
+        self.assertTrue(np.isinf(distances[2]))
+        self.assertAlmostEqual(distances[3], 0.5)
+        self.assertEqual(triangle_ids[2], -1)
+        self.assertEqual(bvh.get_names(triangle_ids), ["cube0", "cube6", None, "cube3"])
+        face = street.objects[6].faces[bvh.face_ids[triangle_ids[1]]]
+        self.assertTrue(all(street.get_vertex(i)[2] == 0.5 for i in face.indices))
+
+    def test_intersects(self) -> None:
+        # given
+        bvh = TriangleBvh.from_file(self.get_street())
+
+        # when
+        hits = bvh.intersects(
+            [[-5, 0, 0], [-5, 0, 0], [-5, 2, 0]],
+            [[1, 0, 0], [1, 0, 0], [1, 0, 0]],
+            [10, 4, 100],
+        )
+
+        # then
+        self.assertEqual(hits.tolist(), [True, False, False])
+
+    def test_is_visible(self) -> None:
+        # given
+        bvh = TriangleBvh.from_file(self.get_street())
+
+        # when
+        visible = bvh.is_visible(
+            [[1, 0, 0], [1, 0, 0], [0.5, 0, 0]],
+            [[3, 0, 0], [5, 0, 0], [1.5, 0, 0]],
+        )
+
+        # then
+        self.assertEqual(visible.tolist(), [False, False, True])
+
+    def test_random(self) -> None:
+        # given
+        rng = np.random.default_rng(0)
+        corners = rng.random((300, 1, 3)) * 50
+        vertices = (corners + rng.random((300, 3, 3)) * 2).reshape(-1, 3)
+        bvh = TriangleBvh(vertices, np.arange(900).reshape(-1, 3))
+        origins = rng.random((200, 3)) * 50
+        directions = rng.normal(size=(200, 3))
+
+        # when
+        distances, _ = bvh.intersect(origins, directions)
+
+        # then
+        pairs = bvh._intersect_triangles(
+            np.repeat(origins, 300, axis=0),
+            np.repeat(directions, 300, axis=0),
+            np.tile(bvh.triangles, (200, 1)),
+        ).reshape(200, 300)
+        pairs[pairs < 0] = np.inf
+        expected = pairs.min(axis=1)
+        self.assertTrue(np.any(np.isfinite(expected)))
+        self.assertTrue(np.allclose(distances, expected))
+
+    def test_geo_referenced(self) -> None:
+        # given
+        cube = self.get_cube()
+
+        # when / then
+        self.assertRaises(Exception, TriangleBvh.from_file, cube)
+        self.assertEqual(len(TriangleBvh.from_file(self.get_cube(True))), 12)
@@ -0,0 +1,63 @@
+import numpy as np
+
+from geofiles.conversion.vertex_welder import VertexWelder
+from geofiles.domain.face import Face
+from geofiles.domain.geo_object import GeoObject
+from geofiles.domain.geo_object_file import GeoObjectFile
+from tests.geofiles.base_test import BaseTest
+
+
+class TestVertexWelder(BaseTest):
+    def test_get_unique_vertices(self) -> None:
+        # given
+        vertices = np.array([[1, 1, 1], [0, 0, 0], [1, 1, 1], [-0.0, 0, 0], [2, 2, 2]])
+
+        # when
+        unique, inverse = VertexWelder.get_unique_vertices(vertices)
+
+        # then
+        self.assertEqual(unique.tolist(), [0, 1, 4])
+        self.assertEqual(inverse.tolist(), [0, 1, 0, 1, 2])
+
+    def test_get_unique_vertices_epsilon(self) -> None:
+        # given
+        vertices = np.array([[1.0, 1.0, 1.0], [1.001, 0.999, 1.0], [1.1, 1.0, 1.0]])
+
+        # when
+        unique, inverse = VertexWelder.get_unique_vertices(vertices, 0.01)
+
+        # then
+        self.assertEqual(unique.tolist(), [0, 2])
+        self.assertEqual(inverse.tolist(), [0, 0, 1])
+
+    def test_weld(self) -> None:
+        # given
+        data = GeoObjectFile()
+        data.vertices = [
+            [0, 0, 0],
+            [1, 0, 0],
+            [0, 1, 0],
+            [1, 0, 0],
+            [0, 1, 0],
+            [1, 1, 0],
+        ]
+        geo_object = GeoObject()
+        face1 = Face()
+        face1.indices = [1, 2, 3]
+        face2 = Face()
+        face2.indices = [4, -1, -2]
+        geo_object.faces = [face1, face2]
+        packed = GeoObject()
+        packed.faces = [face2]
+        packed.pack_faces()
+        data.objects = [geo_object, packed]
+
+        # when
+        VertexWelder.weld(data)
+
+        # then
+        self.assertEqual(len(data.vertices), 4)
+        self.assertEqual(data.vertices[3], [1, 1, 0])
+        self.assertEqual(geo_object.faces[0].indices, [1, 2, 3])
+        self.assertEqual(geo_object.faces[1].indices, [2, 4, 3])
+        self.assertEqual(packed.faces[0].indices, [2, 4, 3])
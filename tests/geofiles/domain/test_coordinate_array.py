@@ -0,0 +1,69 @@
+import numpy as np
+
+from geofiles.domain.coordinate_array import CoordinateArray
+from tests.geofiles.base_test import BaseTest
+
+
+class TestCoordinateArray(BaseTest):
+    def test_append(self) -> None:
+        # given
+        coordinates = CoordinateArray()
+
+        # when
+        for i in range(100):
+            coordinates.append([i, i + 1, i + 2])
+
+        # then
+        self.assertEqual(len(coordinates), 100)
+        self.assertEqual(coordinates.array.shape, (100, 3))
+        self.assertEqual(coordinates[99], [99.0, 100.0, 101.0])
+        self.assertEqual(coordinates[-1], [99.0, 100.0, 101.0])
+
+    def test_append2(self) -> None:
+        # given
+        coordinates = CoordinateArray([[1, 2, 3]])
+
+        # when
+        with self.assertRaises(Exception) as context:
+            coordinates.append([1, 2])
+
+        # then
+        self.assertTrue("does not match dimension" in str(context.exception))
+
+    def test_list_compatibility(self) -> None:
+        # given
+        cube = self.get_cube()
+
+        # when
+        coordinates = CoordinateArray(cube.vertices)
+
+        # then
+        self.assertEqual(coordinates, cube.vertices)
+        self.assertEqual(list(coordinates), cube.vertices)
+        self.assertTrue(cube.vertices[3] in coordinates)
+        self.assertFalse([0, 0, 0] in coordinates)
+
+    def test_float32(self) -> None:
+        # given
+        cube = self.get_local_cube()
+
+        # when
+        coordinates = CoordinateArray(cube.vertices, np.float32)
+
+        # then
+        self.assertEqual(coordinates.array.dtype, np.float32)
+        self.assertEqual(coordinates, cube.vertices)
+
+    def test_read_only(self) -> None:
+        # given
+        array = np.zeros((2, 3))
+        array.flags.writeable = False
+        coordinates = CoordinateArray(array)
+
+        # when
+        coordinates[0] = [1, 2, 3]
+        coordinates.append([4, 5, 6])
+
+        # then
+        self.assertEqual(coordinates.tolist(), [[1, 2, 3], [0, 0, 0], [4, 5, 6]])
+        self.assertEqual(array.tolist(), [[0, 0, 0], [0, 0, 0]])
@@ -0,0 +1,136 @@
+import numpy as np
+
+from geofiles.domain.face import Face
+from geofiles.domain.face_table import FaceTable
+from tests.geofiles.base_test import BaseTest
+
+
+class TestFaceTable(BaseTest):
+    def test_from_faces(self) -> None:
+        # given
+        cube = self.get_cube()
+        faces = cube.objects[0].faces
+
+        # when
+        table = FaceTable.from_faces(faces)
+
+        # then
+        self.assertEqual(len(table), 12)
+        self.assertEqual(len(table.indices), 36)
+        self.assertEqual(table.get_uniform_size(), 3)
+        for idx, face in enumerate(table):
+            self.assertEqual(face.indices, faces[idx].indices)
+
+    def test_mixed_sizes(self) -> None:
+        # given
+        face1 = Face()
+        face1.indices = [1, 2, 3, 4]
+        face1.normal_indices = [1, 1, 1, 1]
+        face2 = Face()
+        face2.indices = [4, 5, 6]
+
+        # when
+        table = FaceTable.from_faces([face1, face2])
+
+        # then
+        self.assertIsNone(table.get_uniform_size())
+        self.assertEqual(table.offsets.tolist(), [0, 4, 7])
+        self.assertEqual(table[0].normal_indices, [1, 1, 1, 1])
+        self.assertEqual(table[-1].indices, [4, 5, 6])
+        self.assertEqual(table[-1].normal_indices, [])
+
+    def test_append(self) -> None:
+        # given
+        table = FaceTable()
+        face = Face()
+        face.indices = [1, 2, 3]
+
+        # when
+        for _ in range(100):
+            table.append(face)
+
+        # then
+        self.assertEqual(len(table), 100)
+        self.assertEqual(table[99].indices, [1, 2, 3])
+
+    def test_take(self) -> None:
+        # given
+        table = FaceTable.from_faces(self.get_cube().objects[0].faces)
+
+        # when
+        taken = table.take([11, 0])
+
+        # then
+        self.assertEqual(len(taken), 2)
+        self.assertEqual(taken[0].indices, [7, 2, 1])
+        self.assertEqual(taken[1].indices, [1, 2, 3])
+
+    def test_get_zero_based_indices(self) -> None:
+        # given
+        table = FaceTable.from_uniform([[1, -1, 2]])
+
+        # when
+        indices = table.get_zero_based_indices(8)
+
+        # then
+        self.assertEqual(indices.tolist(), [0, 7, 1])
+
+    def test_triangulate(self) -> None:
+        # given
+        table = FaceTable.from_arrays(
+            [1, 2, 3, 4, 5, 6, 7, 4, 5, 6, 7, 8], [0, 3, 7, 12]
+        )
+
+        # when
+        triangles, face_ids = table.triangulate()
+
+        # then
+        self.assertEqual(
+            [f.indices for f in triangles],
+            [[1, 2, 3], [4, 5, 6], [4, 6, 7], [4, 5, 6], [4, 6, 7], [4, 7, 8]],
+        )
+        self.assertEqual(face_ids.tolist(), [0, 1, 1, 2, 2, 2])
+
+    def test_read_only_faces(self) -> None:
+        # given
+        table = FaceTable.from_faces(self.get_cube().objects[0].faces)
+
+        # when
+        face = table[0]
+
+        # then
+        with self.assertRaises(Exception):
+            face.indices[0] = 7
+        with self.assertRaises(Exception):
+            face.indices.reverse()
+        with self.assertRaises(Exception):
+            face.indices = [7, 8, 9]
+        for packed in table:
+            with self.assertRaises(Exception):
+                packed.indices.append(7)
+        self.assertEqual(table[0].indices, [1, 2, 3])
+        unpacked = table.to_faces()
+        unpacked[0].indices.reverse()
+        self.assertEqual(unpacked[0].indices, [3, 2, 1])
+
+    def test_set_item(self) -> None:
+        # given
+        table = FaceTable.from_faces(self.get_cube().objects[0].faces)
+        indices = table.indices
+        same_size = Face()
+        same_size.indices = [3, 2, 1]
+        other_size = Face()
+        other_size.indices = [1, 2, 3, 4]
+
+        # when
+        table[0] = same_size
+        in_place = np.shares_memory(table.indices, indices)
+        table[-1] = other_size
+
+        # then
+        self.assertTrue(in_place)
+        self.assertEqual(len(table), 12)
+        self.assertEqual(table[0].indices, [3, 2, 1])
+        self.assertEqual(table[1].indices, [1, 3, 4])
+        self.assertEqual(table[11].indices, [1, 2, 3, 4])
+        self.assertEqual(table.offsets[-1], 37)
@@ -164,3 +164,27 @@ class TestGeoObject(BaseTest):
 
         # then
         self.assertTrue(res)
+
+    def test_pack_faces(self) -> None:
+        # given
+        geoobject = self.get_cube().objects[0]
+        faces = [f.indices for f in geoobject.faces]
+
+        # when
+        geoobject.pack_faces()
+
+        # then
+        self.assertTrue(geoobject.is_packed())
+        self.assertEqual([f.indices for f in geoobject.faces], faces)
+
+    def test_unpack_faces(self) -> None:
+        # given
+        geoobject = self.get_cube().objects[0]
+        geoobject.pack_faces()
+
+        # when
+        geoobject.unpack_faces()
+
+        # then
+        self.assertFalse(geoobject.is_packed())
+        self.assertEqual(len(geoobject.faces), 12)
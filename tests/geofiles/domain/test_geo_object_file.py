@@ -1,3 +1,5 @@
+import copy
+
 from geofiles.domain.geo_object import GeoObject
 from tests.geofiles.base_test import BaseTest
 
@@ -96,6 +98,77 @@ class TestGeoObjectFile(BaseTest):
         self.assertEqual(cube.max_extent, [0.5, 0.5, 0.5])
         self.assertEqual(cube.min_extent, [-0.5, -0.5, -0.5])
 
+    def test_update_extent_incremental(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.update_extent()
+
+        # when
+        clean = cube.is_extent_dirty()
+        cube.append_vertices([[2.0, 0.0, -3.0]])
+        appended = cube.get_vertex_extent()
+        cube.vertices[0][0] = -7.0
+        cube.invalidate_geometry()
+        dirty = cube.is_extent_dirty()
+        cube.update_extent()
+
+        # then
+        self.assertFalse(clean)
+        self.assertEqual(appended, ([-0.5, -0.5, -3.0], [2.0, 0.5, 0.5]))
+        self.assertTrue(dirty)
+        self.assertEqual(cube.min_extent, [-7.0, -0.5, -3.0])
+        self.assertEqual(cube.max_extent, [2.0, 0.5, 0.5])
+
+    def test_update_extent_columnar(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.to_columnar()
+        cube.update_extent()
+
+        # when
+        cube.vertices.append([0.0, 4.0, 0.0])
+        dirty = cube.is_extent_dirty()
+        cube.update_extent()
+        cube.vertices = []
+        empty = cube.get_vertex_extent()
+
+        # then
+        self.assertTrue(dirty)
+        self.assertEqual(cube.max_extent, [0.5, 4.0, 0.5])
+        self.assertEqual(empty, ([], []))
+
+    def test_update_extent_in_place(self) -> None:
+        for columnar in [False, True]:
+            # given
+            cube = self.get_local_cube()
+            if columnar:
+                cube.to_columnar()
+            cube.update_extent()
+
+            # when
+            cube.vertices[0] = [-5.0, -5.0, -5.0]
+            cube.update_extent()
+
+            # then
+            self.assertEqual(cube.min_extent, [-5.0, -5.0, -5.0])
+            self.assertEqual(cube.max_extent, [0.5, 0.5, 0.5])
+
+    def test_get_object_extent(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.vertices.append([5.0, 5.0, 5.0])
+
+        # when
+        first = cube.get_object_extent(cube.objects[0])
+        cube.objects[0].faces = cube.objects[0].faces[:1]
+        second = cube.get_object_extent(cube.objects[0])
+
+        # then
+        self.assertEqual(first, ([-0.5, -0.5, -0.5], [0.5, 0.5, 0.5]))
+        face = [cube.get_vertex(idx) for idx in cube.objects[0].faces[0].indices]
+        self.assertEqual(second[0], [min(axis) for axis in zip(*face)])
+        self.assertEqual(second[1], [max(axis) for axis in zip(*face)])
+
     def test_contains_extent(self) -> None:
         # given
         cube = self.get_local_cube()
@@ -155,3 +228,85 @@ class TestGeoObjectFile(BaseTest):
             "Can not minimize GeoObjectFile containing objects with local transformation."
             in str(context.exception)
         )
+
+    def test_columnar(self) -> None:
+        # given
+        cube = self.get_cube()
+        vertices = cube.vertices
+
+        # when
+        cube.to_columnar()
+
+        # then
+        self.assertTrue(cube.is_columnar())
+        self.assertEqual(cube.get_vertex_array().shape, (8, 3))
+        self.assertEqual(cube.vertices, vertices)
+        self.assertEqual(cube.get_vertex(-1), vertices[-1])
+
+    def test_columnar2(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.to_columnar()
+
+        # when
+        cube.vertices = [[1.0, 2.0, 3.0]]
+
+        # then
+        self.assertTrue(cube.is_columnar())
+        self.assertEqual(cube.get_vertex(1), [1.0, 2.0, 3.0])
+
+    def test_columnar3(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.to_columnar()
+
+        # when
+        cube.update_extent()
+
+        # then
+        self.assertEqual(cube.max_extent, [0.5, 0.5, 0.5])
+        self.assertEqual(cube.min_extent, [-0.5, -0.5, -0.5])
+
+    def test_to_lists(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.to_columnar()
+
+        # when
+        cube.to_lists()
+
+        # then
+        self.assertFalse(cube.is_columnar())
+        self.assertTrue(isinstance(cube.vertices, list))
+        self.assertEqual(cube.vertices, self.get_local_cube().vertices)
+
+    def test_shallow_copy(self) -> None:
+        # given
+        cube = self.get_cube(True)
+
+        # when
+        copied = cube.shallow_copy()
+        copied.origin[0] = 0
+        copied.objects.append(GeoObject())
+
+        # then
+        self.assertIsNot(copied, cube)
+        self.assertIs(copied.vertices, cube.vertices)
+        self.assertIs(copied.objects[0], cube.objects[0])
+        self.assertEqual(len(cube.objects), 1)
+        self.assertNotEqual(cube.origin[0], 0)
+
+    def test_minimize_duplicated_geometry(self) -> None:
+        # given
+        cube = self.get_local_cube()
+        cube.objects.append(copy.deepcopy(cube.objects[0]))
+        cube.objects[1].pack_faces()
+        for face in cube.objects[0].faces:
+            face.indices = face.indices[1:] + face.indices[:1]
+
+        # when
+        cube.minimize()
+
+        # then
+        self.assertEqual(len(cube.objects[0].faces), 12)
+        self.assertTrue(cube.objects[0].is_packed())
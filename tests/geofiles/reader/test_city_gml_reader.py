@@ -25,3 +25,126 @@ class TestCityGmlReader(BaseTest):
             self.assertAlmostEqual(float(vertex[0]), cube.vertices[idx][0])
             self.assertAlmostEqual(float(vertex[1]), cube.vertices[idx][1])
             self.assertAlmostEqual(float(vertex[2]), cube.vertices[idx][2])
+
+    def test_scan(self) -> None:
+        # given
+        reader = CityGmlReader()
+        content = (
+            '<core:CityModel xmlns:core="http://www.opengis.net/citygml/1.0" '
+            'xmlns:gml="http://www.opengis.net/gml"><gml:boundedBy>'
+            '<gml:Envelope srsName="EPSG:4326" srsDimension="3">'
+            "<gml:lowerCorner>14.0 48.0 279.0</gml:lowerCorner>"
+            "<gml:upperCorner>14.1 48.1 280.0</gml:upperCorner>"
+            "</gml:Envelope></gml:boundedBy><core:cityObjectMember><invalid"
+        )
+
+        # when
+        summary = reader.scan(self.get_ressource_file("cube.citygml"))
+        header_only = reader.scan_string(content)
+
+        # then
+        self.assertEqual(summary.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertFalse(summary.contains_extent())
+        self.assertEqual(header_only.crs, "EPSG:4326")
+        self.assertEqual(header_only.min_extent, [14.0, 48.0, 279.0])
+        self.assertEqual(header_only.max_extent, [14.1, 48.1, 280.0])
+
+    def test_scan_leading_elements(self) -> None:
+        # given
+        reader = CityGmlReader()
+        content = (
+            '<core:CityModel xmlns:core="http://www.opengis.net/citygml/1.0" '
+            'xmlns:gml="http://www.opengis.net/gml"><gml:name>model</gml:name>'
+            "<gml:description>test</gml:description><gml:boundedBy>"
+            '<gml:Envelope srsName="EPSG:4326"><gml:lowerCorner>1 2 3</gml:lowerCorner>'
+            "<gml:upperCorner>4 5 6</gml:upperCorner></gml:Envelope></gml:boundedBy>"
+            "<core:cityObjectMember><invalid"
+        )
+
+        # when
+        summary = reader.scan_string(content)
+
+        # then
+        self.assertEqual(summary.crs, "EPSG:4326")
+        self.assertEqual(summary.min_extent, [1.0, 2.0, 3.0])
+        self.assertEqual(summary.max_extent, [4.0, 5.0, 6.0])
+
+    def test_read_streaming(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.citygml")
+        expected = CityGmlReader().read(file)
+        reader = CityGmlReader(streaming=True)
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertEqual(geo_obj_file.crs, expected.crs)
+        self.assertEqual(geo_obj_file.vertices, expected.vertices)
+        self.assertEqual(
+            [o.meta_information for o in geo_obj_file.objects],
+            [o.meta_information for o in expected.objects],
+        )
+        self.assertEqual(
+            [[f.indices for f in o.faces] for o in geo_obj_file.objects],
+            [[f.indices for f in o.faces] for o in expected.objects],
+        )
+
+    def test_iterparse(self) -> None:
+        # given
+        content = (
+            '<core:CityModel xmlns:core="http://www.opengis.net/citygml/1.0" '
+            'xmlns:bldg="http://www.opengis.net/citygml/building/1.0">'
+            "<core:cityObjectMember><bldg:Building><bldg:Building/></bldg:Building>"
+            "</core:cityObjectMember><core:cityObjectMember><bldg:Building/>"
+            "</core:cityObjectMember></core:CityModel>"
+        )
+        children = []
+
+        # when
+        for element in CityGmlReader._iterparse(
+            [content], [".//cityObjectMember/Building"]
+        ):
+            children.append(len(element))
+
+        # then
+        self.assertEqual(children, [1, 0])
+
+    def test_read_surfaces(self) -> None:
+        # given
+        polygon = (
+            "<gml:Polygon><gml:exterior><gml:LinearRing>"
+            "<gml:pos>{0} 0 0</gml:pos><gml:pos>{0} 1 0</gml:pos><gml:pos>{0} 1 1</gml:pos>"
+            "</gml:LinearRing></gml:exterior></gml:Polygon>"
+        )
+        content = (
+            '<core:CityModel xmlns:core="http://www.opengis.net/citygml/1.0" '
+            'xmlns:bldg="http://www.opengis.net/citygml/building/1.0" '
+            'xmlns:gml="http://www.opengis.net/gml"><core:cityObjectMember>'
+            '<bldg:Building gml:id="b1"><bldg:outerBuildingInstallation>'
+            f"<bldg:BuildingInstallation>{polygon.format(1)}<bldg:boundedBy>"
+            f"<bldg:WallSurface>{polygon.format(2)}</bldg:WallSurface>"
+            "</bldg:boundedBy></bldg:BuildingInstallation>"
+            "</bldg:outerBuildingInstallation><bldg:boundedBy>"
+            f"<bldg:RoofSurface>{polygon.format(3)}</bldg:RoofSurface>"
+            "</bldg:boundedBy></bldg:Building></core:cityObjectMember></core:CityModel>"
+        )
+        reader = CityGmlReader()
+
+        # when
+        geo_obj_file = reader.read_string(content)
+
+        # then
+        self.assertEqual(
+            [o.meta_information["type"] for o in geo_obj_file.objects],
+            ["RoofSurface", "WallSurface", "BuildingInstallation", "Building"],
+        )
+        self.assertEqual(geo_obj_file.objects[3].meta_information["id"], "b1")
+        self.assertEqual(
+            [
+                geo_obj_file.vertices[o.faces[0].indices[0] - 1][0]
+                for o in geo_obj_file.objects[:3]
+            ],
+            [3.0, 2.0, 1.0],
+        )
+        self.assertEqual(len(geo_obj_file.vertices), 9)
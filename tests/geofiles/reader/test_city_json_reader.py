@@ -1,4 +1,6 @@
 import json
+import warnings
+from typing import Iterator
 
 from geofiles.domain.file_version import CityJsonVersion
 from geofiles.domain.geo_object_file import GeoObjectFile
@@ -195,3 +197,158 @@ class TestCityJsonReader(BaseTest):
 
             # then
             self.assertTrue("No city objects defined" in str(context.exception))
+
+    def test_scan(self) -> None:
+        # given
+        file = self.get_ressource_file("cube_origin_extent.city.json")
+        reader = CityJsonReader(use_transform_for_origin=True)
+
+        # when
+        summary = reader.scan(file)
+
+        # then
+        self.assertEqual(summary.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertEqual(
+            summary.origin, [14.2842798233032, 48.30284881591775, 279.807006835938]
+        )
+        self.assertEqual(summary.scaling, [1.0, 1.0, 1.0])
+        self.assertTrue(summary.contains_extent())
+        self.assertEqual(summary.num_vertices, 8)
+        self.assertEqual(summary.num_objects, 1)
+
+    def test_iter_objects(self) -> None:
+        # given
+        file = self.get_ressource_file("cube_origin_extent.city.json")
+        reader = CityJsonReader(use_transform_for_origin=True)
+        data = reader.read(file)
+
+        # when
+        files = list(reader.iter_objects(file))
+
+        # then
+        self.assertEqual(len(files), 1)
+        self.assertEqual(files[0].crs, data.crs)
+        self.assertEqual(files[0].origin, data.origin)
+        self.assertEqual(files[0].min_extent, data.min_extent)
+        self.assertEqual(files[0].vertices, data.vertices)
+        self.assertEqual(files[0].objects[0].name, "cube")
+        self.assertEqual(
+            [f.indices for f in files[0].objects[0].faces],
+            [f.indices for f in data.objects[0].faces],
+        )
+
+    def test_iter_objects_chunks(self) -> None:
+        # given
+        content = {
+            "type": "CityJSON",
+            "CityObjects": {
+                "first": {
+                    "type": "Building",
+                    "geometry": [{"type": "MultiSurface", "boundaries": [[[0, 1, 2]]]}],
+                },
+                "second": {
+                    "type": "Building",
+                    "geometry": [{"type": "MultiSurface", "boundaries": [[[3, 1, 2]]]}],
+                },
+            },
+            "vertices": [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]],
+            "metadata": {"referenceSystem": "EPSG:4326"},
+            "transform": {"scale": [1, 1, 1], "translate": [0, 0, 0]},
+        }
+        text = json.dumps(content, indent=2)
+        reader = CityJsonReader()
+
+        # when
+        files = list(
+            reader._iter_objects(text[i : i + 5] for i in range(0, len(text), 5))
+        )
+
+        # then
+        self.assertEqual([f.objects[0].name for f in files], ["first", "second"])
+        self.assertEqual(files[1].crs, "EPSG:4326")
+        self.assertEqual(files[1].vertices, [[1, 0, 0], [0, 1, 0], [1, 1, 0]])
+        self.assertEqual(files[1].objects[0].faces[0].indices, [3, 1, 2])
+
+    def test_scan_chunks(self) -> None:
+        # given
+        content = {
+            "type": "CityJSON",
+            "CityObjects": {
+                "first": {
+                    "type": "Building",
+                    "attributes": {"note": 'brackets ]}[{ and "quotes" \\'},
+                    "geometry": [{"type": "MultiSurface", "boundaries": [[[0, 1, 2]]]}],
+                },
+                "second": {
+                    "type": "Building",
+                    "geometry": [{"type": "MultiSurface", "boundaries": [[[3, 1, 2]]]}],
+                },
+            },
+            "vertices": [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]],
+            "metadata": {"referenceSystem": "EPSG:4326"},
+            "transform": {"scale": [1, 1, 1], "translate": [2, 3, 4]},
+        }
+        text = json.dumps(content, indent=2)
+        reader = CityJsonReader()
+
+        # when
+        summary = reader._scan(text[i : i + 5] for i in range(0, len(text), 5))
+
+        # then
+        self.assertEqual(summary.crs, "EPSG:4326")
+        self.assertEqual(summary.translation, [2, 3, 4])
+        self.assertEqual(summary.scaling, [1, 1, 1])
+        self.assertEqual(summary.num_vertices, 4)
+        self.assertEqual(summary.num_objects, 2)
+
+    def test_iter_objects_without_metadata(self) -> None:
+        # given
+        content = {
+            "type": "CityJSON",
+            "vertices": [[0, 0, 0], [1, 0, 0], [0, 1, 0], [1, 1, 0]],
+            "CityObjects": {
+                "first": {
+                    "type": "Building",
+                    "geometry": [{"type": "MultiSurface", "boundaries": [[[0, 1, 2]]]}],
+                },
+                "second": {
+                    "type": "Building",
+                    "geometry": [{"type": "MultiSurface", "boundaries": [[[3, 1, 2]]]}],
+                },
+            },
+        }
+        text = json.dumps(content, indent=2)
+        chunks = [text[i : i + 5] for i in range(0, len(text), 5)]
+        consumed = []
+
+        def read_chunks() -> Iterator[str]:
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        reader = CityJsonReader(ignore_mandatory_transform=True)
+
+        # when
+        files = reader._iter_objects(read_chunks())
+        first = next(files)
+        consumed_first = len(consumed)
+        rest = list(files)
+
+        # then
+        self.assertEqual(first.objects[0].name, "first")
+        self.assertLess(consumed_first, len(chunks))
+        self.assertEqual([f.objects[0].name for f in rest], ["second"])
+        self.assertEqual(rest[0].vertices, [[1, 0, 0], [0, 1, 0], [1, 1, 0]])
+        self.assertIsNone(rest[0].crs)
+
+    def test_iter_objects_invalid_vertices(self) -> None:
+        # given
+        text = '{"type": "CityJSON", "vertices": [[0, 0, 0], [1, x, 0]], "CityObjects": {}}'
+        reader = CityJsonReader(ignore_mandatory_transform=True)
+
+        # when / then
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with self.assertRaises(Exception) as context:
+                list(reader._iter_objects([text]))
+        self.assertTrue("Invalid number text" in str(context.exception))
@@ -23,3 +23,81 @@ class ColladaReaderTest(BaseTest):
 
         for vertex in geo_obj_file.vertices:
             self.assertTrue(vertex in cube.vertices)
+
+    def test_read_streaming(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.dae")
+        expected = ColladaReader().read(file)
+        reader = ColladaReader(streaming=True)
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertEqual(geo_obj_file.crs, expected.crs)
+        self.assertEqual(geo_obj_file.vertices, expected.vertices)
+        self.assertEqual(len(geo_obj_file.objects), len(expected.objects))
+        for geo_object, expected_object in zip(geo_obj_file.objects, expected.objects):
+            self.assertEqual(geo_object.name, expected_object.name)
+            self.assertEqual(
+                [f.indices for f in geo_object.faces],
+                [f.indices for f in expected_object.faces],
+            )
+
+    def test_read_polylist(self) -> None:
+        # given
+        content = (
+            '<COLLADA xmlns="http://www.collada.org/2005/11/COLLADASchema" crs="EPSG:4326">'
+            '<library_geometries><geometry id="quad"><mesh>'
+            '<source id="positions"><float_array count="17">9 0 0 0 9 1 0 0 9 1 1 0 9 0 1 0 9'
+            '</float_array><technique_common><accessor count="4" offset="1" source="#p" '
+            'stride="4"><param name="X"/><param name="Y"/><param name="Z"/><param/></accessor>'
+            "</technique_common></source>"
+            '<source id="normals"><float_array count="4">0 0 1 9</float_array>'
+            '<technique_common><accessor count="1" source="#n" stride="4"><param name="X"/>'
+            '<param name="Y"/><param name="Z"/><param/></accessor></technique_common></source>'
+            '<vertices id="vertices"><input semantic="POSITION" source="#positions"/>'
+            "</vertices>"
+            '<polylist count="2"><input offset="0" semantic="VERTEX" source="#vertices"/>'
+            '<input offset="1" semantic="NORMAL" source="#normals"/>'
+            "<vcount>4 3</vcount><p>0 0 1 0 2 0 3 0 0 0 1 0 2 0</p></polylist>"
+            '<polygons count="1"><input offset="0" semantic="VERTEX" source="#vertices"/>'
+            "<p>3 2 1</p></polygons>"
+            "</mesh></geometry></library_geometries></COLLADA>"
+        )
+        reader = ColladaReader()
+
+        # when
+        geo_obj_file = reader.read_string(content)
+
+        # then
+        self.assertEqual(geo_obj_file.crs, "EPSG:4326")
+        self.assertEqual(
+            geo_obj_file.vertices, [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0]]
+        )
+        self.assertEqual(geo_obj_file.normals, [[0, 0, 1]])
+        faces = geo_obj_file.objects[0].faces
+        self.assertEqual(
+            [f.indices for f in faces], [[1, 2, 3, 4], [1, 2, 3], [4, 3, 2]]
+        )
+        self.assertEqual(
+            [f.normal_indices for f in faces], [[1, 1, 1, 1], [1, 1, 1], []]
+        )
+
+    def test_read_columnar(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.dae")
+        expected = ColladaReader().read(file)
+        reader = ColladaReader(columnar=True)
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertTrue(geo_obj_file.is_columnar())
+        self.assertTrue(geo_obj_file.objects[0].is_packed())
+        self.assertEqual(geo_obj_file.get_vertex_array().tolist(), expected.vertices)
+        self.assertEqual(
+            [f.indices for f in geo_obj_file.objects[0].faces],
+            [f.indices for f in expected.objects[0].faces],
+        )
@@ -0,0 +1,54 @@
+import numpy as np
+
+from geofiles.reader.coordinate_text import parse_coordinates, parse_numbers
+from tests.geofiles.base_test import BaseTest
+
+
+class TestCoordinateText(BaseTest):
+    def test_parse_tuples(self) -> None:
+        # given
+        text = "1.5,2,3 4,5,6\n7,8,9 1.5,2,3"
+
+        # when
+        coordinates = parse_coordinates(text, drop_closing=True)
+
+        # then
+        self.assertEqual(coordinates.tolist(), [[1.5, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+    def test_parse_dimension(self) -> None:
+        # given
+        text = " 1 2 3 4\n5 6 "
+
+        # when
+        coordinates = parse_coordinates(text, 2, True)
+
+        # then
+        self.assertEqual(coordinates.tolist(), [[1, 2], [3, 4], [5, 6]])
+        self.assertEqual(parse_coordinates("1,2 3,4").shape, (2, 2))
+        self.assertEqual(parse_coordinates(" \n", default_dimension=3).shape, (0, 3))
+        self.assertEqual(parse_coordinates("\n1 2 \n3 4\n").tolist(), [[1, 2], [3, 4]])
+
+    def test_parse_invalid(self) -> None:
+        # when / then
+        self.assertRaises(Exception, parse_coordinates, "1 2 3\n4")
+        self.assertRaises(Exception, parse_coordinates, "1 2 x")
+
+    def test_parse_numbers(self) -> None:
+        # when
+        values = parse_numbers(" 1 2\n3 ", np.int64)
+
+        # then
+        self.assertEqual(values.dtype, np.int64)
+        self.assertEqual(values.tolist(), [1, 2, 3])
+        self.assertEqual(len(parse_numbers(" \n")), 0)
+        with self.assertRaises(Exception):
+            parse_numbers("1 2 x")
+
+    def test_parse_numbers_separator(self) -> None:
+        # when
+        values = parse_numbers(" 1, 2 ,3 ", np.float64, ",")
+
+        # then
+        self.assertEqual(values.tolist(), [1, 2, 3])
+        with self.assertRaises(Exception):
+            parse_numbers("1, 2, x", np.float64, ",")
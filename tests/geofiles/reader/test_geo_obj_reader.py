@@ -254,3 +254,146 @@ class TestGeoObjReader(BaseTest):
         self.assertEqual(geo_obj_file.objects[0].name, "cube")
         self.assertEqual(len(geo_obj_file.objects[0].faces), 12)
         self.assertEqual(len(geo_obj_file.vertices), 8)
+
+    def test_read_columnar(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.geoobj")
+        reader = GeoObjReader(columnar=True)
+        cube = self.get_cube()
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertTrue(geo_obj_file.is_columnar())
+        self.assertTrue(geo_obj_file.objects[0].is_packed())
+        self.assertEqual(geo_obj_file.get_vertex_array().shape, (8, 3))
+        for idx, face in enumerate(geo_obj_file.objects[0].faces):
+            self.assertEqual(face.indices, cube.objects[0].faces[idx].indices)
+
+    def test_read_face_layouts(self) -> None:
+        # given
+        input_str = """
+            o layouts
+            v 0 0 0
+            v 1 0 0
+            v 1 1 0
+            v 0 1 0
+            vn 0 0 1
+            vt 0 0
+            f 1/1/1 2/1/1 3/1/1
+            f 1//1 3//1 4//1
+            f 1/1 2/1 3/1 4/1
+            f -4 -3 -2
+        """
+        reader = GeoObjReader(block_size=2)
+
+        # when
+        geo_obj_file = reader.read_string(input_str)
+
+        # then
+        faces = geo_obj_file.objects[0].faces
+        self.assertEqual(len(faces), 4)
+        self.assertEqual(faces[0].normal_indices, [1, 1, 1])
+        self.assertEqual(faces[0].texture_coordinates, [1, 1, 1])
+        self.assertEqual(faces[1].indices, [1, 3, 4])
+        self.assertEqual(faces[1].normal_indices, [1, 1, 1])
+        self.assertEqual(faces[1].texture_coordinates, [])
+        self.assertEqual(faces[2].indices, [1, 2, 3, 4])
+        self.assertEqual(faces[2].texture_coordinates, [1, 1, 1, 1])
+        self.assertEqual(faces[3].indices, [-4, -3, -2])
+        self.assertEqual(geo_obj_file.normals, [[0.0, 0.0, 1.0]])
+        self.assertEqual(geo_obj_file.texture_coordinates, [[0.0, 0.0]])
+
+    def test_read_mixed_face_layouts(self) -> None:
+        # given
+        input_str = """
+            o mixed
+            v 0 0 0
+            v 1 0 0
+            v 1 1 0
+            v 0 1 0
+            v 0 0 1
+            v 1 0 1
+            vn 0 0 1
+            vt 0 0
+            vt 1 0
+            vt 1 1
+            vt 0 1
+            f 1/1 2/2/1 3
+            f 4/4 5/1 6/2
+        """
+        reader = GeoObjReader()
+
+        # when
+        geo_obj_file = reader.read_string(input_str)
+
+        # then
+        faces = geo_obj_file.objects[0].faces
+        self.assertEqual(faces[0].indices, [1, 2, 3])
+        self.assertEqual(faces[0].texture_coordinates, [1, 2])
+        self.assertEqual(faces[0].normal_indices, [1])
+        self.assertEqual(faces[1].indices, [4, 5, 6])
+        self.assertEqual(faces[1].texture_coordinates, [4, 1, 2])
+
+    def test_scan(self) -> None:
+        # given
+        file = self.get_ressource_file("cube_origin_extent.geoobj")
+        reader = GeoObjReader()
+
+        # when
+        summary = reader.scan(file)
+        header_only = reader.scan_string("crs EPSG:4326\nmf tu inch\nv invalid\n")
+
+        # then
+        self.assertEqual(summary.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertEqual(
+            summary.origin, [14.2842798233032, 48.30284881591775, 279.807006835938]
+        )
+        self.assertEqual(
+            summary.min_extent, [-0.5009357136907019, -0.49944624750201255, -0.5]
+        )
+        self.assertIsNone(summary.num_vertices)
+        self.assertEqual(header_only.meta_information["tu"], "inch")
+
+    def test_iter_objects(self) -> None:
+        # given
+        file = self.get_ressource_file("object_hierarchy.geoobj")
+        reader = GeoObjReader()
+        data = reader.read(file)
+
+        # when
+        files = list(reader.iter_objects(file))
+
+        # then
+        self.assertEqual(len(files), 4)
+        self.assertEqual(
+            [f.objects[0].name for f in files], [o.name for o in data.objects]
+        )
+        self.assertEqual(files[0].vertices, [])
+        for geo_file, geo_object in zip(files[1:], data.objects[1:]):
+            self.assertEqual(geo_file.crs, data.crs)
+            self.assertEqual(geo_file.origin, data.origin)
+            self.assertEqual(len(geo_file.vertices), 8)
+            self.assertEqual(geo_file.objects[0].parent.name, geo_object.parent.name)
+            self.assertEqual(geo_file.objects[0].scaling, geo_object.scaling)
+            for face, expected in zip(geo_file.objects[0].faces, geo_object.faces):
+                self.assertEqual(
+                    [geo_file.vertices[i - 1] for i in face.indices],
+                    [data.vertices[i - 1] for i in expected.indices],
+                )
+
+    def test_iter_objects_columnar(self) -> None:
+        # given
+        content = (
+            "v 0 0 0\nv 1 0 0\nv 0 1 0\no first\nf 1 2 3\nv 1 1 0\no second\nf 2 -1 3\n"
+        )
+        reader = GeoObjReader(columnar=True, block_size=2)
+
+        # when
+        files = list(reader._iter_objects(reader._split_str(content)))
+
+        # then
+        self.assertEqual([f.objects[0].name for f in files], ["first", "second"])
+        self.assertEqual(files[1].vertices.tolist(), [[1, 0, 0], [0, 1, 0], [1, 1, 0]])
+        self.assertEqual(files[1].objects[0].faces.indices.tolist(), [1, 3, 2])
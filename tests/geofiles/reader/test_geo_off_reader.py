@@ -104,3 +104,21 @@ class TestGeoOffReader(BaseTest):
         self.assertEqual(
             geo_obj_file.objects[0].meta_information["type"], "GenericObject"
         )
+
+    def test_scan(self) -> None:
+        # given
+        file = self.get_ressource_file("cube_meta.geooff")
+        reader = GeoOffReader()
+
+        # when
+        summary = reader.scan(file)
+        header_only = reader.scan_string("OFF\n3 1 0\ninvalid\n")
+
+        # then
+        self.assertEqual(summary.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertTrue(summary.is_origin_based())
+        self.assertEqual(summary.meta_information["tu"], "inch")
+        self.assertEqual(summary.num_vertices, 8)
+        self.assertEqual(summary.num_faces, 12)
+        self.assertFalse(header_only.is_geo_referenced())
+        self.assertEqual(header_only.num_vertices, 3)
@@ -1,4 +1,7 @@
+import os
+
 from geofiles.reader.geo_ply_reader import GeoPlyReader
+from geofiles.writer.geo_ply_writer import GeoPlyWriter
 from tests.geofiles.base_test import BaseTest
 
 
@@ -104,3 +107,81 @@ class TestGeoPlyReader(BaseTest):
         self.assertEqual(
             geo_obj_file.objects[0].meta_information["type"], "GenericObject"
         )
+
+    def test_read_binary(self) -> None:
+        for ply_format in ["binary_little_endian", "binary_big_endian"]:
+            # given
+            data = self.get_cube(True)
+            data.meta_information["ru"] = "rad"
+            writer = GeoPlyWriter(ply_format)
+            file = self.get_test_file(writer)
+            writer.write(file, data, append_file_type=False)
+            reader = GeoPlyReader()
+
+            # when
+            try:
+                geo_obj_file = reader.read(file)
+            finally:
+                os.remove(file)
+
+            # then
+            self.assertEqual(geo_obj_file.origin, data.origin)
+            self.assertEqual(geo_obj_file.crs, data.crs)
+            self.assertEqual(geo_obj_file.meta_information["ru"], "rad")
+            self.assertEqual(geo_obj_file.vertices, data.vertices)
+            self.compare_geo_obj_files(data, geo_obj_file)
+
+    def test_read_binary_columnar(self) -> None:
+        # given
+        data = self.get_cube()
+        data.objects[0].faces[0].indices = [1, 2, 3, 4]
+        writer = GeoPlyWriter("binary_little_endian")
+        file = self.get_test_file(writer)
+        writer.write(file, data, append_file_type=False)
+        reader = GeoPlyReader(columnar=True)
+
+        # when
+        with open(file, "rb") as f:
+            geo_obj_file = reader.read_bytes(f.read())
+        os.remove(file)
+
+        # then
+        self.assertTrue(geo_obj_file.is_columnar())
+        self.assertTrue(geo_obj_file.objects[0].is_packed())
+        self.assertEqual(geo_obj_file.objects[0].faces[0].indices, [1, 2, 3, 4])
+        self.compare_geo_obj_files(data, geo_obj_file)
+
+    def test_scan(self) -> None:
+        # given
+        file = self.get_ressource_file("cube_origin_extent.geoply")
+        reader = GeoPlyReader()
+
+        # when
+        summary = reader.scan(file)
+
+        # then
+        self.assertEqual(summary.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertTrue(summary.contains_extent())
+        self.assertEqual(
+            summary.max_extent, [0.5009357136907018, 0.4994462914230726, 0.5]
+        )
+        self.assertEqual(summary.num_vertices, 8)
+        self.assertEqual(summary.num_faces, 12)
+
+    def test_scan_binary(self) -> None:
+        # given
+        data = self.get_cube(True)
+        writer = GeoPlyWriter("binary_little_endian")
+        file = self.get_test_file(writer)
+        writer.write(file, data, append_file_type=False)
+        reader = GeoPlyReader()
+
+        # when
+        try:
+            summary = reader.scan(file)
+        finally:
+            os.remove(file)
+
+        # then
+        self.assertEqual(summary.origin, data.origin)
+        self.assertEqual(summary.num_vertices, 8)
@@ -1,4 +1,7 @@
+import os
+
 from geofiles.reader.geo_stl_reader import GeoStlReader
+from geofiles.writer.geo_stl_writer import GeoStlWriter
 from tests.geofiles.base_test import BaseTest
 
 
@@ -38,3 +41,46 @@ class TestGeoStlReader(BaseTest):
 
         # then
         self.compare_geo_obj_files(geo_obj_file, self.get_local_cube())
+
+    def test_read_binary(self) -> None:
+        for crs in [
+            "urn:ogc:def:crs:OGC:2:84",
+            "urn:ogc:def:crs,crs:EPSG::4326,crs:EPSG::5773,crs:EPSG::4979",
+        ]:
+            # given
+            data = self.get_cube(True)
+            data.crs = crs
+            writer = GeoStlWriter(binary=True)
+            file = self.get_test_file(writer)
+            writer.write(file, data, append_file_type=False)
+            reader = GeoStlReader()
+
+            # when
+            try:
+                geo_obj_file = reader.read(file)
+            finally:
+                os.remove(file)
+                if os.path.exists(file + ".geoheader"):
+                    os.remove(file + ".geoheader")
+
+            # then
+            self.assertEqual(geo_obj_file.crs, crs)
+            self.assertEqual(geo_obj_file.origin, data.origin)
+            self.assertEqual(len(geo_obj_file.vertices), 8)
+            for idx, face in enumerate(geo_obj_file.objects[0].faces):
+                self.assertEqual(face.indices, data.objects[0].faces[idx].indices)
+            for idx, vertex in enumerate(geo_obj_file.vertices):
+                for i in range(3):
+                    self.assertAlmostEqual(vertex[i], data.vertices[idx][i], 6)
+
+    def test_read_ascii_columnar(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.geostl")
+        reader = GeoStlReader(columnar=True)
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertTrue(geo_obj_file.is_columnar())
+        self.compare_with_cube(geo_obj_file)
@@ -22,6 +22,9 @@ class TestGmlReader(BaseTest):
         self.assertEqual(len(geo_obj_file.objects[0].faces), 12)
         self.assertEqual(len(geo_obj_file.vertices), 8)
         self.assertEqual(geo_obj_file.crs, "urn:ogc:def:crs:OGC:2:84")
+        for face in geo_obj_file.objects[0].faces:
+            for idx in face.indices:
+                self.assertTrue(1 <= idx <= 8)
 
         for vertex in geo_obj_file.vertices:
             self.assertTrue(vertex in cube.vertices)
@@ -42,6 +45,8 @@ class TestGmlReader(BaseTest):
         self.assertEqual(len(geo_obj_file.objects[0].faces), 12)
         self.assertEqual(len(geo_obj_file.vertices), 36)
         self.assertEqual(geo_obj_file.crs, "urn:ogc:def:crs:OGC:2:84")
+        indices = [i for f in geo_obj_file.objects[0].faces for i in f.indices]
+        self.assertEqual(indices, list(range(1, 37)))
 
         for vertex in geo_obj_file.vertices:
             self.assertTrue(vertex in cube.vertices)
@@ -68,3 +73,23 @@ class TestGmlReader(BaseTest):
             "Found non uniform CRS definition in Solid elements. Currently not supported in this implementation."
             in str(context.exception)
         )
+
+    def test_read_streaming(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.gml")
+        expected = GmlReader().read(file)
+        reader = GmlReader(streaming=True)
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertEqual(geo_obj_file.crs, expected.crs)
+        self.assertEqual(geo_obj_file.vertices, expected.vertices)
+        self.assertEqual(len(geo_obj_file.objects), len(expected.objects))
+        for geo_object, expected_object in zip(geo_obj_file.objects, expected.objects):
+            self.assertEqual(geo_object.name, expected_object.name)
+            self.assertEqual(
+                [f.indices for f in geo_object.faces],
+                [f.indices for f in expected_object.faces],
+            )
@@ -1,4 +1,8 @@
+from geofiles.domain.face import Face
+from geofiles.domain.geo_object import GeoObject
+from geofiles.domain.geo_object_file import GeoObjectFile
 from geofiles.reader.kml_reader import KmlReader
+from geofiles.writer.kml_writer import KmlWriter
 from tests.geofiles.base_test import BaseTest
 
 
@@ -43,3 +47,58 @@ class TestKmlReader(BaseTest):
 
         for vertex in geo_obj_file.vertices:
             self.assertTrue(vertex in cube.vertices)
+
+    def test_scan(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.kml")
+        reader = KmlReader()
+
+        # when
+        summary = reader.scan(file)
+
+        # then
+        self.assertEqual(summary.crs, "urn:ogc:def:crs:OGC:2:84")
+        self.assertEqual(summary.num_vertices, 36)
+        self.assertEqual(summary.num_faces, 12)
+        self.assertEqual(summary.num_objects, 1)
+
+    def test_read_streaming(self) -> None:
+        # given
+        file = self.get_ressource_file("cube.kml")
+        expected = KmlReader().read(file)
+        reader = KmlReader(streaming=True)
+
+        # when
+        geo_obj_file = reader.read(file)
+
+        # then
+        self.assertEqual(geo_obj_file.crs, expected.crs)
+        self.assertEqual(geo_obj_file.vertices, expected.vertices)
+        self.assertEqual(len(geo_obj_file.objects), len(expected.objects))
+        for geo_object, expected_object in zip(geo_obj_file.objects, expected.objects):
+            self.assertEqual(geo_object.name, expected_object.name)
+            self.assertEqual(
+                [f.indices for f in geo_object.faces],
+                [f.indices for f in expected_object.faces],
+            )
+
+    def test_read_2d(self) -> None:
+        for num_vertices in [4, 6]:
+            # given
+            data = GeoObjectFile()
+            data.crs = "urn:ogc:def:crs:OGC:2:84"
+            data.vertices = [[float(i), float(i % 2)] for i in range(num_vertices)]
+            face = Face()
+            face.indices = list(range(1, num_vertices + 1))
+            geo_object = GeoObject()
+            geo_object.name = "ring"
+            geo_object.faces = [face]
+            data.objects.append(geo_object)
+            content = KmlWriter().write_to_string(data)
+
+            # when
+            geo_obj_file = KmlReader().read_strings(content.splitlines(True))
+
+            # then
+            self.assertEqual(geo_obj_file.vertices, data.vertices)
+            self.assertEqual(geo_obj_file.objects[0].faces[0].indices, face.indices)
@@ -12,6 +12,11 @@ class TestGeoOffWriter(BaseWriterTest):
         data = self.get_cube()
         self._test_write(data, "cube" + self.get_writer().get_file_type())
 
+    def test_write_packed(self) -> None:
+        data = self.get_cube()
+        data.objects[0].pack_faces()
+        self._test_write(data, "cube" + self.get_writer().get_file_type())
+
     def test_write2(self) -> None:
         data = self.get_cube()
         converter = OriginConverter()
@@ -1,6 +1,7 @@
 from geofiles.conversion.origin_converter import OriginConverter
 from geofiles.writer.base import BaseWriter
 from geofiles.writer.geo_ply_writer import GeoPlyWriter
+from tests.geofiles.base_test import BaseTest
 from tests.geofiles.writer.base_writer_test import BaseWriterTest
 
 
@@ -12,6 +13,11 @@ class TestGeoPlyWriter(BaseWriterTest):
         data = self.get_cube()
         self._test_write(data, "cube" + self.get_writer().get_file_type())
 
+    def test_write_packed(self) -> None:
+        data = self.get_cube()
+        data.objects[0].pack_faces()
+        self._test_write(data, "cube" + self.get_writer().get_file_type())
+
     def test_write2(self) -> None:
         data = self.get_cube()
         converter = OriginConverter()
@@ -128,3 +134,35 @@ end_header
 
         # then
         self.assertEqual(string_rep.strip(), compare.strip())
+
+    def test_write_binary(self) -> None:
+        # given
+        data = self.get_cube()
+        writer = GeoPlyWriter("binary_little_endian")
+        file = BaseTest.get_test_file(writer)
+
+        # when
+        writer.write(file, data, append_file_type=False)
+
+        # then
+        with open(file, "rb") as f:
+            content = f.read()
+        header_end = content.index(b"end_header\n") + len(b"end_header\n")
+        self.assertTrue(b"format binary_little_endian 1.0" in content[:header_end])
+        self.assertTrue(b"property double x" in content[:header_end])
+        self.assertEqual(len(content) - header_end, 8 * 3 * 8 + 12 * (1 + 3 * 4))
+
+    def test_write_binary_to_string(self) -> None:
+        # given
+        data = self.get_cube()
+        writer = GeoPlyWriter("binary_big_endian")
+
+        # when
+        with self.assertRaises(Exception) as context:
+            writer.write_to_string(data)
+
+        # then
+        self.assertTrue(
+            "PLY format binary_big_endian requires a binary file"
+            in str(context.exception)
+        )
@@ -1,5 +1,9 @@
 # flake8: noqa
 # pylint: skip-file
+import os
+
+import numpy as np
+
 from geofiles.conversion.origin_converter import OriginConverter
 from geofiles.writer.base import BaseWriter
 from geofiles.writer.geo_stl_writer import GeoStlWriter
@@ -172,3 +176,38 @@ endgeosolid
 
         # then
         self.assertEqual(string_rep.strip(), compare.strip())
+
+    def test_write_binary(self) -> None:
+        # given
+        data = self.get_cube(True)
+        data.objects[0].faces[0].indices = [1, 2, 3, 4]
+        writer = GeoStlWriter(binary=True)
+        file = self.get_test_file(writer)
+
+        # when
+        writer.write(file, data, append_file_type=False)
+
+        # then
+        with open(file, "rb") as f:
+            content = f.read()
+        self.assertTrue(content.startswith(b"geosolid"))
+        self.assertTrue(data.crs.encode("ascii") in content[:80])
+        self.assertEqual(len(content), 84 + 13 * 50)
+        normal = np.frombuffer(content, "<f4", 3, 84)
+        self.assertAlmostEqual(float(np.linalg.norm(normal)), 1.0, 5)
+
+    def test_write_binary_sidecar(self) -> None:
+        # given
+        data = self.get_cube(True)
+        data.crs = "urn:ogc:def:crs,crs:EPSG::4326,crs:EPSG::5773,crs:EPSG::4979"
+        writer = GeoStlWriter(binary=True)
+        file = self.get_test_file(writer)
+
+        # when
+        writer.write(file, data, append_file_type=False)
+
+        # then
+        with open(file + ".geoheader") as f:
+            sidecar = f.read()
+        os.remove(file + ".geoheader")
+        self.assertTrue(sidecar.startswith(f"geosolid {data.crs} 14.2842798233032"))